@@ -0,0 +1,308 @@
+"""
+Jeopardy Game - Image Assets
+----------------------------
+This module loads the game's images. Each image file is decoded once, and the
+copies scaled for different window sizes are kept as PhotoImages in a cache of the
+most recently used sizes, bounded in bytes. Sizes are rounded down to a step, so
+dragging a window edge reuses a few scaled copies instead of making one per pixel.
+
+Scaling for a resize waits until the window has stopped changing size, and runs
+on a worker thread; only the PhotoImage, which Tk must make itself, is created on
+the Tk thread.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from config import (
+    LOGO_IMAGE, BACKGROUND_IMAGE,
+    IMAGE_CACHE_MAX_BYTES, IMAGE_SIZE_STEP, IMAGE_RESIZE_DELAY, IMAGE_POLL_INTERVAL
+)
+
+# The standard images by name
+DEFAULT_IMAGES = {
+    "logo": LOGO_IMAGE,
+    "background": BACKGROUND_IMAGE
+}
+
+BYTES_PER_PIXEL = 4  # Tk photo images and decoded RGBA images both hold four bytes a pixel
+
+
+def fit_size(image_size, width, height):
+    """Scale an image size to fit in a box, keeping its aspect ratio.
+    
+    Args:
+        image_size (tuple): The image's (width, height)
+        width (int): Width of the box
+        height (int): Height of the box
+        
+    Returns:
+        tuple: The scaled (width, height), at least one pixel each
+    """
+    scale = min(width / image_size[0], height / image_size[1])
+    return max(1, round(image_size[0] * scale)), max(1, round(image_size[1] * scale))
+
+
+class AssetManager:
+    """Decoded images and a cache of their scaled PhotoImages."""
+    
+    def __init__(self, root, images=None, max_bytes=IMAGE_CACHE_MAX_BYTES, step=IMAGE_SIZE_STEP,
+                 make_photo=None):
+        """Initialize an AssetManager object.
+        
+        Args:
+            root (tk.Misc): Widget whose event loop delivers the scaled images
+            images (dict, optional): Paths of the images by name. Defaults to DEFAULT_IMAGES.
+            max_bytes (int, optional): Size of the scaled image cache. Defaults to
+                IMAGE_CACHE_MAX_BYTES.
+            step (int, optional): Pixels box sizes are rounded down to. Defaults to IMAGE_SIZE_STEP.
+            make_photo (callable, optional): Makes a PhotoImage from a PIL image. Defaults to
+                ImageTk.PhotoImage.
+        """
+        self.root = root
+        self.paths = dict(DEFAULT_IMAGES if images is None else images)
+        self.max_bytes = max_bytes
+        self.step = step
+        self.make_photo = make_photo
+        self.originals = {}  # Dict of form {name: decoded PIL image, or None if it cannot be read}
+        self.variants = OrderedDict()  # Dict of form {(name, width, height, fill): (PhotoImage, bytes)}
+        self.variant_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.pending = {}  # Dict of form {consumer: [variant key, callback, after id, Future]}
+        self.scaling = {}  # Dict of form {variant key: Future} for images on the worker thread
+        self.executor = None  # Started with the first background scaling
+        self.poll_id = None
+        self._lock = threading.Lock()  # Held while an image file is decoded
+    
+    def get(self, name, width, height, fill=False):
+        """Get an image scaled for a box, scaling it now if it is not cached.
+        
+        Args:
+            name (str): The name of the image
+            width (int): Width of the box
+            height (int): Height of the box
+            fill (bool, optional): Scale to cover the box and crop the overflow, rather
+                than fit inside it. Defaults to False.
+                
+        Returns:
+            PhotoImage: The scaled image, or None if the image cannot be read
+        """
+        key = self._key(name, width, height, fill)
+        photo = self._lookup(key)
+        if photo is None:
+            photo = self._store(key, self._scale(key))
+        return photo
+    
+    def request(self, consumer, name, width, height, callback, fill=False, delay=IMAGE_RESIZE_DELAY):
+        """Ask for an image scaled for a box, as the box is resized.
+        
+        A cached image is passed to the callback at once. Otherwise the image is scaled
+        on the worker thread once the consumer has made no new request for delay
+        milliseconds, and each request replaces the consumer's earlier one.
+        
+        Args:
+            consumer (str): Name of whatever shows the image, such as "welcome logo"
+            name (str): The name of the image
+            width (int): Width of the box
+            height (int): Height of the box
+            callback (callable): Called on the Tk thread with the PhotoImage, or with None
+                if the image cannot be read
+            fill (bool, optional): Scale to cover the box and crop the overflow. Defaults
+                to False.
+            delay (int, optional): Milliseconds to wait for the resizing to stop. Defaults
+                to IMAGE_RESIZE_DELAY.
+        """
+        self.cancel(consumer)
+        key = self._key(name, width, height, fill)
+        photo = self._lookup(key)
+        if photo is not None:
+            callback(photo)
+            return
+            
+        entry = [key, callback, None, None]
+        entry[2] = self.root.after(delay, self._start, consumer, entry)
+        self.pending[consumer] = entry
+    
+    def cancel(self, consumer):
+        """Drop a consumer's waiting request. An image already being scaled is still cached.
+        
+        Args:
+            consumer (str): Name of whatever shows the image
+        """
+        entry = self.pending.pop(consumer, None)
+        if entry is not None and entry[2] is not None:
+            self.root.after_cancel(entry[2])
+    
+    def stats(self):
+        """Get the cache's size and hit counts.
+        
+        Returns:
+            dict: Counts and bytes for the decoded and scaled images
+        """
+        originals = [image for image in self.originals.values() if image is not None]
+        return {
+            "originals": len(originals),
+            "original_bytes": sum(image.width * image.height * BYTES_PER_PIXEL for image in originals),
+            "variants": len(self.variants),
+            "variant_bytes": self.variant_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+    
+    def _key(self, name, width, height, fill):
+        """Get the cache key for an image scaled for a box, rounding the box down to the step.
+        
+        Args:
+            name (str): The name of the image
+            width (int): Width of the box
+            height (int): Height of the box
+            fill (bool): Whether the image covers the box
+            
+        Returns:
+            tuple: The key
+        """
+        width = max(self.step, int(width) // self.step * self.step)
+        height = max(self.step, int(height) // self.step * self.step)
+        return (name, width, height, fill)
+    
+    def _lookup(self, key):
+        """Get a cached scaled image, marking it as the most recently used.
+        
+        Args:
+            key (tuple): The cache key
+            
+        Returns:
+            PhotoImage: The scaled image, or None if it is not cached
+        """
+        variant = self.variants.get(key)
+        if variant is None:
+            return None
+        self.variants.move_to_end(key)
+        self.hits += 1
+        return variant[0]
+    
+    def _original(self, name):
+        """Decode an image file once (runs on either thread).
+        
+        Args:
+            name (str): The name of the image
+            
+        Returns:
+            PIL.Image.Image: The decoded image, or None if it cannot be read
+        """
+        with self._lock:
+            if name in self.originals:
+                return self.originals[name]
+                
+            image = None
+            path = self.paths.get(name)
+            if path and os.path.exists(path):
+                try:
+                    from PIL import Image
+                    
+                    with Image.open(path) as f:
+                        image = f.convert("RGBA")
+                except Exception:
+                    image = None  # Missing or unreadable images are not shown
+            self.originals[name] = image
+            return image
+    
+    def _scale(self, key):
+        """Scale an image for a box (runs on either thread).
+        
+        Args:
+            key (tuple): The cache key
+            
+        Returns:
+            PIL.Image.Image: The scaled image, or None if the image cannot be read
+        """
+        name, width, height, fill = key
+        original = self._original(name)
+        if original is None:
+            return None
+            
+        from PIL import Image, ImageOps
+        
+        if fill:
+            return ImageOps.fit(original, (width, height), Image.LANCZOS)
+        return original.resize(fit_size(original.size, width, height), Image.LANCZOS)
+    
+    def _store(self, key, image):
+        """Make a PhotoImage from a scaled image and cache it (runs on the Tk thread).
+        
+        Args:
+            key (tuple): The cache key
+            image (PIL.Image.Image): The scaled image, or None
+            
+        Returns:
+            PhotoImage: The cached image, or None if there was no image
+        """
+        self.misses += 1
+        if image is None:
+            return None
+            
+        if self.make_photo is None:
+            from PIL import ImageTk
+            
+            photo = ImageTk.PhotoImage(image, master=self.root)
+        else:
+            photo = self.make_photo(image)
+            
+        size = image.width * image.height * BYTES_PER_PIXEL
+        self.variants[key] = (photo, size)
+        self.variant_bytes += size
+        
+        # Drop the least recently used images, keeping at least the one just made
+        while self.variant_bytes > self.max_bytes and len(self.variants) > 1:
+            _, (_, dropped) = self.variants.popitem(last=False)
+            self.variant_bytes -= dropped
+        return photo
+    
+    def _start(self, consumer, entry):
+        """Scale a requested image on the worker thread once the resizing has stopped.
+        
+        Args:
+            consumer (str): Name of whatever shows the image
+            entry (list): The consumer's request
+        """
+        entry[2] = None
+        photo = self._lookup(entry[0])
+        if photo is not None:
+            del self.pending[consumer]
+            entry[1](photo)
+            return
+            
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-scaler")
+        if entry[0] not in self.scaling:
+            self.scaling[entry[0]] = self.executor.submit(self._scale, entry[0])
+        entry[3] = self.scaling[entry[0]]
+        if self.poll_id is None:
+            self.poll_id = self.root.after(IMAGE_POLL_INTERVAL, self._poll)
+    
+    def _poll(self):
+        """Cache the images the worker thread has scaled and hand them to their consumers."""
+        self.poll_id = None
+        scaled = {}
+        for key, future in list(self.scaling.items()):
+            if not future.done():
+                continue
+                
+            del self.scaling[key]
+            try:
+                image = future.result()
+            except Exception:
+                image = None
+            scaled[key] = self._store(key, image)
+            
+        for consumer, entry in list(self.pending.items()):
+            if entry[3] is not None and entry[0] in scaled:
+                del self.pending[consumer]
+                entry[1](scaled[entry[0]])
+                
+        if self.scaling:
+            self.poll_id = self.root.after(IMAGE_POLL_INTERVAL, self._poll)
\ No newline at end of file
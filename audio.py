@@ -0,0 +1,196 @@
+"""
+Jeopardy Game - Audio
+---------------------
+This module plays the game's sound effects. Sounds are decoded once, on a
+background thread started with the UI, and kept as pygame Sound objects, so a
+sound starts without reading or decoding its file. Each sound plays on its own
+reserved mixer channel, so the Daily Double sting no longer cuts off the timer
+music.
+
+A question pack can replace any of the standard sounds with files of the same name
+in a "sounds" directory next to its workbook.
+
+pygame is imported, and the mixer initialized, on the background thread, so
+startup never waits for the audio device.
+"""
+
+import os
+import threading
+
+from config import TIMER_SOUND, DAILY_DOUBLE_SOUND, FINAL_JEOPARDY_SOUND, PACK_SOUND_DIR
+
+# The standard sounds by name; each gets its own mixer channel, in this order
+DEFAULT_SOUNDS = {
+    "timer": TIMER_SOUND,
+    "daily_double": DAILY_DOUBLE_SOUND,
+    "final_jeopardy": FINAL_JEOPARDY_SOUND
+}
+
+
+def pack_sounds(file_path, sounds=DEFAULT_SOUNDS):
+    """Find the sounds a question pack provides in place of the standard ones.
+    
+    Args:
+        file_path (str): Path to the pack's workbook
+        sounds (dict, optional): The standard sound paths by name. Defaults to DEFAULT_SOUNDS.
+        
+    Returns:
+        dict: The pack's sound paths by name, for the sounds it replaces
+    """
+    directory = os.path.join(os.path.dirname(os.path.abspath(file_path)), PACK_SOUND_DIR)
+    found = {}
+    for name, path in sounds.items():
+        candidate = os.path.join(directory, os.path.basename(path))
+        if os.path.isfile(candidate):
+            found[name] = candidate
+    return found
+
+
+class SoundBank:
+    """Decoded sound effects, each played on a mixer channel of its own."""
+    
+    def __init__(self, sounds=None):
+        """Initialize a SoundBank object.
+        
+        Args:
+            sounds (dict, optional): Paths of the sounds by name. Defaults to DEFAULT_SOUNDS.
+        """
+        self.defaults = dict(DEFAULT_SOUNDS if sounds is None else sounds)
+        self.paths = dict(self.defaults)
+        self.sounds = {}  # Dict of form {name: pygame Sound, or None if it cannot be played}
+        self.channels = {}  # Dict of form {name: pygame Channel}
+        self.mixer = None  # pygame.mixer once initialized, or False if there is no audio
+        self._lock = threading.Lock()  # Held while the mixer is initialized or a sound decoded
+    
+    def preload(self, names=None):
+        """Initialize the mixer and decode sounds on a background thread.
+        
+        Args:
+            names (list, optional): Names of the sounds to decode. Defaults to all of them.
+            
+        Returns:
+            threading.Thread: The thread doing the work
+        """
+        names = list(self.paths) if names is None else list(names)
+        thread = threading.Thread(target=self._load, args=(names,), name="sound-loader", daemon=True)
+        thread.start()
+        return thread
+    
+    def use_pack(self, file_path):
+        """Use a question pack's own sounds where it has them, and the standard ones elsewhere.
+        
+        The sounds that change are decoded again in the background.
+        
+        Args:
+            file_path (str): Path to the pack's workbook
+            
+        Returns:
+            threading.Thread: The thread decoding the changed sounds, or None if none changed
+        """
+        paths = dict(self.defaults, **pack_sounds(file_path, self.defaults))
+        changed = [name for name, path in paths.items() if self.paths.get(name) != path]
+        if not changed:
+            return None
+            
+        with self._lock:
+            self.paths = paths
+            for name in changed:
+                self.sounds.pop(name, None)
+        return self.preload(changed)
+    
+    def play(self, name):
+        """Play a sound on its channel, restarting it if it is already playing.
+        
+        A sound that has not been decoded yet is decoded first.
+        
+        Args:
+            name (str): The name of the sound
+            
+        Returns:
+            bool: True if the sound started
+        """
+        sound = self.sounds[name] if name in self.sounds else self._decode(name)
+        if sound is None:
+            return False
+            
+        try:
+            self._channel(name).play(sound)
+            return True
+        except Exception:
+            return False
+    
+    def stop(self, name=None):
+        """Stop a sound, or every sound.
+        
+        Args:
+            name (str, optional): The name of the sound. Defaults to None, for all sounds.
+        """
+        for channel_name, channel in list(self.channels.items()):
+            if name is None or channel_name == name:
+                channel.stop()
+    
+    def _load(self, names):
+        """Decode sounds (runs on the loader thread).
+        
+        Args:
+            names (list): Names of the sounds to decode
+        """
+        for name in names:
+            self._decode(name)
+    
+    def _decode(self, name):
+        """Decode a sound once, initializing the mixer first if needed.
+        
+        Args:
+            name (str): The name of the sound
+            
+        Returns:
+            pygame.mixer.Sound: The sound, or None if it cannot be played
+        """
+        with self._lock:
+            if name in self.sounds:
+                return self.sounds[name]
+                
+            sound = None
+            path = self.paths.get(name)
+            if self._init_mixer() and path and os.path.exists(path):
+                try:
+                    sound = self.mixer.Sound(path)
+                except Exception:
+                    sound = None  # Unreadable sound files are skipped, as before
+            self.sounds[name] = sound
+            return sound
+    
+    def _init_mixer(self):
+        """Import pygame and initialize the mixer, once. Called with the lock held.
+        
+        Returns:
+            bool: True if sounds can be played
+        """
+        if self.mixer is None:
+            try:
+                import pygame
+                
+                pygame.mixer.init()
+                # Keep the sounds' channels out of reach of any other playback
+                pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), len(self.defaults)))
+                pygame.mixer.set_reserved(len(self.defaults))
+                self.mixer = pygame.mixer
+            except Exception:
+                self.mixer = False
+        return bool(self.mixer)
+    
+    def _channel(self, name):
+        """Get the channel a sound plays on.
+        
+        Args:
+            name (str): The name of the sound
+            
+        Returns:
+            pygame.mixer.Channel: The channel
+        """
+        channel = self.channels.get(name)
+        if channel is None:
+            channel = self.mixer.Channel(list(self.defaults).index(name))
+            self.channels[name] = channel
+        return channel
\ No newline at end of file
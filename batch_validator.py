@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Batch Validator
+-------------------------------
+This module validates whole directories of question files without a GUI. Workbooks
+are spread across a pool of worker processes and every problem found is written
+to a single JSON report.
+
+Usage:
+    python batch_validator.py packs/ --output report.json
+    python batch_validator.py packs/ more_packs/pack.xlsx --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from jeopardy_core import PackParser, find_workbooks
+
+# Each worker process keeps one parser for all of the files it validates
+_worker_parser = None
+
+
+def validate_workbook(file_path):
+    """Validate one workbook in a worker process.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        dict: The file path, its issues and the time taken in seconds
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = PackParser()
+        
+    start = time.perf_counter()
+    issues = _worker_parser.validate_file(file_path)
+    return {
+        "path": file_path,
+        "valid": not any(issue["severity"] == "error" for issue in issues),
+        "issues": issues,
+        "seconds": round(time.perf_counter() - start, 4)
+    }
+
+
+def validate_paths(paths, workers=None, chunksize=None):
+    """Validate every workbook found in the given files and directories.
+    
+    Args:
+        paths (list): Files and directories to validate
+        workers (int, optional): Number of worker processes. Defaults to one per CPU.
+        chunksize (int, optional): Files handed to a worker at a time. Defaults to a size
+            that gives each worker about four chunks.
+            
+    Returns:
+        dict: The report, with per-file results in path order and a summary
+    """
+    file_paths = find_workbooks(paths)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        
+    start = time.perf_counter()
+    if workers == 1 or len(file_paths) <= 1:
+        results = [validate_workbook(file_path) for file_path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_workbook, file_paths, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+    
+    errors = sum(1 for result in results for issue in result["issues"] if issue["severity"] == "error")
+    warnings = sum(1 for result in results for issue in result["issues"] if issue["severity"] == "warning")
+    
+    return {
+        "files": results,
+        "summary": {
+            "files": len(results),
+            "invalid_files": sum(1 for result in results if not result["valid"]),
+            "errors": errors,
+            "warnings": warnings,
+            "workers": workers,
+            "seconds": round(elapsed, 3)
+        }
+    }
+
+
+def main():
+    """Command-line interface for the batch validator."""
+    parser = argparse.ArgumentParser(description="Validate Jeopardy question files in bulk.")
+    parser.add_argument("paths", nargs="+", help=".xlsx files or directories of them")
+    parser.add_argument("--output", "-o", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: one per CPU)")
+    parser.add_argument("--chunksize", type=int, help="files handed to a worker at a time")
+    
+    args = parser.parse_args()
+    report = validate_paths(args.paths, args.workers, args.chunksize)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        summary = report["summary"]
+        print(f"Validated {summary['files']} file(s) in {summary['seconds']:.2f} s: "
+              f"{summary['invalid_files']} invalid, {summary['errors']} error(s), "
+              f"{summary['warnings']} warning(s).")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        
+    sys.exit(1 if report["summary"]["invalid_files"] else 0)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Image Asset Benchmark
+-------------------------------------
+Compares the asset manager against decoding and scaling the images for every
+resize event, while a window edge is dragged. Reports how long the event loop is
+blocked per resize event, how many times the images are scaled, and the memory the
+scaled image cache holds against its bound as the window visits many sizes.
+
+The images are generated PNG files at the given size. Scaled images are kept as PIL
+images in place of PhotoImages, which hold the same four bytes a pixel, so no
+display is needed. Each memory measurement runs in a fresh process so memory gains
+are not hidden by memory freed from an earlier run.
+
+Usage:
+    python benchmarks/bench_assets.py --events 200 --sizes 60 --max-mb 48
+"""
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw, ImageOps
+
+from assets import AssetManager, fit_size
+
+
+def resident_bytes():
+    """Get the memory the process has resident, where the platform reports it.
+    
+    Returns:
+        int: Resident set size in bytes, or None if unknown
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def write_image(path, width, height, seed):
+    """Write a PNG of random rectangles, which compresses like artwork rather than a flat color.
+    
+    Args:
+        path (str): Path of the file
+        width (int): Width of the image
+        height (int): Height of the image
+        seed (int): Seed for the rectangles
+    """
+    rng = random.Random(seed)
+    image = Image.new("RGBA", (width, height), (6, 12, 233, 255))
+    draw = ImageDraw.Draw(image)
+    for _ in range(200):
+        x, y = rng.randrange(width), rng.randrange(height)
+        draw.rectangle((x, y, x + rng.randrange(200), y + rng.randrange(200)),
+                       fill=tuple(rng.randrange(256) for _ in range(3)) + (255,))
+    image.save(path)
+
+
+def drag_sizes(events, rng):
+    """Make the window sizes seen while a window edge is dragged.
+    
+    Args:
+        events (int): Number of resize events
+        rng (Random): Source of the step between events
+        
+    Returns:
+        list: (width, height) of each event
+    """
+    width, height = 1280, 800
+    sizes = []
+    for _ in range(events):
+        width = max(640, min(1920, width + rng.randint(-12, 4)))
+        height = max(480, min(1080, height + rng.randint(-6, 2)))
+        sizes.append((width, height))
+    return sizes
+
+
+def legacy_resize(paths, width, height):
+    """Decode and scale both images for one resize event, as without the asset manager.
+    
+    Args:
+        paths (dict): Paths of the images by name
+        width (int): Width of the window
+        height (int): Height of the window
+    """
+    with Image.open(paths["background"]) as f:
+        ImageOps.fit(f.convert("RGBA"), (width, height), Image.LANCZOS)
+    with Image.open(paths["logo"]) as f:
+        logo = f.convert("RGBA")
+        logo.resize(fit_size(logo.size, width // 2, height // 4), Image.LANCZOS)
+
+
+def run_drag(root, assets, sizes, interval):
+    """Feed resize events to the asset manager and time the event loop's work.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        assets (AssetManager): The asset manager
+        sizes (list): (width, height) of each event
+        interval (float): Seconds between events
+        
+    Returns:
+        tuple: Seconds each event's handler took, the longest poll, and the number of
+            images delivered
+    """
+    delivered = []
+    polls = []
+    poll = assets._poll
+    
+    def timed_poll():
+        start = time.perf_counter()
+        poll()
+        polls.append(time.perf_counter() - start)
+        
+    assets._poll = timed_poll
+    handlers = []
+    for width, height in sizes:
+        start = time.perf_counter()
+        assets.request("background", "background", width, height, delivered.append, fill=True)
+        assets.request("logo", "logo", width // 2, height // 4, delivered.append)
+        handlers.append(time.perf_counter() - start)
+        wake = time.monotonic() + interval
+        while time.monotonic() < wake:
+            root.update()
+            time.sleep(0.0005)
+            
+    # Let the last scaling finish
+    end = time.monotonic() + 2
+    while (assets.pending or assets.scaling) and time.monotonic() < end:
+        root.update()
+        time.sleep(0.0005)
+    return handlers, max(polls) if polls else 0.0, len(delivered)
+
+
+def cache_memory(paths, sizes, max_bytes):
+    """Scale the images for many window sizes and measure the memory held.
+    
+    Args:
+        paths (dict): Paths of the images by name
+        sizes (list): (width, height) of each window size
+        max_bytes (int): Size of the scaled image cache
+        
+    Returns:
+        tuple: The cache's stats and the resident memory gained, or None if unknown
+    """
+    gc.collect()
+    before = resident_bytes()
+    assets = AssetManager(tk.Tcl(), paths, max_bytes=max_bytes, make_photo=lambda image: image)
+    for width, height in sizes:
+        assets.get("background", width, height, fill=True)
+        assets.get("logo", width // 2, height // 4)
+    gc.collect()
+    after = resident_bytes()
+    return assets.stats(), after - before if before is not None and after is not None else None
+
+
+def main():
+    """Run the image asset benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200, help="resize events in the drag")
+    parser.add_argument("--interval", type=float, default=16, help="milliseconds between resize events")
+    parser.add_argument("--sizes", type=int, default=60, help="window sizes visited for the memory bound")
+    parser.add_argument("--max-mb", type=float, default=48, help="size of the scaled image cache")
+    parser.add_argument("--image-size", default="3840x2160", help="size of the background image")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    image_width, image_height = (int(part) for part in args.image_size.lower().split("x"))
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {
+            "background": os.path.join(directory, "background.png"),
+            "logo": os.path.join(directory, "logo.png")
+        }
+        write_image(paths["background"], image_width, image_height, 1)
+        write_image(paths["logo"], image_width // 3, image_height // 6, 2)
+        sizes = drag_sizes(args.events, rng)
+        
+        legacy = []
+        for width, height in sizes[:20]:
+            start = time.perf_counter()
+            legacy_resize(paths, width, height)
+            legacy.append(time.perf_counter() - start)
+            
+        root = tk.Tcl()
+        assets = AssetManager(root, paths, make_photo=lambda image: image)
+        handlers, longest_poll, delivered = run_drag(root, assets, sizes, args.interval / 1000)
+        stats = assets.stats()
+        print(f"drag of {args.events} resize events, {args.image_size} background:")
+        print(f"  legacy     {statistics.median(legacy) * 1000:8.1f} ms blocked per event, "
+              f"{args.events * 2} scales")
+        print(f"  manager    {statistics.median(handlers) * 1e6:8.1f} us blocked per event "
+              f"(max {max(handlers) * 1e6:.0f} us), longest hand-over {longest_poll * 1000:.1f} ms, "
+              f"{stats['misses']} scales, {delivered} images shown")
+              
+        mb = 1024 * 1024
+        visits = [(rng.randint(640, 2560), rng.randint(480, 1440)) for _ in range(args.sizes)]
+        print(f"memory over {args.sizes} window sizes (decoded originals "
+              f"{stats['original_bytes'] / mb:.1f}MB are held once in both):")
+        for label, max_bytes in (("unbounded", float("inf")), ("bounded", args.max_mb * mb)):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                cache, gained = executor.submit(cache_memory, paths, visits, max_bytes).result()
+            bound = f"{max_bytes / mb:.0f}MB" if max_bytes != float("inf") else "none"
+            rss = f"{gained / mb:.1f}MB" if gained is not None else "n/a"
+            print(f"  {label:<10} bound {bound:>6}, {cache['variants']:4} cached, "
+                  f"{cache['variant_bytes'] / mb:7.1f}MB scaled, resident gain {rss}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
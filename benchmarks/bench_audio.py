@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Audio Benchmark
+-------------------------------
+Compares the sound bank, which decodes every sound once and plays it on its own
+mixer channel, against the old playback, which loaded the sound file into the
+music stream on every play. Reports how long triggering a sound blocks the caller,
+how long starting the UI waits for the sound bank, and whether the timer music is
+still playing after the Daily Double sting starts.
+
+The sounds are generated WAV files of the given length. SDL's dummy audio driver is
+used unless SDL_AUDIODRIVER is set, so no audio device is needed.
+
+Usage:
+    python benchmarks/bench_audio.py --seconds 10 --plays 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from audio import SoundBank, DEFAULT_SOUNDS
+
+
+def write_sound(path, seconds, rate=44100):
+    """Write a stereo 16-bit WAV file of a square wave.
+    
+    Args:
+        path (str): Path of the file
+        seconds (float): Length of the sound
+        rate (int, optional): Samples per second. Defaults to 44100.
+    """
+    period = rate // 440
+    frame_high = (8000).to_bytes(2, "little", signed=True) * 2
+    frame_low = (-8000).to_bytes(2, "little", signed=True) * 2
+    cycle = frame_high * (period // 2) + frame_low * (period - period // 2)
+    frames = cycle * (int(rate * seconds) // period)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(frames)
+
+
+def legacy_play(mixer, sound_file):
+    """Play a sound the way the UI did before the sound bank.
+    
+    Args:
+        mixer (module): pygame.mixer
+        sound_file (str): Path to the sound file
+    """
+    if os.path.exists(sound_file):
+        mixer.music.load(sound_file)
+        mixer.music.play()
+
+
+def time_plays(play, plays):
+    """Time how long triggering a sound blocks the caller.
+    
+    Args:
+        play (callable): Starts the sound
+        plays (int): Number of timed plays
+        
+    Returns:
+        list: Seconds each play took
+    """
+    times = []
+    for _ in range(plays):
+        start = time.perf_counter()
+        play()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    """Run the audio benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10, help="length of each generated sound")
+    parser.add_argument("--plays", type=int, default=50, help="timed plays per method")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for name, default_path in DEFAULT_SOUNDS.items():
+            paths[name] = os.path.join(directory, os.path.basename(default_path))
+            write_sound(paths[name], args.seconds)
+            
+        sounds = SoundBank(paths)
+        start = time.perf_counter()
+        loader = sounds.preload()
+        returned = time.perf_counter() - start
+        loader.join()
+        loaded = time.perf_counter() - start
+        if not sounds.mixer:
+            print("No audio driver available; the sounds cannot be played.")
+            return
+            
+        size = os.path.getsize(paths["daily_double"]) / 1024
+        print(f"{len(paths)} sounds of {args.seconds:.0f} s ({size:.0f}KB each)")
+        print(f"startup           preload returned in {returned * 1000:.2f} ms, "
+              f"sounds decoded in the background in {loaded * 1000:.1f} ms")
+              
+        legacy = time_plays(lambda: legacy_play(sounds.mixer, paths["daily_double"]), args.plays)
+        sounds.mixer.music.stop()
+        cached = time_plays(lambda: sounds.play("daily_double"), args.plays)
+        print(f"trigger latency   legacy median {statistics.median(legacy) * 1000:8.3f} ms  "
+              f"max {max(legacy) * 1000:8.3f} ms")
+        print(f"                  sound bank median {statistics.median(cached) * 1000:5.3f} ms  "
+              f"max {max(cached) * 1000:8.3f} ms")
+              
+        # The music stream plays one file at a time, so the old sting always replaced the timer
+        sounds.play("timer")
+        sounds.play("daily_double")
+        timer_playing = sounds.channels["timer"].get_busy() and sounds.channels["daily_double"].get_busy()
+        sounds.stop()
+        print(f"timer then sting  legacy keeps the timer playing: False; "
+              f"sound bank keeps the timer playing: {timer_playing}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Batch Validation Benchmark
+------------------------------------------
+Validates a directory of synthetic packs with increasing numbers of workers.
+
+Usage:
+    python benchmarks/bench_batch_validator.py --packs 200 --categories 30
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_validator import validate_paths
+from synthetic import write_workbook
+
+
+def main():
+    """Run the batch validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packs", type=int, default=200, help="number of workbooks to validate")
+    parser.add_argument("--categories", type=int, default=30, help="categories per round")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="largest pool to try")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Copies of one workbook are as expensive to validate as distinct ones
+        source = write_workbook(os.path.join(temp_dir, "source.xlsx"), args.categories)
+        pack_dir = os.path.join(temp_dir, "packs")
+        os.makedirs(pack_dir)
+        for index in range(args.packs):
+            shutil.copyfile(source, os.path.join(pack_dir, f"pack_{index:04d}.xlsx"))
+            
+        worker_counts = sorted({1, 2, 4, 8, args.max_workers} & set(range(1, args.max_workers + 1)))
+        baseline = None
+        print(f"{args.packs} packs, {args.categories} categories per round")
+        for workers in worker_counts:
+            summary = validate_paths([pack_dir], workers=workers)["summary"]
+            baseline = baseline or summary["seconds"]
+            print(f"{workers:3d} worker(s): {summary['seconds']:7.2f} s  "
+                  f"{summary['files'] / summary['seconds']:8.1f} files/s  "
+                  f"speedup {baseline / summary['seconds']:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
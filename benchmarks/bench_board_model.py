@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Board Model Benchmark
+-------------------------------------
+Compares the memory use and lookup speed of the slotted, grid-backed board model
+with the previous dict-of-dicts model (reproduced below as LegacyQuestion and
+LegacyRound).
+
+Usage:
+    python benchmarks/bench_board_model.py --boards 1000 --categories 6
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import JEOPARDY_VALUES
+from jeopardy_core import Question, JeopardyRound
+
+
+class LegacyQuestion:
+    """The previous Question class, with a per-instance __dict__."""
+    
+    def __init__(self, category, value, text, answer, is_daily_double=False):
+        self.category = category
+        self.value = value
+        self.text = text
+        self.answer = answer
+        self.is_daily_double = is_daily_double
+        self.played = False
+
+
+class LegacyRound:
+    """The previous JeopardyRound storage, a dict of dicts keyed by category and value."""
+    
+    def __init__(self, name):
+        self.name = name
+        self.categories = []
+        self.questions = {}
+        self.completed = False
+    
+    def add_question(self, question):
+        if question.category not in self.categories:
+            self.categories.append(question.category)
+            self.questions[question.category] = {}
+        self.questions[question.category][question.value] = question
+    
+    def get_question(self, category, value):
+        return self.questions.get(category, {}).get(value)
+
+
+def build_boards(question_class, round_class, num_boards, num_categories):
+    """Build boards the way the game does, one question at a time.
+    
+    Category names are built per question, as they are when read from a workbook.
+    
+    Args:
+        question_class (type): The question class to use
+        round_class (type): The round class to use
+        num_boards (int): Number of boards to build
+        num_categories (int): Number of categories per board
+        
+    Returns:
+        list: The built rounds
+    """
+    boards = []
+    for board_index in range(num_boards):
+        round_obj = round_class("Jeopardy")
+        for category_index in range(num_categories):
+            for value in JEOPARDY_VALUES:
+                category = "".join(["Category ", str(board_index % 50), "-", str(category_index)])
+                round_obj.add_question(question_class(category, value, f"Clue {board_index}", f"What is {value}?"))
+        boards.append(round_obj)
+    return boards
+
+
+def measure(question_class, round_class, num_boards, num_categories):
+    """Measure the memory used by a set of boards and the time to look up every clue.
+    
+    Args:
+        question_class (type): The question class to use
+        round_class (type): The round class to use
+        num_boards (int): Number of boards to build
+        num_categories (int): Number of categories per board
+        
+    Returns:
+        tuple: (bytes allocated, seconds per lookup)
+    """
+    gc.collect()
+    tracemalloc.start()
+    boards = build_boards(question_class, round_class, num_boards, num_categories)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    lookups = [(board, category, value) for board in boards for category in board.categories for value in JEOPARDY_VALUES]
+    start = time.perf_counter()
+    for board, category, value in lookups:
+        board.get_question(category, value)
+    elapsed = time.perf_counter() - start
+    
+    return allocated, elapsed / len(lookups)
+
+
+def main():
+    """Run the board model benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boards", type=int, default=1000, help="number of boards held in memory")
+    parser.add_argument("--categories", type=int, default=6, help="categories per board")
+    args = parser.parse_args()
+    
+    legacy_bytes, legacy_lookup = measure(LegacyQuestion, LegacyRound, args.boards, args.categories)
+    compact_bytes, compact_lookup = measure(Question, JeopardyRound, args.boards, args.categories)
+    
+    print(f"{args.boards} boards of {args.categories} x {len(JEOPARDY_VALUES)}")
+    print(f"{'model':10} {'memory':>12} {'lookup':>12}")
+    print(f"{'legacy':10} {legacy_bytes / 1024 / 1024:9.2f} MiB {legacy_lookup * 1e9:9.0f} ns")
+    print(f"{'compact':10} {compact_bytes / 1024 / 1024:9.2f} MiB {compact_lookup * 1e9:9.0f} ns")
+    print(f"memory saved: {1 - compact_bytes / legacy_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Board Renderer Benchmark
+----------------------------------------
+Compares the widget board, with a Tk button per tile, against the canvas board,
+drawn on a single canvas, at increasing board sizes. Reports the number of Tk
+widgets and canvas items, the time to build and show the board, to redraw one tile
+and to lay the board out after a resize, and the memory the process gained while
+building it.
+
+Each measurement runs in a fresh process so memory gains are not hidden by memory
+freed from an earlier board. A display is needed.
+
+Usage:
+    python benchmarks/bench_board_renderers.py --sizes 6x5 12x10 20x20 30x30
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ROUND_NAMES
+from jeopardy_core import build_rounds, default_values
+from synthetic import make_game_data
+
+
+def resident_bytes():
+    """Get the memory the process has resident, where the platform reports it.
+    
+    Returns:
+        int: Resident set size in bytes, or None if unknown
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants.
+    
+    Args:
+        widget (tk.Widget): The widget
+        
+    Returns:
+        int: The number of widgets
+    """
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def measure(renderer, num_categories, num_rows, repeats):
+    """Build one board with one renderer and time its updates.
+    
+    Args:
+        renderer (str): "widgets" or "canvas"
+        num_categories (int): Number of categories
+        num_rows (int): Number of questions per category
+        repeats (int): Number of timed builds and resizes
+        
+    Returns:
+        dict: The measurements, or None if there is no display
+    """
+    import tkinter as tk
+    from board_view import BOARD_VIEWS
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    try:
+        root.geometry("1280x800")
+        root.update()
+        round_values = tuple(default_values(round_name, num_rows) for round_name in ROUND_NAMES[:2])
+        game_data = make_game_data(num_categories, round_values=round_values)
+        jeopardy_round = build_rounds(game_data)[ROUND_NAMES[0]]
+        
+        gc.collect()
+        before = resident_bytes()
+        view = BOARD_VIEWS[renderer](root, lambda category, value: None)
+        start = time.perf_counter()
+        view.show(jeopardy_round)
+        root.update()
+        first_build = time.perf_counter() - start
+        after = resident_bytes()
+        
+        widgets = count_widgets(view.widget)
+        items = len(view.widget.find_all()) if renderer == "canvas" else 0
+        
+        builds = []
+        for _ in range(repeats):
+            view.round = None  # Forget the built round so it is built again
+            start = time.perf_counter()
+            view.show(jeopardy_round)
+            root.update()
+            builds.append(time.perf_counter() - start)
+            
+        tiles = []
+        for question in list(jeopardy_round.iter_questions())[:repeats * 5]:
+            question.play()
+            start = time.perf_counter()
+            view.refresh(question.category, question.value)
+            root.update()
+            tiles.append(time.perf_counter() - start)
+            
+        resizes = []
+        for index in range(repeats):
+            start = time.perf_counter()
+            root.geometry(f"{1280 - 40 * (index % 2 + 1)}x800")
+            root.update()
+            resizes.append(time.perf_counter() - start)
+            
+        return {
+            "widgets": widgets,
+            "items": items,
+            "first_build": first_build,
+            "build": statistics.median(builds),
+            "tile": statistics.median(tiles),
+            "resize": statistics.median(resizes),
+            "memory": after - before if before is not None and after is not None else None
+        }
+    finally:
+        root.destroy()
+
+
+def main():
+    """Run the board renderer benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["6x5", "12x10", "20x20", "30x30"],
+                        help="board sizes as CATEGORIESxROWS")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per measurement")
+    args = parser.parse_args()
+    
+    print(f"{'board':>7} {'renderer':>8} {'widgets':>8} {'items':>6} {'first':>9} {'build':>9} "
+          f"{'tile':>9} {'resize':>9} {'memory':>10}")
+    for size in args.sizes:
+        num_categories, num_rows = (int(part) for part in size.lower().split("x"))
+        for renderer in ("widgets", "canvas"):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(measure, renderer, num_categories, num_rows, args.repeats).result()
+            if result is None:
+                print("No display available; the board renderers cannot be measured.")
+                return
+                
+            memory = f"{result['memory'] / 1024:8.0f}KB" if result["memory"] is not None else f"{'n/a':>10}"
+            print(f"{size:>7} {renderer:>8} {result['widgets']:8} {result['items']:6} "
+                  f"{result['first_build'] * 1000:7.1f}ms {result['build'] * 1000:7.1f}ms "
+                  f"{result['tile'] * 1000:7.2f}ms {result['resize'] * 1000:7.1f}ms {memory}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
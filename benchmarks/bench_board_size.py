@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Board Size Benchmark
+------------------------------------
+Times parsing, building and playing boards of increasing size, from the standard
+6x5 up to boards of hundreds of tiles. When a display is available, also times
+building the board, returning to it after a clue and redrawing one tile after a
+ruling.
+
+Usage:
+    python benchmarks/bench_board_size.py --sizes 6x5 12x10 20x20 30x30
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ROUND_NAMES
+from jeopardy_core import JeopardyGame, PackParser, build_rounds, default_values
+from synthetic import write_workbook
+
+
+def median_time(function, repeats, setup=None):
+    """Time repeated calls of a function.
+    
+    Args:
+        function (callable): The function to call
+        repeats (int): Number of timed calls
+        setup (callable, optional): Called, untimed, before each call. Defaults to None.
+        
+    Returns:
+        float: Median seconds per call
+    """
+    timings = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def new_game():
+    """Create a game with three teams.
+    
+    Returns:
+        JeopardyGame: The game
+    """
+    return JeopardyGame(teams=[{"name": f"Team {i}", "score": 0, "color": "#3498db"} for i in range(1, 4)])
+
+
+def time_rulings(game_data):
+    """Rule on every clue of the first round.
+    
+    Args:
+        game_data (dict): The parsed game data
+        
+    Returns:
+        float: Median seconds per ruling
+    """
+    game = new_game()
+    game.install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+    timings = []
+    for index, question in enumerate(list(game.current_round.iter_questions())):
+        start = time.perf_counter()
+        game.rule(question, game.teams[index % 3]["id"], index % 2 == 0)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def time_drawing(game_data, repeats):
+    """Time drawing the board in the UI.
+    
+    Args:
+        game_data (dict): The parsed game data
+        repeats (int): Number of timed builds and returns to the board
+        
+    Returns:
+        tuple: Median seconds to build the board, to return to it from a clue and to
+            redraw one tile, or None if there is no display
+    """
+    import tkinter as tk
+    from file_handler import ExcelHandler
+    from ui import JeopardyUI
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    try:
+        game = new_game()
+        ui = JeopardyUI(root, game, ExcelHandler())
+        game.install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+        
+        def forget_board():
+            ui.board_view.round = None  # Forget the built round so it is built again
+            
+        def leave_board():
+            ui._clear_board()
+            root.update()
+            
+        def draw():
+            ui._show_game_board()
+            root.update()
+            
+        questions = list(game.current_round.iter_questions())
+        
+        def redraw_tile():
+            question = questions.pop()
+            game.rule(question, game.teams[0]["id"], True)
+            ui.board_view.refresh(question.category, question.value)
+            root.update()
+            
+        build_time = median_time(draw, repeats, forget_board)
+        return_time = median_time(draw, repeats, leave_board)
+        tile_time = median_time(redraw_tile, min(repeats * 5, len(questions)))
+        return build_time, return_time, tile_time
+    finally:
+        root.destroy()
+
+
+def main():
+    """Run the board size benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["6x5", "12x10", "20x20", "30x30"],
+                        help="board sizes as CATEGORIESxROWS")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per measurement")
+    args = parser.parse_args()
+    
+    pack_parser = PackParser()
+    print(f"{'board':>7} {'tiles':>6} {'parse':>9} {'build':>9} {'ruling':>9} {'draw':>9} {'return':>9} {'tile':>9}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            num_categories, num_rows = (int(part) for part in size.lower().split("x"))
+            round_values = tuple(default_values(round_name, num_rows) for round_name in ROUND_NAMES[:2])
+            file_path = write_workbook(os.path.join(temp_dir, f"{size}.xlsx"), num_categories,
+                                       round_values=round_values)
+                                       
+            parse_time = median_time(lambda: pack_parser.read_game_data(file_path), args.repeats)
+            game_data = pack_parser.read_game_data(file_path)
+            build_time = median_time(lambda: build_rounds(game_data), args.repeats)
+            ruling_time = time_rulings(game_data)
+            drawing = time_drawing(game_data, args.repeats)
+            
+            drawn = (f"{drawing[0] * 1000:7.1f}ms {drawing[1] * 1000:7.2f}ms {drawing[2] * 1000:7.2f}ms"
+                     if drawing else f"{'no display':>29}")
+            print(f"{size:>7} {num_categories * num_rows:6} {parse_time * 1000:7.1f}ms "
+                  f"{build_time * 1000:7.2f}ms {ruling_time * 1e6:7.1f}us {drawn}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Buzzer Load Generator
+-------------------------------------
+Connects hundreds of buzzer clients to a local buzzer server and has all of them
+buzz on every clue, some of them early, either all at once or spread over a
+realistic reaction window. Reports the time from a buzz being sent to the server
+timestamping it, both for the winning buzz and for the whole burst, and checks
+that every clue went to the first team to buzz after the buzzers opened.
+
+Usage:
+    python benchmarks/bench_buzzer.py --clients 100 300 1000 --clues 20 --spread 0 0.2
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from buzzer import BuzzerServer
+
+
+def client_process(conn, address, token, names):
+    """Run the buzzer clients, buzzing whenever the parent process says so.
+    
+    The clients live in their own process so that sending a burst of buzzes does
+    not compete with the server for the interpreter lock.
+    
+    Args:
+        conn (Connection): Pipe to the parent process
+        address (tuple): The server's address
+        token (str): The server's join token
+        names (list): One team name per client
+    """
+    clients = []
+    for _ in names:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.settimeout(2.0)
+        clients.append(sock)
+        
+    while True:
+        command, order, spread = conn.recv()
+        if command == "quit":
+            break
+            
+        sent = {}
+        start = time.monotonic()
+        for position, index in enumerate(order):
+            delay = start + spread * position / len(order) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            sent[index] = time.monotonic()
+            clients[index].sendto(json.dumps({"team": names[index], "token": token, "id": index}).encode(), address)
+            
+        replies = {}
+        for index in order:
+            try:
+                replies[index] = json.loads(clients[index].recv(1024))
+            except socket.timeout:
+                pass
+        conn.send((sent, replies))
+        
+    for sock in clients:
+        sock.close()
+
+
+def run_clues(num_clients, num_clues, early_share, spread, rng):
+    """Play clues with every client buzzing in, and collect timings.
+    
+    Args:
+        num_clients (int): Number of buzzer clients, one team each
+        num_clues (int): Number of clues to play
+        early_share (float): Share of clients that buzz before the buzzers open
+        spread (float): Seconds over which each clue's buzzes are sent
+        rng (Random): Source of buzz order
+        
+    Returns:
+        tuple: Lists of one-way latencies of the winning buzzes and of all buzzes in
+            seconds, the number of clues won by the wrong team and the number of lost
+            replies
+    """
+    names = [f"Team {i}" for i in range(num_clients)]
+    winners = []
+    server = BuzzerServer(host="127.0.0.1", port=0, on_winner=lambda team, reaction: winners.append(team))
+    server.start()
+    server.set_teams(names)
+    
+    conn, child_conn = multiprocessing.Pipe()
+    clients = multiprocessing.Process(target=client_process, args=(child_conn, server.address, server.token, names))
+    clients.start()
+    
+    winning = []
+    latencies = []
+    unfair = 0
+    lost = 0
+    try:
+        for _ in range(num_clues):
+            server.arm()
+            early = rng.sample(range(num_clients), int(num_clients * early_share))
+            conn.send(("buzz", early, 0))
+            conn.recv()
+            
+            server.open()
+            order = list(range(num_clients))
+            rng.shuffle(order)
+            conn.send(("buzz", order, spread))
+            sent, replies = conn.recv()
+            server.close()
+            
+            lost += num_clients - len(replies)
+            for index, reply in replies.items():
+                latencies.append(reply["at"] - sent[index])
+                if reply["result"] == "won":
+                    winning.append(latencies[-1])
+            first_allowed = next(names[index] for index in order if index not in early)
+            if winners[-1] != first_allowed:
+                unfair += 1
+    finally:
+        conn.send(("quit", None, None))
+        clients.join()
+        server.stop()
+        
+    return winning, latencies, unfair, lost
+
+
+def main():
+    """Run the buzzer load generator."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 300, 1000], help="buzzer clients")
+    parser.add_argument("--clues", type=int, default=20, help="clues played for each client count")
+    parser.add_argument("--early", type=float, default=0.1, help="share of clients that buzz early")
+    parser.add_argument("--spread", type=float, nargs="+", default=[0.0, 0.2],
+                        help="seconds over which each clue's buzzes arrive; 0 sends them all at once")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    print(f"{'spread':>6} {'clients':>7} {'buzzes':>7} {'winner p50':>11} {'winner max':>11} "
+          f"{'burst p50':>10} {'burst p99':>10} {'unfair':>7} {'lost':>5}")
+    for spread, num_clients in ((spread, n) for spread in args.spread for n in args.clients):
+        winning, latencies, unfair, lost = run_clues(num_clients, args.clues, args.early, spread, rng)
+        latencies.sort()
+        print(f"{spread:6.2f} {num_clients:7d} {len(latencies):7d} {statistics.median(winning) * 1e6:8.0f} us "
+              f"{max(winning) * 1e6:8.0f} us {statistics.median(latencies) * 1e6:7.0f} us "
+              f"{latencies[int(len(latencies) * 0.99)] * 1e6:7.0f} us {unfair:7d} {lost:5d}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Game Journal Benchmark
+--------------------------------------
+Plays long games with and without a journal attached and times each ruling, then
+times replaying the journal to random points.
+
+Usage:
+    python benchmarks/bench_journal.py --categories 100 --games 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ROUND_NAMES
+from game_journal import GameJournal, replay
+from jeopardy_core import JeopardyGame, build_rounds
+from synthetic import make_game_data
+
+
+def play_session(game, num_categories, num_games, rng):
+    """Play whole games back to back, ruling on every clue.
+    
+    Args:
+        game (JeopardyGame): The game to play
+        num_categories (int): Number of categories in each regular round
+        num_games (int): Number of games to play
+        rng (Random): Source of rulings
+        
+    Returns:
+        list: Seconds taken by each ruling
+    """
+    timings = []
+    for game_index in range(num_games):
+        game_data = make_game_data(num_categories, seed=game_index)
+        game.install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+        
+        for _ in ROUND_NAMES[:2]:
+            for question in list(game.current_round.iter_questions()):
+                game.select_question(question.category, question.value)
+                start = time.perf_counter()
+                game.rule(question, rng.choice(game.teams.ids()), rng.random() < 0.6)
+                timings.append(time.perf_counter() - start)
+            game.next_round()
+    return timings
+
+
+def new_game():
+    """Create a game with three teams.
+    
+    Returns:
+        JeopardyGame: The game
+    """
+    return JeopardyGame(teams=[{"name": f"Team {i}", "score": 0, "color": "#3498db"} for i in range(1, 4)])
+
+
+def main():
+    """Run the game journal benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100, help="categories in each regular round")
+    parser.add_argument("--games", type=int, default=5, help="games played in the session")
+    parser.add_argument("--replays", type=int, default=20, help="random points to replay to")
+    args = parser.parse_args()
+    
+    plain = play_session(new_game(), args.categories, args.games, random.Random(0))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "session.jsonl")
+        game = new_game()
+        journal = GameJournal(path)
+        journal.attach(game)
+        journaled = play_session(game, args.categories, args.games, random.Random(0))
+        journal.close()
+        
+        rng = random.Random(1)
+        replay_timings = []
+        for _ in range(args.replays):
+            start = time.perf_counter()
+            replay(path, rng.randint(1, game.last_seq))
+            replay_timings.append(time.perf_counter() - start)
+            
+        print(f"{len(plain)} rulings, {game.last_seq} events, journal {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+        
+    for label, timings in (("no journal", plain), ("journal", journaled)):
+        timings = sorted(timings)
+        print(f"{label:12} ruling median {statistics.median(timings) * 1e6:7.1f} us  "
+              f"p99 {timings[int(len(timings) * 0.99)] * 1e6:7.1f} us")
+    print(f"replay to a random event: median {statistics.median(replay_timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
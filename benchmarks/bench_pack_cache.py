@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Pack Cache Benchmark
+------------------------------------
+Compares a full workbook parse against a compiled pack cache hit.
+
+Usage:
+    python benchmarks/bench_pack_cache.py --categories 500 --repeats 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jeopardy_core import PackParser
+from pack_cache import PackCache
+from synthetic import write_workbook
+
+
+def main():
+    """Run the pack cache benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=500, help="categories per round")
+    parser.add_argument("--repeats", type=int, default=5, help="timed loads per mode")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # No Daily Doubles sheet, so placements are random and must survive the cache
+        file_path = write_workbook(os.path.join(temp_dir, "pack.xlsx"), args.categories, daily_doubles=False)
+        uncached = PackParser()
+        cached = PackParser(cache=PackCache(os.path.join(temp_dir, "cache")))
+        
+        parse_times = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            uncached.read_game_data(file_path)
+            parse_times.append(time.perf_counter() - start)
+        
+        first = cached.read_game_data(file_path)
+        hit_times = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            game_data = cached.read_game_data(file_path)
+            hit_times.append(time.perf_counter() - start)
+        
+        entry_bytes = sum(entry["bytes"] for entry in cached.cache._load_index()["entries"].values())
+    
+    parse_time = statistics.median(parse_times)
+    hit_time = statistics.median(hit_times)
+    print(f"categories per round: {args.categories}")
+    print(f"workbook parse: {parse_time * 1000:9.1f} ms")
+    print(f"cache hit:      {hit_time * 1000:9.1f} ms  ({parse_time / hit_time:.0f}x)")
+    print(f"cache entry size: {entry_bytes / 1024:.1f} KiB")
+    print(f"daily doubles stable across hits: {game_data['daily_doubles'] == first['daily_doubles']}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
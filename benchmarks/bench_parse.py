@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Workbook Parsing Benchmark
+------------------------------------------
+Compares the single-pass parsers against the pandas parser, and checks that every
+engine gives the same game data, also for a pack with date and number formatted cells.
+
+Usage:
+    python benchmarks/bench_parse.py --categories 500 --repeats 5
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jeopardy_core import PackParser
+from synthetic import write_workbook
+
+
+def time_engine(pack_parser, file_path, engine, repeats):
+    """Time repeated parses of a workbook with one engine.
+    
+    Args:
+        pack_parser (PackParser): The parser to use
+        file_path (str): Path to the workbook
+        engine (str): The parsing engine name
+        repeats (int): Number of timed parses
+        
+    Returns:
+        tuple: (median seconds, last game data)
+    """
+    timings = []
+    game_data = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        game_data = pack_parser.read_game_data(file_path, engine=engine)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), game_data
+
+
+def format_cells(file_path):
+    """Replace some cells of a synthetic workbook with formatted dates, times and numbers.
+    
+    Args:
+        file_path (str): Path to the workbook, which is overwritten
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file_path)
+    jeopardy, double_jeopardy, final = workbook.worksheets[:3]
+    jeopardy["A2"] = datetime.datetime(1969, 7, 20)
+    jeopardy["A3"] = datetime.datetime(1900, 2, 10)
+    jeopardy["A3"].number_format = "d mmmm yyyy"
+    jeopardy["A4"] = datetime.time(13, 5)
+    double_jeopardy["A2"] = datetime.timedelta(hours=30, minutes=5)
+    double_jeopardy["A3"] = 0.25
+    double_jeopardy["A3"].number_format = "0%"
+    double_jeopardy["A4"] = 1234.5
+    double_jeopardy["A4"].number_format = '#,##0.00 "days"'
+    final["B2"] = datetime.datetime(2024, 3, 1, 13, 45, 30)
+    workbook.save(file_path)
+
+
+def main():
+    """Run the parsing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=500, help="categories per round")
+    parser.add_argument("--repeats", type=int, default=5, help="timed parses per engine")
+    args = parser.parse_args()
+    
+    pack_parser = PackParser()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = write_workbook(os.path.join(temp_dir, "pack.xlsx"), args.categories)
+        
+        results = {
+            engine: time_engine(pack_parser, file_path, engine, args.repeats)
+            for engine in ("pandas", "streaming", "lightweight")
+        }
+        
+        formatted_path = write_workbook(os.path.join(temp_dir, "formatted.xlsx"), 5)
+        format_cells(formatted_path)
+        formatted = {
+            engine: pack_parser.read_game_data(formatted_path, engine=engine)
+            for engine in ("pandas", "streaming", "lightweight")
+        }
+    
+    pandas_time, pandas_data = results["pandas"]
+    print(f"categories per round: {args.categories}")
+    for engine, (engine_time, game_data) in results.items():
+        print(f"{engine + ':':13} {engine_time * 1000:9.1f} ms  ({pandas_time / engine_time:.1f}x)  "
+              f"identical: {game_data == pandas_data}")
+    print("formatted cells identical: " + ", ".join(
+        f"{engine} {game_data == formatted['pandas']}" for engine, game_data in formatted.items()
+    ))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
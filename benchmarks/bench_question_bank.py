@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Question Bank Benchmark
+---------------------------------------
+Fills a question bank with synthetic packs and times typical queries.
+
+Usage:
+    python benchmarks/bench_question_bank.py --packs 1000 --categories 12
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ROUND_NAMES
+from question_bank import QuestionBank
+from synthetic import make_game_data
+
+
+def time_query(label, query, repeats=20):
+    """Time a query and print the median latency.
+    
+    Args:
+        label (str): Description of the query
+        query (callable): Function running the query and returning its results
+        repeats (int, optional): Number of timed runs. Defaults to 20.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        results = query()
+        timings.append(time.perf_counter() - start)
+    print(f"{label:40} {statistics.median(timings) * 1000:8.2f} ms  ({len(results)} results)")
+
+
+def main():
+    """Run the question bank benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packs", type=int, default=1000, help="number of synthetic packs")
+    parser.add_argument("--categories", type=int, default=12, help="categories per round in each pack")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        bank = QuestionBank(os.path.join(temp_dir, "bank.db"))
+        
+        start = time.perf_counter()
+        for seed in range(args.packs):
+            bank.ingest_game_data(make_game_data(args.categories, seed), f"pack {seed}", f"synthetic-{seed}")
+        ingest_time = time.perf_counter() - start
+        
+        clue_count = bank.connection.execute("SELECT COUNT(*) FROM clues").fetchone()[0]
+        print(f"ingested {args.packs} packs ({clue_count} clues) in {ingest_time:.1f} s")
+        
+        some_category = bank.categories()[len(bank.categories()) // 2][2]
+        time_query("keyword", lambda: bank.search(keyword="nebula"))
+        time_query("two keywords", lambda: bank.search(keyword="nebula walrus"))
+        time_query("keyword + value", lambda: bank.search(keyword="glacier", value=800))
+        time_query("category", lambda: bank.search(category=some_category))
+        time_query("value + round", lambda: bank.search(value=1200, round_name=ROUND_NAMES[1]))
+        time_query("export random game", lambda: bank.export_game_data(
+            bank.random_categories(6), bank.random_categories(6))["rounds"][ROUND_NAMES[0]]["categories"], repeats=5)
+        bank.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Round Completion Benchmark
+------------------------------------------
+Plays every clue on a large board, checking for completion after each one as the
+UI does, and compares the incremental counters with a full scan of the board.
+
+Usage:
+    python benchmarks/bench_round_completion.py --categories 100 --values 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jeopardy_core import Question, JeopardyRound
+
+
+def scan_is_complete(round_obj):
+    """Check completion by scanning every question, as is_complete used to.
+    
+    Args:
+        round_obj (JeopardyRound): The round to check
+        
+    Returns:
+        bool: True if all questions have been played
+    """
+    for question in round_obj.iter_questions():
+        if not question.played:
+            return False
+    return True
+
+
+def play_board(num_categories, num_values, is_complete):
+    """Play every clue on a new board, checking for completion after each clue.
+    
+    Args:
+        num_categories (int): Number of categories on the board
+        num_values (int): Number of values per category
+        is_complete (callable): Completion check taking the round
+        
+    Returns:
+        float: Seconds spent in completion checks
+    """
+    round_obj = JeopardyRound("Jeopardy")
+    for category_index in range(num_categories):
+        for value_index in range(num_values):
+            round_obj.add_question(Question(f"Category {category_index}", (value_index + 1) * 100, "clue", "answer"))
+            
+    elapsed = 0.0
+    for question in list(round_obj.iter_questions()):
+        question.play()
+        start = time.perf_counter()
+        is_complete(round_obj)
+        elapsed += time.perf_counter() - start
+        
+    assert is_complete(round_obj)
+    return elapsed
+
+
+def main():
+    """Run the round completion benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100, help="categories on the board")
+    parser.add_argument("--values", type=int, default=50, help="values per category")
+    args = parser.parse_args()
+    
+    clues = args.categories * args.values
+    scan_seconds = play_board(args.categories, args.values, scan_is_complete)
+    counter_seconds = play_board(args.categories, args.values, JeopardyRound.is_complete)
+    
+    print(f"{clues} clues, one completion check per clue")
+    print(f"full scan:  {scan_seconds:8.3f} s  ({scan_seconds / clues * 1e6:8.2f} us per check)")
+    print(f"counters:   {counter_seconds:8.3f} s  ({counter_seconds / clues * 1e6:8.2f} us per check)")
+    print(f"speedup:    {scan_seconds / counter_seconds:8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
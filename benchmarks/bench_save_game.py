@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Saved Game Benchmark
+------------------------------------
+Compares resuming a saved game against parsing its workbook again, and times each
+ruling with and without autosave attached.
+
+Usage:
+    python benchmarks/bench_save_game.py --categories 100 --repeats 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jeopardy_core import JeopardyGame, PackParser, build_rounds
+from save_game import AutoSaver, save_game, load_game
+from synthetic import write_workbook
+
+
+def new_game():
+    """Create a game with three teams.
+    
+    Returns:
+        JeopardyGame: The game
+    """
+    return JeopardyGame(teams=[{"name": f"Team {i}", "score": 0, "color": "#3498db"} for i in range(1, 4)])
+
+
+def play_round(game, rng):
+    """Rule on every clue of the current round.
+    
+    Args:
+        game (JeopardyGame): The game to play
+        rng (Random): Source of rulings
+        
+    Returns:
+        list: Seconds taken by each ruling
+    """
+    timings = []
+    for question in list(game.current_round.iter_questions()):
+        start = time.perf_counter()
+        game.rule(question, rng.choice(game.teams.ids()), rng.random() < 0.6)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def median_time(function, repeats):
+    """Time repeated calls of a function.
+    
+    Args:
+        function (callable): The function to call
+        repeats (int): Number of timed calls
+        
+    Returns:
+        float: Median seconds per call
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    """Run the saved game benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=100, help="categories in each regular round")
+    parser.add_argument("--repeats", type=int, default=5, help="timed loads and saves")
+    args = parser.parse_args()
+    
+    pack_parser = PackParser()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workbook_path = write_workbook(os.path.join(temp_dir, "pack.xlsx"), args.categories)
+        save_path = os.path.join(temp_dir, "game.jsave")
+        
+        def parse_and_install():
+            game_data = pack_parser.read_game_data(workbook_path)
+            new_game().install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+            
+        game_data = pack_parser.read_game_data(workbook_path)
+        game = new_game()
+        game.install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+        plain = play_round(game, random.Random(0))
+        
+        game = new_game()
+        autosaver = AutoSaver(save_path)
+        autosaver.attach(game)
+        game.install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+        autosaved = play_round(game, random.Random(0))
+        autosaver.close()
+        
+        parse_time = median_time(parse_and_install, args.repeats)
+        save_time = median_time(lambda: save_game(game, save_path), args.repeats)
+        load_time = median_time(lambda: load_game(save_path), args.repeats)
+        identical = load_game(save_path).snapshot(include_board=False)["rounds"] == game.snapshot(include_board=False)["rounds"]
+        
+        print(f"categories per round: {args.categories}, save file {os.path.getsize(save_path) / 1024:.1f} KiB")
+        
+    for label, timings in (("no autosave", plain), ("autosave", autosaved)):
+        timings = sorted(timings)
+        print(f"{label:12} ruling median {statistics.median(timings) * 1e6:7.1f} us  "
+              f"p99 {timings[int(len(timings) * 0.99)] * 1e6:7.1f} us")
+    print(f"parse workbook: {parse_time * 1000:8.1f} ms")
+    print(f"resume save:    {load_time * 1000:8.1f} ms  ({parse_time / load_time:.1f}x)  identical: {identical}")
+    print(f"save now:       {save_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
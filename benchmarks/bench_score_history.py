@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Score History Benchmark
+---------------------------------------
+Records a long run of score changes and measures the memory used per change,
+against keeping the score events themselves, and the time taken to record,
+fetch new points and export them.
+
+Usage:
+    python benchmarks/bench_score_history.py --changes 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jeopardy_core import JeopardyGame
+from score_history import ScoreHistory
+
+
+def make_events(num_changes, team_ids, rng):
+    """Make score events like those emitted for rulings.
+    
+    Args:
+        num_changes (int): Number of events
+        team_ids (list): IDs of the teams
+        rng (Random): Source of rulings
+        
+    Returns:
+        list: The events
+    """
+    scores = dict.fromkeys(team_ids, 0)
+    events = []
+    start = time.time()
+    for seq in range(num_changes):
+        team_id = rng.choice(team_ids)
+        value = rng.choice((200, 400, 600, 800, 1000))
+        before = scores[team_id]
+        scores[team_id] += value if rng.random() < 0.6 else -value
+        events.append({
+            "seq": seq, "action": seq, "action_name": "rule", "time": start + seq, "type": "score",
+            "before": before, "after": scores[team_id], "team": team_id,
+            "clue": ["Jeopardy", f"Category {seq % 300}", value]
+        })
+    return events
+
+
+def main():
+    """Run the score history benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--changes", type=int, default=100000, help="score changes recorded")
+    parser.add_argument("--batch", type=int, default=3, help="changes between chart updates")
+    args = parser.parse_args()
+    
+    game = JeopardyGame(teams=[{"name": f"Team {i}", "score": 0, "color": "#3498db"} for i in range(1, 4)])
+    events = make_events(args.changes, game.teams.ids(), random.Random(0))
+    
+    # Score events are dropped by listeners once handled; keeping them is the naive history
+    tracemalloc.start()
+    kept = [dict(event, clue=list(event["clue"])) for event in events]
+    events_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    
+    tracemalloc.start()
+    history = ScoreHistory(game)
+    for event in events:
+        history._record(event)
+    history_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    # A live chart fetches the new points after every few changes
+    history = ScoreHistory(game)
+    record_time = since_time = 0.0
+    for first in range(0, len(events), args.batch):
+        drawn = len(history)
+        start = time.perf_counter()
+        for event in events[first:first + args.batch]:
+            history._record(event)
+        record_time += time.perf_counter() - start
+        start = time.perf_counter()
+        history.since(drawn)
+        since_time += time.perf_counter() - start
+    since_time /= len(events) / args.batch
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        start = time.perf_counter()
+        history.export_csv(os.path.join(temp_dir, "scores.csv"))
+        export_time = time.perf_counter() - start
+        
+    print(f"{len(history)} points, {history.bytes_per_point} bytes per point in the columns")
+    print(f"memory per change: events {events_bytes / args.changes:7.1f} B  "
+          f"score history {history_bytes / args.changes:5.1f} B  ({events_bytes / history_bytes:.0f}x)")
+    print(f"record: {record_time / args.changes * 1e6:.2f} us per change")
+    print(f"fetch {args.batch} new points: {since_time * 1e6:.2f} us")
+    print(f"export CSV: {export_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Simulator Benchmark
+-----------------------------------
+Times the Monte Carlo simulator for several batch sizes and numbers of teams and
+reports the runtime per million games.
+
+Usage:
+    python benchmarks/bench_simulator.py --games 200000 --batch-sizes 10000 100000
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulator import SkillModel, simulate_games
+
+
+def main():
+    """Run the simulator benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=200_000, help="games simulated for each setting")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="games per batch")
+    parser.add_argument("--teams", type=int, nargs="+", default=[2, 3, 6], help="numbers of teams")
+    args = parser.parse_args()
+    
+    print(f"{'teams':>5} {'batch':>8} {'s per million games':>20}")
+    for num_teams in args.teams:
+        skill = SkillModel([0.6] * num_teams)
+        for batch_size in args.batch_sizes:
+            result = simulate_games(args.games, skill, seed=0, batch_size=batch_size)
+            print(f"{num_teams:5d} {batch_size:8d} {result.seconds_per_million():20.2f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Startup Time Benchmark
+--------------------------------------
+Measures how long the application takes to start in a fresh interpreter:
+the time to import main.py, and the time from main() to the first
+iteration of the Tk main loop. Also reports which heavy modules were
+imported during startup, so an eager import shows up as a regression.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["pandas", "openpyxl", "pygame", "PIL", "numpy"]
+
+# Runs in a child interpreter so that import costs are measured from scratch
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import tkinter as tk
+import main
+imported = time.perf_counter()
+timings = {"import": imported - start}
+
+original_mainloop = tk.Misc.mainloop
+
+def probe_mainloop(self, n=0):
+    def first_iteration():
+        timings["main_to_mainloop"] = time.perf_counter() - main_called
+        self.destroy()
+    self.after(0, first_iteration)
+    original_mainloop(self, n)
+
+tk.Misc.mainloop = probe_mainloop
+main_called = time.perf_counter()
+try:
+    main.main()
+except tk.TclError as e:
+    timings["error"] = str(e)
+timings["heavy_modules"] = [name for name in HEAVY_MODULES if name in sys.modules]
+print(json.dumps(timings))
+"""
+
+
+def run_probe():
+    """Start the application once in a child interpreter.
+    
+    Returns:
+        dict: The timings reported by the child
+    """
+    code = f"HEAVY_MODULES = {HEAVY_MODULES!r}\n" + PROBE
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    """Run the startup benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="number of application starts")
+    args = parser.parse_args()
+    
+    runs = [run_probe() for _ in range(args.runs)]
+    
+    import_time = statistics.median(run["import"] for run in runs)
+    print(f"import main.py:       {import_time * 1000:8.1f} ms")
+    
+    mainloop_times = [run["main_to_mainloop"] for run in runs if "main_to_mainloop" in run]
+    if mainloop_times:
+        print(f"main() to mainloop:   {statistics.median(mainloop_times) * 1000:8.1f} ms")
+    else:
+        print(f"main() to mainloop:   not measured ({runs[0].get('error', 'no display')})")
+    
+    heavy = sorted(set(name for run in runs for name in run["heavy_modules"]))
+    print(f"heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
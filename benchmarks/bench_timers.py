@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Timer Benchmark
+-------------------------------
+Compares the event-loop timer scheduler against the old countdown thread, which
+slept for a second per step and was joined from the Tk thread on every restart.
+Reports how long restarting a timer blocks the event loop, how late countdowns
+finish while the event loop is kept busy, and the cost of a tick with many timers
+running at once.
+
+The scheduler runs on a Tcl interpreter without a window, so no display is needed.
+
+Usage:
+    python benchmarks/bench_timers.py --seconds 5 --restarts 10 --timers 1000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import tkinter as tk
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timers import TimerScheduler
+
+
+class LegacyTimer:
+    """The countdown thread the UI used before the scheduler."""
+    
+    def __init__(self):
+        """Initialize a LegacyTimer object."""
+        self.running = False
+        self.value = 0
+        self.thread = None
+        self.finished_at = None
+    
+    def start(self, seconds):
+        """Start the countdown, joining any running countdown first.
+        
+        Args:
+            seconds (int): The number of seconds for the timer
+        """
+        self.value = seconds
+        self.running = True
+        
+        if self.thread and self.thread.is_alive():
+            self.running = False
+            self.thread.join()
+            
+        self.running = True
+        self.finished_at = None
+        self.thread = threading.Thread(target=self._countdown, daemon=True)
+        self.thread.start()
+    
+    def _countdown(self):
+        """Count down one second per sleep."""
+        while self.running and self.value > 0:
+            time.sleep(1)
+            self.value -= 1
+        if self.running and self.value <= 0:
+            self.finished_at = time.monotonic()
+
+
+def busy(seconds):
+    """Keep the CPU busy in Python, like a slow event handler.
+    
+    Args:
+        seconds (float): How long to stay busy
+    """
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def add_load(root, every, duration, stop):
+    """Keep the event loop busy with a slow handler at a fixed period.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        every (int): Milliseconds between slow handlers
+        duration (float): Seconds each handler runs for
+        stop (list): Set to a true first element to end the load
+    """
+    def handler():
+        if not stop[0]:
+            busy(duration)
+            root.after(every, handler)
+            
+    root.after(every, handler)
+
+
+def run_until(root, condition):
+    """Process events until a condition holds.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        condition (callable): Returns True when done
+    """
+    while not condition():
+        root.update()
+        time.sleep(0.0005)
+
+
+def legacy_restart_stalls(restarts, rng):
+    """Time how long restarting the old countdown blocked its caller.
+    
+    Args:
+        restarts (int): Number of restarts
+        rng (Random): Source of the time between restarts
+        
+    Returns:
+        list: Seconds each restart blocked for
+    """
+    timer = LegacyTimer()
+    timer.start(30)
+    stalls = []
+    for _ in range(restarts):
+        time.sleep(rng.uniform(0.05, 0.95))
+        start = time.perf_counter()
+        timer.start(30)
+        stalls.append(time.perf_counter() - start)
+    timer.running = False
+    return stalls
+
+
+def scheduler_restart_stalls(root, restarts, rng):
+    """Time how long restarting a scheduled timer blocks the event loop.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        restarts (int): Number of restarts
+        rng (Random): Source of the time between restarts
+        
+    Returns:
+        list: Seconds each restart blocked for
+    """
+    timers = TimerScheduler(root)
+    timers.start("clue", 30, on_tick=lambda left: None)
+    stalls = []
+    for _ in range(restarts):
+        wake = time.monotonic() + rng.uniform(0.05, 0.95)
+        run_until(root, lambda: time.monotonic() >= wake)
+        start = time.perf_counter()
+        timers.start("clue", 30, on_tick=lambda left: None)
+        stalls.append(time.perf_counter() - start)
+    timers.cancel_all()
+    return stalls
+
+
+def legacy_lateness(root, seconds, load_every, load_duration):
+    """Measure how late the old countdown finished with the event loop busy.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        seconds (int): Length of the countdown
+        load_every (int): Milliseconds between slow handlers
+        load_duration (float): Seconds each slow handler runs for
+        
+    Returns:
+        float: Seconds between the deadline and the countdown finishing
+    """
+    stop = [False]
+    add_load(root, load_every, load_duration, stop)
+    timer = LegacyTimer()
+    deadline = time.monotonic() + seconds
+    timer.start(seconds)
+    run_until(root, lambda: timer.finished_at is not None)
+    stop[0] = True
+    return timer.finished_at - deadline
+
+
+def scheduler_lateness(root, seconds, load_every, load_duration):
+    """Measure how late a scheduled countdown finishes with the event loop busy.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        seconds (int): Length of the countdown
+        load_every (int): Milliseconds between slow handlers
+        load_duration (float): Seconds each slow handler runs for
+        
+    Returns:
+        tuple: Seconds between the deadline and the finish, and the longest gap
+            between two ticks
+    """
+    stop = [False]
+    add_load(root, load_every, load_duration, stop)
+    timers = TimerScheduler(root)
+    finished = []
+    ticks = []
+    deadline = time.monotonic() + seconds
+    timers.start("clue", seconds, on_tick=lambda left: ticks.append(time.monotonic()),
+                 on_finish=lambda: finished.append(time.monotonic()))
+    run_until(root, lambda: finished)
+    stop[0] = True
+    return finished[0] - deadline, max(b - a for a, b in zip(ticks, ticks[1:]))
+
+
+def tick_cost(root, num_timers):
+    """Measure the cost of a tick with many timers running.
+    
+    Args:
+        root (tk.Tcl): The interpreter
+        num_timers (int): Number of concurrent timers
+        
+    Returns:
+        tuple: Seconds to start all of the timers and median seconds per tick
+    """
+    timers = TimerScheduler(root)
+    ticks = []
+    
+    def on_tick(left):
+        ticks.append(time.perf_counter())
+        
+    start = time.perf_counter()
+    for index in range(num_timers):
+        timers.start(f"team {index}", 1.0, on_tick=on_tick, interval=0.1)
+    start_time = time.perf_counter() - start
+    
+    ticks.clear()
+    run_until(root, lambda: not timers.timers)
+    
+    # Ticks fire in bursts; the gaps inside a burst are the cost of one tick
+    gaps = [b - a for a, b in zip(ticks, ticks[1:]) if b - a < 0.005]
+    return start_time, statistics.median(gaps) if gaps else 0.0
+
+
+def main():
+    """Run the timer benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=5, help="length of the loaded countdowns")
+    parser.add_argument("--restarts", type=int, default=10, help="timer restarts timed")
+    parser.add_argument("--timers", type=int, default=1000, help="concurrent timers for the tick cost")
+    parser.add_argument("--load-every", type=int, default=100, help="milliseconds between slow handlers")
+    parser.add_argument("--load-ms", type=float, default=40, help="milliseconds each slow handler runs")
+    args = parser.parse_args()
+    
+    root = tk.Tcl()
+    rng = random.Random(0)
+    load_duration = args.load_ms / 1000
+    
+    legacy_stalls = legacy_restart_stalls(args.restarts, rng)
+    scheduler_stalls = scheduler_restart_stalls(root, args.restarts, rng)
+    print(f"restart stall     legacy median {statistics.median(legacy_stalls) * 1000:8.1f} ms  "
+          f"max {max(legacy_stalls) * 1000:8.1f} ms")
+    print(f"                  scheduler median {statistics.median(scheduler_stalls) * 1e6:5.1f} us  "
+          f"max {max(scheduler_stalls) * 1e6:8.1f} us")
+          
+    legacy_late = legacy_lateness(root, args.seconds, args.load_every, load_duration)
+    scheduler_late, longest_gap = scheduler_lateness(root, args.seconds, args.load_every, load_duration)
+    print(f"{args.seconds} s countdown with {args.load_ms:.0f} ms of work every {args.load_every} ms:")
+    print(f"                  legacy finished {legacy_late * 1000:7.1f} ms late")
+    print(f"                  scheduler finished {scheduler_late * 1000:4.1f} ms late, "
+          f"longest gap between ticks {longest_gap * 1000:.0f} ms")
+          
+    start_time, per_tick = tick_cost(root, args.timers)
+    print(f"{args.timers} timers   start {start_time * 1000:.1f} ms, {per_tick * 1e6:.1f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Tournament Load Test
+------------------------------------
+Hosts increasing numbers of simultaneous games in one asyncio process, each driven
+by a simulated host, and reports how the latency of each command scales with the
+number of games.
+
+Usage:
+    python benchmarks/bench_tournament.py --games 1 10 30 100 --pace 0.002
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tournament import SharedPack, TournamentGame, simulated_host, summarize_latencies
+from synthetic import make_game_data
+
+
+async def host_games(pack, num_games, pace):
+    """Play games side by side until all of them are over.
+    
+    Args:
+        pack (SharedPack): The shared question pack
+        num_games (int): Number of simultaneous games
+        pace (float): Mean seconds each host waits between commands
+        
+    Returns:
+        list: The TournamentGame objects
+    """
+    teams = [{"name": f"Team {i}", "score": 0, "color": "#3498db"} for i in range(1, 4)]
+    games = [TournamentGame(f"G{i}", pack, teams) for i in range(num_games)]
+    
+    async def play(game, seed):
+        run = asyncio.create_task(game.run())
+        await simulated_host(pace=pace, seed=seed)(game)
+        await run
+        
+    await asyncio.gather(*(play(game, seed) for seed, game in enumerate(games)))
+    return games
+
+
+def main():
+    """Run the tournament load test."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, nargs="+", default=[1, 10, 30, 100], help="simultaneous games")
+    parser.add_argument("--categories", type=int, default=6, help="categories in each regular round")
+    parser.add_argument("--pace", type=float, default=0.002, help="mean seconds between host commands")
+    args = parser.parse_args()
+    
+    pack = SharedPack(make_game_data(args.categories))
+    
+    print(f"{'games':>6} {'commands':>9} {'commands/s':>11} {'median':>10} {'p99':>10} {'max':>10}")
+    for num_games in args.games:
+        start = time.perf_counter()
+        games = asyncio.run(host_games(pack, num_games, args.pace))
+        elapsed = time.perf_counter() - start
+        stats = summarize_latencies(games)
+        print(f"{num_games:6d} {stats['commands']:9d} {stats['commands'] / elapsed:11.0f} "
+              f"{stats['median'] * 1e6:7.0f} us {stats['p99'] * 1e6:7.0f} us {stats['max'] * 1e6:7.0f} us")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
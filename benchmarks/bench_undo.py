@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Undo Benchmark
+------------------------------
+Times undo and redo of rulings on boards of increasing size, against keeping a
+deep copy of the game state for every step.
+
+Usage:
+    python benchmarks/bench_undo.py --sizes 6 60 600
+"""
+
+import argparse
+import copy
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jeopardy_core import JeopardyGame, build_rounds
+from history import GameHistory
+from synthetic import make_game_data
+
+
+def new_game(num_categories):
+    """Create a three-team game on a synthetic board.
+    
+    Args:
+        num_categories (int): Number of categories in each regular round
+        
+    Returns:
+        JeopardyGame: The game
+    """
+    game = JeopardyGame(teams=[{"name": f"Team {i}", "score": 0, "color": "#3498db"} for i in range(1, 4)])
+    game_data = make_game_data(num_categories)
+    game.install_rounds(build_rounds(game_data), game_data["daily_doubles"])
+    return game
+
+
+def main():
+    """Run the undo benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 60, 600], help="categories per round")
+    parser.add_argument("--steps", type=int, default=25, help="rulings to undo and redo")
+    args = parser.parse_args()
+    
+    print(f"{'categories':>10} {'undo':>10} {'redo':>10} {'deep copy':>12}")
+    for size in args.sizes:
+        game = new_game(size)
+        history = GameHistory(game)
+        questions = list(game.current_round.iter_questions())[:args.steps]
+        
+        copy_timings = []
+        for index, question in enumerate(questions):
+            # What a copy-based undo stack would pay before every ruling
+            start = time.perf_counter()
+            copy.deepcopy((game.teams, game.rounds, game.current_team_id))
+            copy_timings.append(time.perf_counter() - start)
+            game.rule(question, game.teams[index % len(game.teams)]["id"], index % 3 != 0)
+            
+        undo_timings = []
+        for _ in questions:
+            start = time.perf_counter()
+            history.undo()
+            undo_timings.append(time.perf_counter() - start)
+            
+        redo_timings = []
+        for _ in questions:
+            start = time.perf_counter()
+            history.redo()
+            redo_timings.append(time.perf_counter() - start)
+            
+        print(f"{size:10d} {statistics.median(undo_timings) * 1e6:7.1f} us {statistics.median(redo_timings) * 1e6:7.1f} us "
+              f"{statistics.median(copy_timings) * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Vectorized Round Parsing Benchmark
+--------------------------------------------------
+Compares the column-wise round parser against the row-by-row iterrows loop, and
+checks that both give the same game data, also for a sheet of unusual cells.
+
+Usage:
+    python benchmarks/bench_vectorized.py --categories 10000 --repeats 3
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ROUND_NAMES, JEOPARDY_VALUES
+from jeopardy_core import PackParser
+from synthetic import make_round_frame
+
+
+def time_parser(parse_round, df, repeats):
+    """Time repeated parses of a round DataFrame.
+    
+    Args:
+        parse_round (callable): The round parsing method
+        df (DataFrame): The round sheet
+        repeats (int): Number of timed parses
+        
+    Returns:
+        tuple: (median seconds, last game data)
+    """
+    timings = []
+    game_data = None
+    for _ in range(repeats):
+        game_data = {"rounds": {ROUND_NAMES[0]: {"categories": [], "questions": {}}}}
+        start = time.perf_counter()
+        parse_round(df, game_data, ROUND_NAMES[0], JEOPARDY_VALUES)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), game_data
+
+
+def edge_case_frame():
+    """Build a round sheet of cells the question text rules treat specially.
+    
+    Returns:
+        DataFrame: A round sheet with blank, numeric, question-only and newline-separated
+            cells, including a column where no cell has an answer
+    """
+    import pandas as pd
+    
+    return pd.DataFrame(
+        [
+            ['Only questions', 'only a question', 'another question', None, 'Question: Q | Answer: A'],
+            ['Mixed', None, 'Question: Q\nAnswer: A', 42, 'Q | A | extra'],
+            [None, 'no category', '', 'plain', 'Question: | Answer: A'],
+            ['Blank', None, None, None, '   ']
+        ],
+        columns=['Category'] + [f'Question {i+1}' for i in range(4)]
+    )
+
+
+def main():
+    """Run the vectorized parsing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=10000, help="categories in the round sheet")
+    parser.add_argument("--repeats", type=int, default=3, help="timed parses per mode")
+    args = parser.parse_args()
+    
+    pack_parser = PackParser()
+    df = make_round_frame(args.categories, JEOPARDY_VALUES)
+    
+    loop_time, loop_data = time_parser(pack_parser._parse_jeopardy_round, df, args.repeats)
+    vector_time, vector_data = time_parser(pack_parser._parse_jeopardy_round_vectorized, df, args.repeats)
+    
+    print(f"categories: {args.categories}")
+    print(f"iterrows loop: {loop_time * 1000:9.1f} ms")
+    print(f"vectorized:    {vector_time * 1000:9.1f} ms  ({loop_time / vector_time:.1f}x)")
+    print(f"identical game data: {loop_data == vector_data}")
+    
+    edge_df = edge_case_frame()
+    _, loop_edge = time_parser(pack_parser._parse_jeopardy_round, edge_df, 1)
+    _, vector_edge = time_parser(pack_parser._parse_jeopardy_round_vectorized, edge_df, 1)
+    print(f"identical game data for unusual cells: {loop_edge == vector_edge}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
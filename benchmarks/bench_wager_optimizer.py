@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Wager Optimizer Benchmark
+-----------------------------------------
+Recomputes Final Jeopardy advice after every score change of simulated games, as
+a live host panel would, and reports the time per recomputation with an empty
+and with a warm cache.
+
+Usage:
+    python benchmarks/bench_wager_optimizer.py --teams 2 3 4 6 --games 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES
+import wager_optimizer
+
+
+def score_sequences(num_teams, num_games, rng):
+    """Generate the scores after every ruling of random games.
+    
+    Args:
+        num_teams (int): Number of teams
+        num_games (int): Number of games
+        rng (Random): Source of rulings
+        
+    Returns:
+        list: Score tuples, one per ruling
+    """
+    sequences = []
+    for _ in range(num_games):
+        scores = [0] * num_teams
+        for values in (JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES):
+            for value in values * 6:
+                team = rng.randrange(num_teams)
+                scores[team] += value if rng.random() < 0.6 else -value
+                sequences.append(tuple(scores))
+    return sequences
+
+
+def time_advice(sequences):
+    """Time Final Jeopardy advice for each score tuple.
+    
+    Args:
+        sequences (list): Score tuples
+        
+    Returns:
+        list: Seconds taken for each
+    """
+    timings = []
+    for scores in sequences:
+        start = time.perf_counter()
+        wager_optimizer.final_wager_advice(scores)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    """Run the wager optimizer benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, nargs="+", default=[2, 3, 4, 6], help="numbers of teams")
+    parser.add_argument("--games", type=int, default=20, help="games played for each number of teams")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    print(f"{'teams':>5} {'changes':>8} {'cold median':>12} {'cold max':>10} {'warm median':>12}")
+    for num_teams in args.teams:
+        sequences = score_sequences(num_teams, args.games, rng)
+        wager_optimizer._final_wager_advice.cache_clear()
+        cold = time_advice(sequences)
+        warm = time_advice(sequences)
+        print(f"{num_teams:5d} {len(sequences):8d} {statistics.median(cold) * 1000:9.2f} ms "
+              f"{max(cold) * 1000:7.2f} ms {statistics.median(warm) * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
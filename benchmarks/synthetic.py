@@ -0,0 +1,141 @@
+"""
+Jeopardy Game - Synthetic Benchmark Data
+----------------------------------------
+This module builds synthetic question packs for the benchmark scripts.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import EXCEL_SHEET_NAMES, ROUND_NAMES, JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES
+
+
+def qa_text(round_index, category_index, row_index):
+    """Return the cell text for a synthetic question.
+    
+    Args:
+        round_index (int): The index of the round
+        category_index (int): The index of the category
+        row_index (int): The row (value) index of the question
+        
+    Returns:
+        str: Text in the "Question: X | Answer: Y" format
+    """
+    return (f"Question: Synthetic clue {round_index}.{category_index}.{row_index} "
+            f"| Answer: Response {round_index}.{category_index}.{row_index}")
+
+
+def write_workbook(path, num_categories, daily_doubles=True, round_values=None):
+    """Write a synthetic question workbook.
+    
+    Args:
+        path (str): Path of the .xlsx file to create
+        num_categories (int): Number of categories in each regular round
+        daily_doubles (bool, optional): Whether to include a Daily Doubles sheet. Defaults to True.
+        round_values (tuple, optional): Value ladders of the two regular rounds, written to a
+            Values sheet. Defaults to the standard ladders, without a Values sheet.
+        
+    Returns:
+        str: The path of the created workbook
+    """
+    from openpyxl import Workbook
+    
+    ladders = round_values or (JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES)
+    workbook = Workbook(write_only=True)
+    for round_index, values in enumerate(ladders):
+        sheet = workbook.create_sheet(EXCEL_SHEET_NAMES[round_index])
+        sheet.append(['Category'] + [f'Question {i+1}' for i in range(len(values))])
+        for category_index in range(num_categories):
+            sheet.append(
+                [f'Category {round_index}-{category_index}'] +
+                [qa_text(round_index, category_index, row_index) for row_index in range(len(values))]
+            )
+    
+    final_sheet = workbook.create_sheet(EXCEL_SHEET_NAMES[2])
+    final_sheet.append(['Item', 'Value'])
+    final_sheet.append(['Category', 'Final Category'])
+    final_sheet.append(['Question', 'Final question text'])
+    final_sheet.append(['Answer', 'Final answer text'])
+    
+    if daily_doubles:
+        dd_sheet = workbook.create_sheet('Daily Doubles')
+        dd_sheet.append(['Round', 'Category', 'Value'])
+        dd_sheet.append([ROUND_NAMES[0], 'Category 0-0', ladders[0][min(2, len(ladders[0]) - 1)]])
+        dd_sheet.append([ROUND_NAMES[1], f'Category 1-{num_categories - 1}', ladders[1][min(3, len(ladders[1]) - 1)]])
+        dd_sheet.append([ROUND_NAMES[1], f'Category 1-{num_categories // 2}', ladders[1][min(4, len(ladders[1]) - 1)]])
+        
+    if round_values:
+        values_sheet = workbook.create_sheet('Values')
+        values_sheet.append(['Round', 'Values'])
+        for round_name, values in zip(ROUND_NAMES, round_values):
+            values_sheet.append([round_name, ', '.join(str(value) for value in values)])
+    
+    workbook.save(path)
+    return path
+
+
+def make_round_frame(num_categories, values):
+    """Build a round sheet as a DataFrame without writing a workbook.
+    
+    Args:
+        num_categories (int): Number of categories (rows)
+        values (list): The point values for the round
+        
+    Returns:
+        DataFrame: A DataFrame shaped like a parsed round sheet
+    """
+    import pandas as pd
+    
+    rows = [
+        [f'Category {category_index}'] + [qa_text(0, category_index, row_index) for row_index in range(len(values))]
+        for category_index in range(num_categories)
+    ]
+    return pd.DataFrame(rows, columns=['Category'] + [f'Question {i+1}' for i in range(len(values))])
+
+
+WORDS = [
+    "atlas", "baroque", "comet", "delta", "ember", "fjord", "glacier", "harbor", "island", "jungle",
+    "kepler", "lagoon", "meteor", "nebula", "orchid", "prairie", "quartz", "rapids", "savanna", "tundra",
+    "umbra", "volcano", "walrus", "xenon", "yonder", "zephyr", "sonnet", "fugue", "sprocket", "telegraph"
+]
+
+
+def make_game_data(num_categories, seed=0, round_values=None):
+    """Build parsed game data with varied clue text, without writing a workbook.
+    
+    Args:
+        num_categories (int): Number of categories in each regular round
+        seed (int, optional): Seed for the clue text. Defaults to 0.
+        round_values (tuple, optional): Value ladders of the two regular rounds.
+            Defaults to the standard ladders.
+        
+    Returns:
+        dict: Game data in the shape returned by PackParser.read_game_data
+    """
+    import random
+    
+    rng = random.Random(seed)
+    rounds = {}
+    for round_index, values in enumerate(round_values or (JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES)):
+        categories = [f"{rng.choice(WORDS).title()} {seed}-{round_index}-{i}" for i in range(num_categories)]
+        questions = {
+            category: {
+                value: {
+                    "question": " ".join(rng.choice(WORDS) for _ in range(8)),
+                    "answer": rng.choice(WORDS),
+                    "is_daily_double": False
+                }
+                for value in values
+            }
+            for category in categories
+        }
+        rounds[ROUND_NAMES[round_index]] = {"categories": categories, "values": list(values), "questions": questions}
+    
+    rounds[ROUND_NAMES[2]] = {
+        "category": f"Final {seed}",
+        "question": " ".join(rng.choice(WORDS) for _ in range(10)),
+        "answer": rng.choice(WORDS)
+    }
+    return {"rounds": rounds, "daily_doubles": []}
\ No newline at end of file
@@ -0,0 +1,470 @@
+"""
+Jeopardy Game - Board View
+--------------------------
+This module draws the game board for a round. The board is created once per
+round and kept while other screens are shown; afterwards only the tiles whose
+state changed are redrawn, so returning to the board after a clue costs a few
+updates instead of rebuilding the whole grid.
+
+Two renderers are available: a grid of Tk widgets, and a single canvas for very
+large boards. BOARD_RENDERER in config.py selects one.
+
+Every build and update is timed, so the cost per update can be checked on large
+boards.
+"""
+
+import abc
+import statistics
+import time
+import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
+from tkinter import ttk
+
+from config import (
+    BG_COLOR, TEXT_COLOR, PLAYED_COLOR, DAILY_DOUBLE_COLOR,
+    CATEGORY_FONT, VALUE_FONT, BOARD_TIMING_SAMPLES
+)
+
+# States a tile can be drawn in
+OPEN = "open"
+DAILY_DOUBLE = "daily_double"
+PLAYED = "played"
+
+# Space between the tiles of a canvas board, in pixels on each side of a tile
+_GAP = 2
+
+
+def _scaled_font(font, scale):
+    """Scale a font tuple, keeping it readable.
+    
+    Args:
+        font (tuple): Font of the form (family, size, *styles)
+        scale (float): Factor to scale the size by
+        
+    Returns:
+        tuple: The scaled font
+    """
+    return (font[0], max(8, round(font[1] * scale))) + tuple(font[2:])
+
+
+def tile_state(question):
+    """Get the state a question's tile should be drawn in.
+    
+    Args:
+        question (Question): The question, or None for an empty tile
+        
+    Returns:
+        str: OPEN, DAILY_DOUBLE or PLAYED
+    """
+    if question is None or question.played:
+        return PLAYED
+    return DAILY_DOUBLE if question.is_daily_double else OPEN
+
+
+class BoardTimings:
+    """Running timings of board builds and updates."""
+    
+    def __init__(self, samples=BOARD_TIMING_SAMPLES):
+        """Initialize a BoardTimings object.
+        
+        Args:
+            samples (int, optional): Most recent timings kept per operation. Defaults to
+                BOARD_TIMING_SAMPLES.
+        """
+        self.samples = samples
+        self.timings = {}  # Dict of form {operation: deque of seconds}
+        self.counts = {}  # Dict of form {operation: number of times timed}
+    
+    @contextmanager
+    def measure(self, operation):
+        """Time the code run inside the with block.
+        
+        Args:
+            operation (str): Name of the operation, such as "build" or "tile"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(operation, time.perf_counter() - start)
+    
+    def record(self, operation, seconds):
+        """Record one timing.
+        
+        Args:
+            operation (str): Name of the operation
+            seconds (float): Time the operation took
+        """
+        if operation not in self.timings:
+            self.timings[operation] = deque(maxlen=self.samples)
+            self.counts[operation] = 0
+        self.timings[operation].append(seconds)
+        self.counts[operation] += 1
+    
+    def summary(self):
+        """Summarize the recent timings of each operation.
+        
+        Returns:
+            dict: Dict of form {operation: {"count", "median", "p99", "max"}}, with the
+                count of all timings and the statistics, in seconds, of the recent ones
+        """
+        summary = {}
+        for operation, timings in self.timings.items():
+            ordered = sorted(timings)
+            summary[operation] = {
+                "count": self.counts[operation],
+                "median": statistics.median(ordered),
+                "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+                "max": ordered[-1]
+            }
+        return summary
+
+
+class BoardView(abc.ABC):
+    """Base class for game boards that are built once per round and updated tile by tile.
+    
+    Subclasses create the board's widget and tiles and paint a tile in a given state.
+    """
+    
+    def __init__(self, parent, on_select, timings=None):
+        """Initialize a BoardView object.
+        
+        Args:
+            parent (tk.Widget): The widget to show the board in
+            on_select (callable): Called as on_select(category, value) when an open tile
+                is clicked
+            timings (BoardTimings, optional): Where to record timings. Defaults to a new
+                BoardTimings.
+        """
+        self.parent = parent
+        self.on_select = on_select
+        self.timings = timings or BoardTimings()
+        self.widget = self._create_widget()
+        self.round = None
+        self.layout = None  # The (categories, values) the board was built for
+        self.states = []  # states[i][j] is the state of the tile for category i and value j
+    
+    def show(self, jeopardy_round):
+        """Show the board of a round, building it only if the round's layout changed.
+        
+        Args:
+            jeopardy_round (JeopardyRound): The round to show
+        """
+        layout = (tuple(jeopardy_round.categories), tuple(jeopardy_round.values))
+        if jeopardy_round is not self.round or layout != self.layout:
+            with self.timings.measure("build"):
+                self._build(jeopardy_round, layout)
+        else:
+            with self.timings.measure("sync"):
+                self.sync()
+                
+        if not self.widget.winfo_manager():
+            self.widget.pack(fill=tk.BOTH, expand=True)
+    
+    def hide(self):
+        """Hide the board, keeping it for when it is shown again."""
+        self.widget.pack_forget()
+    
+    def is_showing(self):
+        """Check whether the board is on screen.
+        
+        Returns:
+            bool: True if the board is showing
+        """
+        return bool(self.widget.winfo_manager())
+    
+    def refresh(self, category, value):
+        """Redraw one tile if the board is showing.
+        
+        Args:
+            category (str): The category of the tile
+            value (int): The point value of the tile
+            
+        Returns:
+            bool: True if the tile was redrawn, False if the board is hidden or shows
+                another round
+        """
+        if self.round is None or not self.is_showing():
+            return False
+        position = self.round.position(category, value)
+        if position is None:
+            return False
+            
+        with self.timings.measure("tile"):
+            i, j = position
+            self._draw_tile(i, j, tile_state(self.round.get_question(category, value)))
+        return True
+    
+    def sync(self):
+        """Redraw every tile whose question changed state since it was drawn."""
+        jeopardy_round = self.round
+        for i, category in enumerate(self.layout[0]):
+            for j, value in enumerate(self.layout[1]):
+                self._draw_tile(i, j, tile_state(jeopardy_round.get_question(category, value)))
+    
+    def _build(self, jeopardy_round, layout):
+        """Build the board for a round, replacing that of the previous one.
+        
+        Args:
+            jeopardy_round (JeopardyRound): The round to build
+            layout (tuple): The round's categories and values
+        """
+        # A new widget starts without the previous round's tiles or grid configuration
+        self.widget.destroy()
+        self.widget = self._create_widget()
+        self.round = jeopardy_round
+        self.layout = layout
+        categories, values = layout
+        self.states = [[None] * len(values) for _ in categories]
+        
+        # Shrink the text on boards larger than the standard 6x5 so every tile fits
+        scale = min(1.0, 6 / max(len(categories), 1), 5 / max(len(values), 1))
+        self._create_tiles(scale)
+        self.sync()
+    
+    def _draw_tile(self, i, j, state):
+        """Repaint a tile if it is not already drawn in the given state.
+        
+        Args:
+            i (int): The index of the tile's category
+            j (int): The index of the tile's value
+            state (str): OPEN, DAILY_DOUBLE or PLAYED
+        """
+        if self.states[i][j] != state:
+            self._paint_tile(i, j, state)
+            self.states[i][j] = state
+    
+    @abc.abstractmethod
+    def _create_widget(self):
+        """Create the widget the board is drawn in.
+        
+        Returns:
+            tk.Widget: The widget, not yet placed in its parent
+        """
+    
+    @abc.abstractmethod
+    def _create_tiles(self, scale):
+        """Create the category headings and tiles of the current layout.
+        
+        Args:
+            scale (float): Factor to scale the fonts by
+        """
+    
+    @abc.abstractmethod
+    def _paint_tile(self, i, j, state):
+        """Draw a tile in the given state.
+        
+        Args:
+            i (int): The index of the tile's category
+            j (int): The index of the tile's value
+            state (str): OPEN, DAILY_DOUBLE or PLAYED
+        """
+
+
+class WidgetBoardView(BoardView):
+    """A game board with a Tk label for each category and a Tk button for each tile."""
+    
+    def _create_widget(self):
+        """Create the frame the board's widgets are gridded in.
+        
+        Returns:
+            ttk.Frame: The frame
+        """
+        self.category_labels = []
+        self.tiles = []  # tiles[i][j] is the button for category i and value j
+        return ttk.Frame(self.parent)
+    
+    def _create_tiles(self, scale):
+        """Create a label for each category and a button for each tile.
+        
+        Args:
+            scale (float): Factor to scale the fonts by
+        """
+        categories, values = self.layout
+        num_categories = len(categories)
+        value_font = _scaled_font(VALUE_FONT, scale)
+        
+        # Make all columns and rows equal size
+        for i in range(num_categories):
+            self.widget.columnconfigure(i, weight=1, uniform="category")
+        for j in range(len(values)):
+            self.widget.rowconfigure(j + 1, weight=1, uniform="value")
+            
+        wraplength = max(60, int(150 * min(1.0, 6 / max(num_categories, 1))))
+        for i, category in enumerate(categories):
+            category_label = tk.Label(
+                self.widget,
+                text=category,
+                font=_scaled_font(CATEGORY_FONT, scale),
+                bg=BG_COLOR,
+                fg=TEXT_COLOR,
+                wraplength=wraplength,
+                height=2,
+                justify=tk.CENTER
+            )
+            category_label.grid(row=0, column=i, sticky="nsew", padx=2, pady=2)
+            self.category_labels.append(category_label)
+            
+        # Every tile is a button for its whole life; played tiles are disabled and blanked
+        self.tiles = [[] for _ in range(num_categories)]
+        for i, category in enumerate(categories):
+            for j, value in enumerate(values):
+                tile = tk.Button(
+                    self.widget,
+                    font=value_font,
+                    fg=TEXT_COLOR,
+                    bd=2,
+                    command=lambda cat=category, val=value: self.on_select(cat, val)
+                )
+                tile.grid(row=j + 1, column=i, sticky="nsew", padx=2, pady=2)
+                self.tiles[i].append(tile)
+    
+    def _paint_tile(self, i, j, state):
+        """Reconfigure a tile's button for the given state.
+        
+        Args:
+            i (int): The index of the tile's category
+            j (int): The index of the tile's value
+            state (str): OPEN, DAILY_DOUBLE or PLAYED
+        """
+        if state == PLAYED:
+            self.tiles[i][j].configure(text="", bg=PLAYED_COLOR, relief=tk.FLAT, state=tk.DISABLED)
+        else:
+            self.tiles[i][j].configure(
+                text=f"${self.layout[1][j]}",
+                bg=DAILY_DOUBLE_COLOR if state == DAILY_DOUBLE else BG_COLOR,
+                relief=tk.RAISED,
+                state=tk.NORMAL
+            )
+
+
+class CanvasBoardView(BoardView):
+    """A game board drawn as rectangles and text on a single Tk canvas.
+    
+    The whole board is one widget, so even boards of hundreds of tiles are cheap to
+    build and lay out. Tile positions are computed once per resize and clicks are
+    mapped to tiles arithmetically, without searching the canvas items.
+    """
+    
+    def _create_widget(self):
+        """Create the canvas the board is drawn on.
+        
+        Returns:
+            tk.Canvas: The canvas
+        """
+        self.category_items = []  # (rectangle, text) canvas items of each category
+        self.tile_items = []  # tile_items[i][j] is the (rectangle, text) of a tile
+        self.size = None  # The (width, height) the items were laid out for
+        self.cell_size = None  # The (width, height) of one cell in that layout
+        canvas = tk.Canvas(self.parent, highlightthickness=0)
+        canvas.bind("<Configure>", self._resized)
+        canvas.bind("<Button-1>", self._clicked)
+        return canvas
+    
+    def _create_tiles(self, scale):
+        """Create the canvas items for each category and tile.
+        
+        Args:
+            scale (float): Factor to scale the fonts by
+        """
+        categories, values = self.layout
+        canvas = self.widget
+        category_font = _scaled_font(CATEGORY_FONT, scale)
+        value_font = _scaled_font(VALUE_FONT, scale)
+        
+        # Items are created at the origin and placed by _lay_out
+        for category in categories:
+            self.category_items.append((
+                canvas.create_rectangle(0, 0, 0, 0, fill=BG_COLOR, outline=""),
+                canvas.create_text(0, 0, text=category, font=category_font, fill=TEXT_COLOR,
+                                   justify=tk.CENTER)
+            ))
+            
+        self.tile_items = [
+            [
+                (canvas.create_rectangle(0, 0, 0, 0, outline=""),
+                 canvas.create_text(0, 0, font=value_font, fill=TEXT_COLOR))
+                for _ in values
+            ]
+            for _ in categories
+        ]
+        
+        width = max(canvas.winfo_width(), int(canvas["width"]))
+        height = max(canvas.winfo_height(), int(canvas["height"]))
+        self._lay_out(width, height)
+    
+    def _paint_tile(self, i, j, state):
+        """Recolor a tile's rectangle and set its text for the given state.
+        
+        Args:
+            i (int): The index of the tile's category
+            j (int): The index of the tile's value
+            state (str): OPEN, DAILY_DOUBLE or PLAYED
+        """
+        rectangle, text = self.tile_items[i][j]
+        if state == PLAYED:
+            self.widget.itemconfigure(rectangle, fill=PLAYED_COLOR)
+            self.widget.itemconfigure(text, text="")
+        else:
+            self.widget.itemconfigure(rectangle, fill=DAILY_DOUBLE_COLOR if state == DAILY_DOUBLE else BG_COLOR)
+            self.widget.itemconfigure(text, text=f"${self.layout[1][j]}")
+    
+    def _lay_out(self, width, height):
+        """Place every item for a canvas of the given size.
+        
+        Args:
+            width (int): Width of the canvas in pixels
+            height (int): Height of the canvas in pixels
+        """
+        categories, values = self.layout
+        canvas = self.widget
+        cell_width = width / max(len(categories), 1)
+        cell_height = height / (len(values) + 1)
+        self.size = (width, height)
+        self.cell_size = (cell_width, cell_height)
+        
+        for i, (rectangle, text) in enumerate(self.category_items):
+            left = i * cell_width
+            canvas.coords(rectangle, left + _GAP, _GAP, left + cell_width - _GAP, cell_height - _GAP)
+            canvas.coords(text, left + cell_width / 2, cell_height / 2)
+            canvas.itemconfigure(text, width=max(1, int(cell_width - 4 * _GAP)))
+            
+            for j, (tile_rectangle, tile_text) in enumerate(self.tile_items[i]):
+                top = (j + 1) * cell_height
+                canvas.coords(tile_rectangle, left + _GAP, top + _GAP,
+                              left + cell_width - _GAP, top + cell_height - _GAP)
+                canvas.coords(tile_text, left + cell_width / 2, top + cell_height / 2)
+    
+    def _resized(self, event):
+        """Lay the board out again when the canvas changes size.
+        
+        Args:
+            event (tk.Event): The Configure event
+        """
+        if self.layout is None or (event.width, event.height) == self.size:
+            return
+        with self.timings.measure("layout"):
+            self._lay_out(event.width, event.height)
+    
+    def _clicked(self, event):
+        """Select the open tile under the mouse, if any.
+        
+        Args:
+            event (tk.Event): The Button-1 event
+        """
+        if self.cell_size is None:
+            return
+        cell_width, cell_height = self.cell_size
+        i = int(event.x // cell_width)
+        j = int(event.y // cell_height) - 1
+        categories, values = self.layout
+        if 0 <= i < len(categories) and 0 <= j < len(values) and self.states[i][j] != PLAYED:
+            self.on_select(categories[i], values[j])
+
+
+# Board renderers by the names used for BOARD_RENDERER in config.py
+BOARD_VIEWS = {
+    "widgets": WidgetBoardView,
+    "canvas": CanvasBoardView
+}
\ No newline at end of file
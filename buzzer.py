@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Buzzer Server
+-----------------------------
+This module lets teams buzz in from phones or laptops on the local network.
+Buzzes are UDP datagrams of the form {"team": "Team 1", "token": "3fa9c1", "id": 7};
+the server replies to each with {"id": 7, "result": "won", "at": <receipt time>}.
+The token is a random join token made for each game and shown to the host, so
+only players in the room can buzz in; buzzes without it are answered "denied".
+
+Every buzz is timestamped with the monotonic clock as soon as it is received and
+arbitrated on the spot, so the first valid buzz wins in the order the network
+delivered them. A team that buzzes while the clue is still being read is locked
+out for a short time, as on the show.
+
+Usage:
+    python buzzer.py --team "Team 1" --server 192.168.1.20 --token 3fa9c1
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import secrets
+import socket
+import threading
+import time
+
+from config import BUZZER_HOST, BUZZER_PORT, BUZZER_EARLY_LOCKOUT, BUZZER_RECEIVE_BUFFER, BUZZER_TOKEN_BYTES
+
+
+def new_token():
+    """Make a random join token for a game.
+    
+    Returns:
+        str: The token, as hex digits
+    """
+    return secrets.token_hex(BUZZER_TOKEN_BYTES)
+
+
+class BuzzerArbiter:
+    """Decides which team buzzed in first on each clue.
+    
+    A clue is armed while it is read, opened when the host is done reading and
+    closed once it has been ruled on. Buzzes while armed lock the team out for the
+    lockout time; the first buzz after opening from a team not locked out wins.
+    """
+    
+    CLOSED = "closed"
+    ARMED = "armed"
+    OPEN = "open"
+    WON = "won"
+    
+    def __init__(self, lockout=BUZZER_EARLY_LOCKOUT, clock=time.monotonic):
+        """Initialize a BuzzerArbiter object.
+        
+        Args:
+            lockout (float, optional): Seconds a team is locked out for buzzing early.
+                Defaults to BUZZER_EARLY_LOCKOUT.
+            clock (callable, optional): Monotonic clock in seconds. Defaults to time.monotonic.
+        """
+        self.lockout = lockout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.teams = {}  # Dict of form {casefolded name: name}
+        self.winner = None
+        self.reaction_time = None
+        self.opened_at = None
+        self._locked_until = {}  # Dict of form {casefolded name: clock time}
+    
+    def set_teams(self, names):
+        """Set the teams allowed to buzz in.
+        
+        Args:
+            names (list): The team names
+        """
+        self.teams = {name.strip().casefold(): name for name in names}
+    
+    def arm(self):
+        """Start a new clue; buzzes are early until it is opened."""
+        self.state = self.ARMED
+        self.winner = None
+        self.reaction_time = None
+        self.opened_at = None
+        self._locked_until.clear()
+    
+    def open(self, now=None):
+        """Let teams buzz in.
+        
+        Args:
+            now (float, optional): Clock time the buzzers opened. Defaults to now.
+        """
+        self.state = self.OPEN
+        self.opened_at = self.clock() if now is None else now
+    
+    def close(self):
+        """Stop accepting buzzes until the next clue is armed."""
+        self.state = self.CLOSED
+    
+    def buzz(self, team, now):
+        """Arbitrate a buzz.
+        
+        Args:
+            team (str): The name of the team that buzzed
+            now (float): Clock time the buzz was received
+            
+        Returns:
+            str: "won", "early", "locked", "late", "closed" or "unknown"
+        """
+        key = str(team).strip().casefold()
+        if key not in self.teams:
+            return "unknown"
+        if self.state == self.ARMED:
+            self._locked_until[key] = now + self.lockout
+            return "early"
+        if self.state == self.CLOSED:
+            return "closed"
+        if self.state == self.WON:
+            return "late"
+        if self._locked_until.get(key, 0) > now:
+            return "locked"
+            
+        self.state = self.WON
+        self.winner = self.teams[key]
+        self.reaction_time = now - self.opened_at
+        return "won"
+
+
+class _BuzzerProtocol(asyncio.DatagramProtocol):
+    """Receives buzzes and answers each one with the arbiter's decision."""
+    
+    def __init__(self, server):
+        """Initialize a _BuzzerProtocol object.
+        
+        Args:
+            server (BuzzerServer): The server the protocol serves
+        """
+        self.server = server
+        self.transport = None
+    
+    def connection_made(self, transport):
+        """Keep the transport for sending replies."""
+        self.transport = transport
+    
+    def datagram_received(self, data, addr):
+        """Timestamp, arbitrate and answer a buzz.
+        
+        Args:
+            data (bytes): The datagram
+            addr (tuple): The sender's address
+        """
+        now = time.monotonic()
+        try:
+            message = json.loads(data)
+            team = message["team"]
+            token = str(message.get("token", ""))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return  # Not a buzz
+            
+        server = self.server
+        with server.lock:
+            if hmac.compare_digest(token.encode(), server.token.encode()):
+                result = server.arbiter.buzz(team, now)
+            else:
+                result = "denied"
+            winner = server.arbiter.winner
+            reaction_time = server.arbiter.reaction_time
+            
+        reply = {"id": message.get("id"), "result": result, "at": now}
+        self.transport.sendto(json.dumps(reply, separators=(",", ":")).encode(), addr)
+        
+        if result == "won" and server.on_winner:
+            server.on_winner(winner, reaction_time)
+
+
+class BuzzerServer:
+    """Runs a BuzzerArbiter behind a UDP socket on a background thread.
+    
+    The control methods may be called from any thread and take effect at once, so a
+    buzz received after the host opens the buzzers is never judged early. on_winner
+    is called on the server thread with the winning team's name and its reaction
+    time in seconds. Only buzzes carrying the server's join token are arbitrated.
+    """
+    
+    def __init__(self, arbiter=None, host=BUZZER_HOST, port=BUZZER_PORT, on_winner=None, token=None):
+        """Initialize a BuzzerServer object.
+        
+        Args:
+            arbiter (BuzzerArbiter, optional): The arbiter. Defaults to a new one.
+            host (str, optional): Address to listen on. Defaults to BUZZER_HOST.
+            port (int, optional): UDP port to listen on, or 0 for any free port.
+                Defaults to BUZZER_PORT.
+            on_winner (callable, optional): Called as on_winner(team_name, reaction_time).
+                Defaults to None.
+            token (str, optional): The join token buzzes must carry. Defaults to a new
+                random one.
+        """
+        self.arbiter = arbiter or BuzzerArbiter()
+        self.token = token or new_token()
+        self.host = host
+        self.port = port
+        self.on_winner = on_winner
+        self.lock = threading.Lock()
+        self.address = None
+        self._loop = None
+        self._thread = None
+        self._transport = None
+    
+    def start(self):
+        """Bind the socket and start serving on a background thread.
+        
+        Raises:
+            OSError: If the socket could not be bound
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            # A burst of buzzes from hundreds of clients must not overflow the socket
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, BUZZER_RECEIVE_BUFFER)
+            sock.bind((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        self.address = sock.getsockname()
+        
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        
+        def serve():
+            asyncio.set_event_loop(self._loop)
+            self._transport, _ = self._loop.run_until_complete(
+                self._loop.create_datagram_endpoint(lambda: _BuzzerProtocol(self), sock=sock)
+            )
+            ready.set()
+            self._loop.run_forever()
+            self._transport.close()
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+            
+        self._thread = threading.Thread(target=serve, daemon=True)
+        self._thread.start()
+        ready.wait()
+    
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+    
+    def new_game(self):
+        """Replace the join token for a new game; buzzers must join again with the new one.
+        
+        Returns:
+            str: The new token
+        """
+        with self.lock:
+            self.token = new_token()
+            self.arbiter.close()
+        return self.token
+    
+    def set_teams(self, names):
+        """Set the teams allowed to buzz in.
+        
+        Args:
+            names (list): The team names
+        """
+        with self.lock:
+            self.arbiter.set_teams(names)
+    
+    def arm(self):
+        """Start a new clue; buzzes are early until it is opened."""
+        with self.lock:
+            self.arbiter.arm()
+    
+    def open(self):
+        """Let teams buzz in."""
+        with self.lock:
+            self.arbiter.open()
+    
+    def close(self):
+        """Stop accepting buzzes until the next clue is armed."""
+        with self.lock:
+            self.arbiter.close()
+
+
+def main():
+    """Command-line buzzer: press Enter to buzz in for a team."""
+    parser = argparse.ArgumentParser(description="Buzz in to a Jeopardy game from the terminal.")
+    parser.add_argument("--team", required=True, help="name of your team")
+    parser.add_argument("--server", default="127.0.0.1", help="address of the game computer")
+    parser.add_argument("--token", required=True, help="join token shown on the game computer")
+    parser.add_argument("--port", type=int, default=BUZZER_PORT)
+    args = parser.parse_args()
+    
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.settimeout(1.0)
+    buzz_id = 0
+    print(f"Buzzing for {args.team} at {args.server}:{args.port}. Press Enter to buzz, Ctrl+C to quit.")
+    try:
+        while True:
+            input()
+            buzz_id += 1
+            buzz = {"team": args.team, "token": args.token, "id": buzz_id}
+            sock.sendto(json.dumps(buzz).encode(), (args.server, args.port))
+            try:
+                reply = json.loads(sock.recv(1024))
+                print(reply["result"].upper())
+            except socket.timeout:
+                print("No reply from the game computer.")
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
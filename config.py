@@ -25,10 +25,63 @@ DOUBLE_JEOPARDY_VALUES = [400, 800, 1200, 1600, 2000]
 # Timer settings (in seconds)
 QUESTION_TIMER = 30
 FINAL_JEOPARDY_TIMER = 60
+ANSWER_TIMER = 5  # Time a team has to answer once it is picked or buzzes in
+TIMER_TICK_INTERVAL = 0.25  # Seconds between countdown display updates
 
 # Excel file settings
 DEFAULT_TEMPLATE_PATH = os.path.join("templates", "jeopardy_template.xlsx")
 EXCEL_SHEET_NAMES = ["Jeopardy Round", "Double Jeopardy Round", "Final Jeopardy"]
+# "lightweight" (standard library only), "streaming" (single read-only openpyxl pass) or "pandas"
+EXCEL_PARSE_ENGINE = "lightweight"
+
+# Compiled game-pack cache settings
+PACK_CACHE_DIR = os.path.join("cache", "packs")
+PACK_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Least recently used packs are evicted above this size
+LOAD_POLL_INTERVAL = 50  # Milliseconds between checks on a background question load
+
+# Question bank settings
+QUESTION_BANK_PATH = os.path.join("data", "question_bank.db")
+
+# Game journal settings
+JOURNAL_DIR = "journals"
+JOURNAL_SNAPSHOT_INTERVAL = 200  # Events between full state snapshots
+JOURNAL_FLUSH_INTERVAL = 0.5  # Seconds of events collected into each write
+JOURNAL_KEEP = 20  # Journals of the most recent games kept; older ones are deleted
+UNDO_LIMIT = 100  # Host actions that can be undone
+
+# Saved game settings
+SAVE_DIR = "saves"
+AUTOSAVE_DELAY = 0.1  # Seconds of changes collected into each autosave
+AUTOSAVE_KEEP = 20  # Autosaves of the most recent games kept; saves the host names are never deleted
+
+# Score chart settings; the axes start at these spans and double as the game outgrows them
+SCORE_CHART_TIME_SPAN = 1800  # Seconds
+SCORE_CHART_SCORE_SPAN = 5000  # Dollars either side of zero
+
+# Board settings
+BOARD_RENDERER = "widgets"  # "widgets" for a Tk widget per tile, or "canvas" to draw the board on one canvas
+BOARD_TIMING_SAMPLES = 1000  # Most recent board build and update timings kept
+
+# Simulator settings
+SIMULATION_BATCH_SIZE = 100000  # Games simulated at once; bounds memory use
+SIMULATION_DAILY_DOUBLES = (1, 2)  # Daily Doubles in the Jeopardy and Double Jeopardy rounds
+
+# Tournament settings
+TOURNAMENT_TEAMS_PER_GAME = 3
+
+# Wager advice settings
+WAGER_ACCURACY = 0.5  # Assumed chance of answering Final Jeopardy correctly
+DAILY_DOUBLE_ACCURACY = 0.65  # Assumed chance of answering a Daily Double correctly
+MIN_DAILY_DOUBLE_WAGER = 5
+WAGER_POLL_INTERVAL = 50  # Milliseconds between checks on Final Jeopardy advice being worked out
+
+# Buzzer settings
+BUZZERS_ENABLED = False  # Start listening for buzzers at launch; otherwise use Game > Buzzers...
+BUZZER_HOST = "127.0.0.1"  # Set to "0.0.0.0" to let phones and laptops on the LAN buzz in
+BUZZER_TOKEN_BYTES = 3  # Random bytes in each game's join token, shown to the host as hex
+BUZZER_PORT = 47800  # UDP port
+BUZZER_EARLY_LOCKOUT = 0.25  # Seconds a team is locked out for buzzing before the buzzers open
+BUZZER_RECEIVE_BUFFER = 1024 * 1024  # Socket buffer size in bytes, enough for a burst of hundreds of buzzes
 
 # UI Settings
 FONT_FAMILY = "Arial"
@@ -53,6 +106,15 @@ DAILY_DOUBLE_COLOR = "#F39C12"  # Orange
 TIMER_SOUND = os.path.join("resources", "sounds", "timer.wav")
 DAILY_DOUBLE_SOUND = os.path.join("resources", "sounds", "daily_double.wav")
 FINAL_JEOPARDY_SOUND = os.path.join("resources", "sounds", "final_jeopardy.wav")
+PACK_SOUND_DIR = "sounds"  # Directory next to a question pack's workbook with sounds replacing these
+
+# Images
+LOGO_IMAGE = os.path.join("resources", "images", "logo.png")
+BACKGROUND_IMAGE = os.path.join("resources", "images", "background.png")
+IMAGE_CACHE_MAX_BYTES = 48 * 1024 * 1024  # Least recently used scaled images are dropped above this size
+IMAGE_SIZE_STEP = 40  # Pixels window sizes are rounded down to, so nearby sizes share a scaled image
+IMAGE_RESIZE_DELAY = 150  # Milliseconds the window must stop resizing for before images are scaled
+IMAGE_POLL_INTERVAL = 20  # Milliseconds between checks on images being scaled in the background
 
 # Special settings
 DAILY_DOUBLE_CHANCE = 0.1  # Probability of a question being a Daily Double
\ No newline at end of file
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Game Journal
+----------------------------
+This module keeps an append-only journal of game events (selections, rulings,
+wagers and score changes) in a JSON Lines file. State snapshots are written
+periodically, so the game can be rebuilt at any point by restoring the nearest
+snapshot and replaying only the events after it. The questions themselves are
+only written when a board is loaded; later snapshots refer back to that one.
+
+Usage:
+    python game_journal.py journals/game-20250101-190000.jsonl
+    python game_journal.py journals/game-20250101-190000.jsonl --seq 120 --events
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+from config import JOURNAL_DIR, JOURNAL_SNAPSHOT_INTERVAL, JOURNAL_FLUSH_INTERVAL, JOURNAL_KEEP
+from jeopardy_core import JeopardyGame
+
+# Snapshot lines start with their sequence number, and that of the snapshot holding
+# their board, so replay can find the right ones without decoding the others
+_SNAPSHOT_LINE = re.compile(r'\{"snapshot_seq":\s*(\d+),\s*"board_seq":\s*(\d+)')
+
+# Journals are named for the time their game started
+_JOURNAL_NAME = re.compile(r"game-\d{8}-\d{6}\.jsonl$")
+
+
+class GameJournal:
+    """Writes game events to a journal file on a background thread."""
+    
+    def __init__(self, path=None, snapshot_interval=JOURNAL_SNAPSHOT_INTERVAL,
+                 flush_interval=JOURNAL_FLUSH_INTERVAL):
+        """Initialize a GameJournal object and start its writer thread.
+        
+        Args:
+            path (str, optional): Path of the journal file. Defaults to a new timestamped
+                file in JOURNAL_DIR.
+            snapshot_interval (int, optional): Events between state snapshots.
+                Defaults to JOURNAL_SNAPSHOT_INTERVAL.
+            flush_interval (float, optional): Seconds to collect events before each write.
+                Defaults to JOURNAL_FLUSH_INTERVAL.
+        """
+        if path is None:
+            path = os.path.join(JOURNAL_DIR, time.strftime("game-%Y%m%d-%H%M%S.jsonl"))
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.flush_interval = flush_interval
+        self.game = None
+        self.error = None  # The last error raised while writing, if any
+        self._board_seq = 0
+        self._events_since_snapshot = 0
+        self._queue = queue.Queue()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+    
+    def attach(self, game):
+        """Start journaling a game, beginning with a snapshot of its current state.
+        
+        Args:
+            game (JeopardyGame): The game to journal
+        """
+        self.detach()
+        self.game = game
+        game.add_listener(self.record)
+        self.write_snapshot(include_board=True)
+    
+    def detach(self):
+        """Stop journaling the attached game."""
+        if self.game is not None:
+            self.game.remove_listener(self.record)
+            self.game = None
+    
+    def record(self, event):
+        """Queue an event for writing (called by the game for every event).
+        
+        Args:
+            event (dict): The game event
+        """
+        self._queue.put(event)
+        self._events_since_snapshot += 1
+        
+        # A new board cannot be rebuilt from events, so it always gets a snapshot
+        if event["type"] in ("load", "reset"):
+            self.write_snapshot(include_board=True)
+        elif self._events_since_snapshot >= self.snapshot_interval:
+            self.write_snapshot()
+    
+    def write_snapshot(self, include_board=False):
+        """Queue a snapshot of the attached game's current state.
+        
+        Args:
+            include_board (bool, optional): Whether to write the questions too, which is
+                needed whenever the board has changed. Defaults to False.
+        """
+        if not include_board and self.game.last_seq == self._board_seq:
+            return  # Nothing has happened since the board was written
+            
+        state = self.game.snapshot(include_board)
+        if include_board:
+            self._board_seq = state["seq"]
+        self._queue.put({"snapshot_seq": state["seq"], "board_seq": self._board_seq, "snapshot": state})
+        self._events_since_snapshot = 0
+    
+    def flush(self):
+        """Wait until every queued event and snapshot has been written."""
+        self._queue.join()
+    
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        self.detach()
+        self._queue.put(None)
+        self._writer.join()
+    
+    def _write_loop(self):
+        """Write queued records in batches until close is called (runs on the writer thread).
+        
+        Errors are kept in self.error rather than ending the thread, which must keep
+        taking records off the queue or flush and close would wait for it forever.
+        """
+        try:
+            f = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            self.error = e
+            f = None
+            
+        try:
+            while True:
+                # Block for the first record, then give the game a moment to emit more
+                # so that each write covers a whole batch
+                batch = [self._queue.get()]
+                if batch[0] is not None:
+                    time.sleep(self.flush_interval)
+                    while True:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+                            
+                closing = None in batch
+                try:
+                    # Records are encoded one by one, so one that cannot be encoded is
+                    # left out instead of cutting the batch's lines short
+                    lines = []
+                    for record in batch:
+                        if record is None:
+                            continue
+                        try:
+                            lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+                        except (TypeError, ValueError) as e:
+                            self.error = e
+                            
+                    if f is not None:
+                        f.writelines(lines)
+                        f.flush()
+                except Exception as e:
+                    self.error = e
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if closing:
+                    return
+        finally:
+            if f is not None:
+                f.close()
+
+
+def prune_journals(directory=JOURNAL_DIR, keep=JOURNAL_KEEP):
+    """Delete all but the newest journals in a directory.
+    
+    Args:
+        directory (str, optional): The directory. Defaults to JOURNAL_DIR.
+        keep (int, optional): Number of journals to keep. Defaults to JOURNAL_KEEP.
+        
+    Returns:
+        list: Paths of the deleted journals
+    """
+    try:
+        names = [name for name in os.listdir(directory) if _JOURNAL_NAME.match(name)]
+    except OSError:
+        return []
+        
+    paths = sorted((os.path.join(directory, name) for name in names), key=os.path.getmtime, reverse=True)
+    deleted = []
+    for path in paths[keep:]:
+        try:
+            os.remove(path)
+            deleted.append(path)
+        except OSError:
+            pass  # Left for the next time
+    return deleted
+
+
+def read_journal(path):
+    """Read the records of a journal file.
+    
+    A final line cut short by a crash is ignored.
+    
+    Args:
+        path (str): Path of the journal file
+        
+    Returns:
+        list: Event dictionaries and {"snapshot_seq", "snapshot"} records, in order
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return records
+
+
+def replay(path, seq=None):
+    """Rebuild a game as it was after a given event.
+    
+    Only the nearest snapshot at or before the event, the snapshot holding its
+    board and the events after it are decoded.
+    
+    Args:
+        path (str): Path of the journal file
+        seq (int, optional): Sequence number of the last event to apply. Defaults to
+            the end of the journal.
+            
+    Returns:
+        JeopardyGame: The rebuilt game
+        
+    Raises:
+        ValueError: If the journal has no snapshot at or before the event
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+        
+    start = None
+    board_seq = None
+    board_state = None
+    for index in range(len(lines) - 1, -1, -1):
+        match = _SNAPSHOT_LINE.match(lines[index])
+        if not match:
+            continue
+        snapshot_seq = int(match.group(1))
+        
+        if start is None and (seq is None or snapshot_seq <= seq):
+            try:
+                state = json.loads(lines[index])["snapshot"]
+            except json.JSONDecodeError:
+                continue
+            start = index
+            board_seq = int(match.group(2))
+        
+        if start is not None and snapshot_seq == board_seq and int(match.group(2)) == board_seq:
+            board_state = json.loads(lines[index])["snapshot"] if index != start else state
+            break
+            
+    if start is None or board_state is None:
+        raise ValueError(f"No snapshot at or before event {seq} in {path}.")
+        
+    game = JeopardyGame()
+    game.restore(board_state)
+    if board_state is not state:
+        game.restore(state)
+    
+    for line in lines[start + 1:]:
+        if _SNAPSHOT_LINE.match(line):
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            break
+        if seq is not None and event["seq"] > seq:
+            break
+        if event["seq"] > game.last_seq:
+            game.apply_event(event)
+            game.last_seq = event["seq"]
+            
+    return game
+
+
+def main():
+    """Command-line interface for inspecting a journal."""
+    parser = argparse.ArgumentParser(description="Replay a Jeopardy game journal.")
+    parser.add_argument("path", help="path to the journal file")
+    parser.add_argument("--seq", type=int, help="replay up to and including this event")
+    parser.add_argument("--events", action="store_true", help="list the events that were replayed")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    game = replay(args.path, args.seq)
+    elapsed = time.perf_counter() - start
+    
+    if args.events:
+        for record in read_journal(args.path):
+            if "snapshot" in record or record["seq"] > game.last_seq:
+                continue
+            details = {key: value for key, value in record.items() if key not in ("seq", "action", "time", "type")}
+            stamp = time.strftime("%H:%M:%S", time.localtime(record["time"]))
+            print(f"{record['seq']:6d} {stamp} #{record['action']:<5d} {record['type']:20} {json.dumps(details)}")
+        print()
+        
+    print(f"State after event {game.last_seq} (replayed in {elapsed * 1000:.1f} ms):")
+    print(f"  Round: {game.current_round_name}{' (game over)' if game.game_over else ''}")
+    print(f"  Clues left: {game.current_round.remaining}")
+    for team in game.teams:
+        marker = "*" if team["id"] == game.current_team_id else " "
+        print(f"  {marker} {team['name']}: ${team['score']}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
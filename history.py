@@ -0,0 +1,138 @@
+"""
+Jeopardy Game - Undo History
+----------------------------
+This module provides multi-level undo and redo of host actions. Each step is
+stored as the game events of one action, which hold only the fields that action
+changed, so undoing or redoing a step costs time proportional to what it changed.
+"""
+
+from collections import deque
+
+from config import UNDO_LIMIT
+
+
+class GameHistory:
+    """Records a game's actions so they can be undone and redone."""
+    
+    # Events after which earlier states can no longer be restored from events alone
+    BARRIER_EVENTS = ("load", "reset")
+    
+    def __init__(self, game, limit=UNDO_LIMIT):
+        """Initialize a GameHistory object and start recording the game's actions.
+        
+        Args:
+            game (JeopardyGame): The game to record
+            limit (int, optional): Maximum number of actions that can be undone. Defaults to UNDO_LIMIT.
+        """
+        self.game = game
+        self._undo_stack = deque(maxlen=limit)  # Entries of the form (action name, [events])
+        self._redo_stack = []
+        self._applying = False
+        game.add_listener(self._record)
+    
+    @property
+    def can_undo(self):
+        """Whether there is an action to undo.
+        
+        Returns:
+            bool: True if undo would do something
+        """
+        return bool(self._undo_stack)
+    
+    @property
+    def can_redo(self):
+        """Whether there is an undone action to redo.
+        
+        Returns:
+            bool: True if redo would do something
+        """
+        return bool(self._redo_stack)
+    
+    def undo_label(self):
+        """Get the name of the action undo would revert.
+        
+        Returns:
+            str: The action name, or None if there is nothing to undo
+        """
+        return self._undo_stack[-1][0] if self._undo_stack else None
+    
+    def redo_label(self):
+        """Get the name of the action redo would repeat.
+        
+        Returns:
+            str: The action name, or None if there is nothing to redo
+        """
+        return self._redo_stack[-1][0] if self._redo_stack else None
+    
+    def clear(self):
+        """Forget all recorded actions."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+    
+    def undo(self):
+        """Revert the most recent action.
+        
+        Returns:
+            list: The events that were reverted, or an empty list if there was nothing to undo
+        """
+        if not self._undo_stack:
+            return []
+            
+        name, events = self._undo_stack.pop()
+        self._apply(events, reverse=True)
+        self._redo_stack.append((name, events))
+        return events
+    
+    def redo(self):
+        """Repeat the most recently undone action.
+        
+        Returns:
+            list: The events that were repeated, or an empty list if there was nothing to redo
+        """
+        if not self._redo_stack:
+            return []
+            
+        name, events = self._redo_stack.pop()
+        self._apply(events, reverse=False)
+        self._undo_stack.append((name, events))
+        return events
+    
+    def _apply(self, events, reverse):
+        """Apply a step's events to the game as one new action.
+        
+        The changes are emitted as events, so the journal records them like any other
+        action, but they are not recorded here as a new step.
+        
+        Args:
+            events (list): The events of the step
+            reverse (bool): Whether to revert the events instead of repeating them
+        """
+        self._applying = True
+        try:
+            with self.game.action("undo" if reverse else "redo"):
+                for event in (reversed(events) if reverse else events):
+                    self.game.apply_event(event, reverse, emit=True)
+        finally:
+            self._applying = False
+    
+    def _record(self, event):
+        """Add a game event to the history (called by the game for every event).
+        
+        Args:
+            event (dict): The game event
+        """
+        if self._applying:
+            return
+            
+        if event["type"] in self.BARRIER_EVENTS:
+            self.clear()
+            return
+        if "after" not in event:
+            return  # Markers such as "select" change nothing
+            
+        # A new action makes the undone actions unreachable
+        self._redo_stack.clear()
+        if self._undo_stack and self._undo_stack[-1][1][0]["action"] == event["action"]:
+            self._undo_stack[-1][1].append(event)
+        else:
+            self._undo_stack.append((event["action_name"], [event]))
\ No newline at end of file
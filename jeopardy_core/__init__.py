@@ -0,0 +1,12 @@
+"""
+Jeopardy Game - Core
+--------------------
+The headless core of the Jeopardy game: the game engine and the question pack
+parser and validator. Nothing in this package imports tkinter, so it can be used
+from worker processes, servers and scripts without a display. The Tk interface in
+ui.py is a client of this package.
+"""
+
+from jeopardy_core.errors import JeopardyError, ExcelParseError, LoadCancelled, TemplateError, TeamError
+from jeopardy_core.game import Question, JeopardyRound, FinalJeopardyRound, TeamRegistry, JeopardyGame, build_rounds
+from jeopardy_core.parser import PackParser, question_columns, default_values, find_workbooks
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Jeopardy Game - Core Errors
+---------------------------
+This module defines the errors raised by the headless game core. Front ends decide
+how to present them; the core itself never shows dialogs.
+"""
+
+
+class JeopardyError(Exception):
+    """Base class for errors raised by the game core."""
+
+
+class ExcelParseError(JeopardyError):
+    """Raised when a question file cannot be parsed.
+    
+    Attributes:
+        sheet (str): The sheet the problem is in, or None
+        cell (str): The A1-style cell reference, or None
+    """
+    
+    def __init__(self, message, sheet=None, cell=None):
+        """Initialize an ExcelParseError object.
+        
+        Args:
+            message (str): Description of the problem
+            sheet (str, optional): The sheet the problem is in. Defaults to None.
+            cell (str, optional): The A1-style cell reference. Defaults to None.
+        """
+        super().__init__(message)
+        self.sheet = sheet
+        self.cell = cell
+
+
+class LoadCancelled(JeopardyError):
+    """Raised from a progress callback to stop parsing a question file."""
+
+
+class TemplateError(JeopardyError):
+    """Raised when a template question file cannot be written."""
+
+
+class TeamError(JeopardyError, ValueError):
+    """Raised when a team change would leave two teams with the same name or ID."""
\ No newline at end of file
@@ -0,0 +1,1179 @@
+"""
+Jeopardy Game - Game Logic
+-------------------------
+This module contains the game logic for the Jeopardy game.
+"""
+
+import random
+import sys
+import time
+from contextlib import contextmanager
+from config import ROUND_NAMES
+from jeopardy_core.errors import TeamError
+
+
+def _intern(text):
+    """Intern a string so repeated category and round names share one object.
+    
+    Args:
+        text: The string to intern; other values are returned unchanged
+        
+    Returns:
+        The interned string, or the value unchanged
+    """
+    return sys.intern(text) if type(text) is str else text
+
+
+# Fields every event carries, as opposed to fields describing the change itself
+_EVENT_STAMP_FIELDS = ("seq", "action", "action_name", "time", "type")
+
+
+class Question:
+    """Represents a Jeopardy question."""
+    
+    # Many boards are held in memory at once, so questions carry no per-instance __dict__
+    __slots__ = ("category", "value", "text", "answer", "is_daily_double", "_played", "_round")
+    
+    def __init__(self, category, value, text, answer, is_daily_double=False):
+        """Initialize a Question object.
+        
+        Args:
+            category (str): The category of the question
+            value (int): The point value of the question
+            text (str): The text of the question
+            answer (str): The answer to the question
+            is_daily_double (bool, optional): Whether this is a Daily Double. Defaults to False.
+        """
+        self.category = _intern(category)
+        self.value = value
+        self.text = text
+        self.answer = answer
+        self.is_daily_double = is_daily_double
+        self._played = False
+        self._round = None  # The round holding the question, kept up to date by the round
+    
+    @property
+    def played(self):
+        """Whether the question has been played.
+        
+        Returns:
+            bool: True if the question has been played
+        """
+        return self._played
+    
+    @played.setter
+    def played(self, played):
+        """Set whether the question has been played, updating its round's counters.
+        
+        Args:
+            played (bool): Whether the question has been played
+        """
+        played = bool(played)
+        if played != self._played:
+            self._played = played
+            if self._round is not None:
+                self._round._question_played(self, played)
+    
+    def play(self):
+        """Mark the question as played."""
+        self.played = True
+    
+    def __str__(self):
+        """Return a string representation of the question."""
+        return f"{self.category} for {self.value}: {self.text}"
+
+
+class JeopardyRound:
+    """Represents a round in the Jeopardy game.
+    
+    Questions are stored in a dense grid with one row per category and one column per
+    value, addressed by integer indices.
+    """
+    
+    def __init__(self, name, categories=None, questions=None):
+        """Initialize a JeopardyRound object.
+        
+        Args:
+            name (str): The name of the round (e.g., "Jeopardy", "Double Jeopardy")
+            categories (list, optional): List of category names. Defaults to None.
+            questions (dict, optional): Dictionary of questions by category and value. Defaults to None.
+        """
+        self.name = _intern(name)
+        self.completed = False
+        self.clear()
+        
+        for category in categories or []:
+            self.add_category(category)
+        for category_questions in (questions or {}).values():
+            for question in category_questions.values():
+                self.add_question(question)
+    
+    def clear(self):
+        """Remove all categories and questions from the round."""
+        self.categories = []
+        self.values = []  # Column values, in the order they were first added
+        self._category_index = {}
+        self._value_index = {}
+        self._grid = []  # List of rows of Question objects, with None for empty cells
+        
+        # Unplayed question counts and values, updated as questions are played
+        self._remaining = 0
+        self._remaining_value = 0
+        self._category_remaining = []
+        self._value_remaining = {}  # Dict of form {value: unplayed questions of that value}
+    
+    def add_category(self, category):
+        """Add a category to the round.
+        
+        Args:
+            category (str): The name of the category
+        """
+        if category not in self._category_index:
+            category = _intern(category)
+            self._category_index[category] = len(self.categories)
+            self.categories.append(category)
+            self._grid.append([None] * len(self.values))
+            self._category_remaining.append(0)
+    
+    def add_value(self, value):
+        """Add a value column to the round.
+        
+        Columns are ordered as they are added, so adding a round's whole value ladder
+        before its questions keeps the columns in ladder order.
+        
+        Args:
+            value (int): The point value
+            
+        Returns:
+            int: The index of the value's column
+        """
+        column = self._value_index.get(value)
+        if column is None:
+            column = len(self.values)
+            self._value_index[value] = column
+            self.values.append(value)
+            for row in self._grid:
+                row.append(None)
+        return column
+    
+    def add_question(self, question):
+        """Add a question to the round.
+        
+        Args:
+            question (Question): The Question object to add
+        """
+        if question.category not in self._category_index:
+            self.add_category(question.category)
+        
+        column = self.add_value(question.value)
+        row = self._category_index[question.category]
+        replaced = self._grid[row][column]
+        if replaced is not None:
+            replaced._round = None
+            if not replaced.played:
+                self._count_question(row, replaced.value, -1)
+        
+        self._grid[row][column] = question
+        question._round = self
+        if not question.played:
+            self._count_question(row, question.value, 1)
+    
+    def _count_question(self, row, value, change):
+        """Add or remove an unplayed question from the round's counters.
+        
+        Args:
+            row (int): The grid row of the question's category
+            value (int): The value of the question
+            change (int): 1 to count the question as unplayed, -1 to stop counting it
+        """
+        self._remaining += change
+        self._remaining_value += change * value
+        self._category_remaining[row] += change
+        count = self._value_remaining.get(value, 0) + change
+        if count:
+            self._value_remaining[value] = count
+        else:
+            del self._value_remaining[value]
+        if self._remaining:
+            self.completed = False
+    
+    def _question_played(self, question, played):
+        """Update the counters when one of the round's questions is played or unplayed.
+        
+        Args:
+            question (Question): The question whose state changed
+            played (bool): Whether the question is now played
+        """
+        self._count_question(self._category_index[question.category], question.value, -1 if played else 1)
+    
+    def get_question(self, category, value):
+        """Get a question by category and value.
+        
+        Args:
+            category (str): The category name
+            value (int): The value of the question
+            
+        Returns:
+            Question: The Question object, or None if not found
+        """
+        row = self._category_index.get(category)
+        column = self._value_index.get(value)
+        if row is None or column is None:
+            return None
+        return self._grid[row][column]
+    
+    def position(self, category, value):
+        """Get the grid position of a category and value.
+        
+        Args:
+            category (str): The category name
+            value (int): The point value
+            
+        Returns:
+            tuple: The (row, column) indices, or None if either is not on the board
+        """
+        row = self._category_index.get(category)
+        column = self._value_index.get(value)
+        if row is None or column is None:
+            return None
+        return row, column
+    
+    def get_question_at(self, row, column):
+        """Get a question by its position in the grid.
+        
+        Args:
+            row (int): The index of the category in categories
+            column (int): The index of the value in values
+            
+        Returns:
+            Question: The Question object, or None if the cell is empty
+        """
+        return self._grid[row][column]
+    
+    def iter_questions(self):
+        """Iterate over the questions of the round, category by category.
+        
+        Yields:
+            Question: Each question on the board
+        """
+        for row in self._grid:
+            for question in row:
+                if question is not None:
+                    yield question
+    
+    @property
+    def questions(self):
+        """Get the questions as a dictionary of the form {category: {value: Question}}.
+        
+        The dictionary is built on each access; use get_question for lookups.
+        
+        Returns:
+            dict: Dictionary of questions by category and value
+        """
+        return {
+            category: {
+                value: question
+                for value, question in zip(self.values, row)
+                if question is not None
+            }
+            for category, row in zip(self.categories, self._grid)
+        }
+    
+    @property
+    def remaining(self):
+        """Get the number of questions that have not been played.
+        
+        Returns:
+            int: The number of unplayed questions
+        """
+        return self._remaining
+    
+    @property
+    def remaining_value(self):
+        """Get the total value of the questions that have not been played.
+        
+        Returns:
+            int: The sum of the values of the unplayed questions
+        """
+        return self._remaining_value
+    
+    def remaining_values(self):
+        """Get the number of unplayed questions of each value, without visiting the board.
+        
+        Returns:
+            dict: Dict of form {value: count}, for the values with unplayed questions
+        """
+        return dict(self._value_remaining)
+    
+    def remaining_in_category(self, category):
+        """Get the number of questions in a category that have not been played.
+        
+        Args:
+            category (str): The category name
+            
+        Returns:
+            int: The number of unplayed questions, or 0 if the category is not found
+        """
+        row = self._category_index.get(category)
+        return 0 if row is None else self._category_remaining[row]
+    
+    def is_complete(self):
+        """Check if all questions in the round have been played.
+        
+        Returns:
+            bool: True if all questions have been played, False otherwise
+        """
+        if self._remaining:
+            return False
+        
+        self.completed = True
+        return True
+
+
+class FinalJeopardyRound(JeopardyRound):
+    """Represents the Final Jeopardy round."""
+    
+    def __init__(self, category=None, question=None, answer=None):
+        """Initialize a FinalJeopardyRound object.
+        
+        Args:
+            category (str, optional): The category for Final Jeopardy. Defaults to None.
+            question (str, optional): The Final Jeopardy question. Defaults to None.
+            answer (str, optional): The Final Jeopardy answer. Defaults to None.
+        """
+        super().__init__("Final Jeopardy", [category] if category else [])
+        
+        if category and question and answer:
+            self.add_question(Question(category, 0, question, answer))
+    
+    def set_question(self, category, question, answer):
+        """Set the Final Jeopardy question.
+        
+        Args:
+            category (str): The category for Final Jeopardy
+            question (str): The Final Jeopardy question
+            answer (str): The Final Jeopardy answer
+        """
+        self.clear()
+        self.add_question(Question(category, 0, question, answer))
+
+
+class TeamRegistry:
+    """The teams of a game, in turn order, indexed by ID and by name.
+    
+    Teams are dictionaries with "id", "name", "score" and "color" keys. IDs are
+    assigned when a team is added and never change, so they stay valid when other
+    teams are added, removed or renamed. Names must be unique, ignoring case.
+    """
+    
+    def __init__(self, teams=None, next_id=1):
+        """Initialize a TeamRegistry object.
+        
+        Args:
+            teams (list, optional): Team dictionaries to add, in turn order. Teams that
+                already have an "id" keep it. Defaults to None.
+            next_id (int, optional): The lowest ID a new team may be given, so that a
+                registry replacing another never reuses the IDs of teams it dropped.
+                Defaults to 1.
+                
+        Raises:
+            TeamError: If two teams have the same name or ID
+        """
+        self._teams = []
+        self._by_id = {}
+        self._by_name = {}
+        self._positions = {}
+        self._next_id = next_id
+        
+        for team in teams or []:
+            self._insert(dict(team))
+    
+    def __len__(self):
+        """Get the number of teams."""
+        return len(self._teams)
+    
+    def __iter__(self):
+        """Iterate over the teams in turn order."""
+        return iter(self._teams)
+    
+    def __getitem__(self, position):
+        """Get a team by its position in turn order.
+        
+        Args:
+            position (int): The position of the team
+            
+        Returns:
+            dict: The team dictionary
+        """
+        return self._teams[position]
+    
+    def get(self, team_id):
+        """Get a team by ID.
+        
+        Args:
+            team_id (int): The ID of the team
+            
+        Returns:
+            dict: The team dictionary, or None if not found
+        """
+        return self._by_id.get(team_id)
+    
+    def by_name(self, name):
+        """Get a team by name, ignoring case.
+        
+        Args:
+            name (str): The name of the team
+            
+        Returns:
+            dict: The team dictionary, or None if not found
+        """
+        return self._by_name.get(_name_key(name))
+    
+    def position(self, team_id):
+        """Get the position of a team in turn order.
+        
+        Args:
+            team_id (int): The ID of the team
+            
+        Returns:
+            int: The position of the team, or None if not found
+        """
+        return self._positions.get(team_id)
+    
+    @property
+    def next_id(self):
+        """The ID the next team added will be given."""
+        return self._next_id
+    
+    def ids(self):
+        """Get the team IDs in turn order.
+        
+        Returns:
+            list: The team IDs
+        """
+        return [team["id"] for team in self._teams]
+    
+    def add(self, name, color="#3498db", score=0):
+        """Add a team at the end of the turn order.
+        
+        Args:
+            name (str): The name of the team
+            color (str, optional): The color associated with the team. Defaults to "#3498db".
+            score (int, optional): The team's starting score. Defaults to 0.
+            
+        Returns:
+            dict: The new team dictionary
+            
+        Raises:
+            TeamError: If a team with the same name exists
+        """
+        return self._insert({"name": name, "score": score, "color": color})
+    
+    def remove(self, team_id):
+        """Remove a team.
+        
+        Args:
+            team_id (int): The ID of the team
+        """
+        team = self._by_id.pop(team_id, None)
+        if team is None:
+            return
+        
+        del self._by_name[_name_key(team["name"])]
+        self._teams.remove(team)
+        self._positions = {team["id"]: position for position, team in enumerate(self._teams)}
+    
+    def rename(self, team_id, name):
+        """Rename a team.
+        
+        Args:
+            team_id (int): The ID of the team
+            name (str): The new name
+            
+        Raises:
+            TeamError: If another team has the new name
+        """
+        team = self._by_id[team_id]
+        key = _name_key(name)
+        if self._by_name.get(key, team) is not team:
+            raise TeamError(f"There is already a team named '{name}'.")
+        
+        del self._by_name[_name_key(team["name"])]
+        team["name"] = name
+        self._by_name[key] = team
+    
+    def to_list(self):
+        """Copy the teams as a list of dictionaries.
+        
+        Returns:
+            list: Copies of the team dictionaries, in turn order
+        """
+        return [dict(team) for team in self._teams]
+    
+    def _insert(self, team):
+        """Add a team dictionary, assigning it an ID if it has none.
+        
+        Args:
+            team (dict): The team dictionary
+            
+        Returns:
+            dict: The team dictionary
+            
+        Raises:
+            TeamError: If a team with the same name or ID exists
+        """
+        key = _name_key(team["name"])
+        if key in self._by_name:
+            raise TeamError(f"There is already a team named '{team['name']}'.")
+        if team.get("id") is None:
+            team["id"] = self._next_id
+        elif team["id"] in self._by_id:
+            raise TeamError(f"There is already a team with ID {team['id']}.")
+        
+        self._next_id = max(self._next_id, team["id"] + 1)
+        self._positions[team["id"]] = len(self._teams)
+        self._teams.append(team)
+        self._by_id[team["id"]] = team
+        self._by_name[key] = team
+        return team
+
+
+def _name_key(name):
+    """Normalize a team name for uniqueness checks and lookups.
+    
+    Args:
+        name (str): The team name
+        
+    Returns:
+        str: The normalized name
+    """
+    return name.strip().casefold()
+
+
+class JeopardyGame:
+    """Main game logic for Jeopardy.
+    
+    Every change to the game state is reported to listeners as an event dictionary.
+    Events that change state carry the value before and after the change, so they can
+    be replayed forwards or backwards with apply_event. Events emitted by one host
+    action, such as ruling on an answer, share an action number.
+    """
+    
+    def __init__(self, teams=None):
+        """Initialize a JeopardyGame object.
+        
+        Args:
+            teams (list, optional): List of team dictionaries, which are copied. Defaults to None.
+        """
+        self.teams = TeamRegistry(teams)
+        self.current_team_id = self.teams[0]["id"] if self.teams else None
+        self.rounds = {
+            ROUND_NAMES[0]: JeopardyRound(ROUND_NAMES[0]),
+            ROUND_NAMES[1]: JeopardyRound(ROUND_NAMES[1]),
+            ROUND_NAMES[2]: FinalJeopardyRound()
+        }
+        self.current_round_name = ROUND_NAMES[0]
+        self.daily_doubles = []
+        self.game_over = False
+        self.daily_double_wager = None
+        self.final_wagers = {}  # Dict of form {team_id: wager}
+        
+        self.listeners = []
+        self.last_seq = 0
+        self._action_count = 0
+        self._action = None
+    
+    @property
+    def current_round(self):
+        """Get the current round of the game.
+        
+        Returns:
+            JeopardyRound: The current round
+        """
+        return self.rounds[self.current_round_name]
+    
+    @property
+    def current_team(self):
+        """Get the current team.
+        
+        Returns:
+            dict: The current team dictionary
+        """
+        return self.teams.get(self.current_team_id)
+    
+    @property
+    def current_team_index(self):
+        """Get the position of the current team in turn order.
+        
+        Returns:
+            int: The position of the current team, or None if there are no teams
+        """
+        return self.teams.position(self.current_team_id)
+    
+    def add_listener(self, listener):
+        """Register a function to be called with every game event.
+        
+        Args:
+            listener (callable): Function taking the event dictionary
+        """
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """Stop calling a registered listener.
+        
+        Args:
+            listener (callable): The listener to remove
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    @contextmanager
+    def action(self, name):
+        """Group the events emitted inside the block into one host action.
+        
+        Nested actions join the outermost one.
+        
+        Args:
+            name (str): The name of the action (e.g., "rule", "next_round")
+        """
+        if self._action is not None:
+            yield
+            return
+        
+        self._action_count += 1
+        self._action = (self._action_count, name)
+        try:
+            yield
+        finally:
+            self._action = None
+    
+    def _emit(self, event_type, **fields):
+        """Stamp an event and pass it to the listeners.
+        
+        Args:
+            event_type (str): The type of the event
+            **fields: The event's data
+        """
+        with self.action(event_type):
+            self.last_seq += 1
+            event = {
+                "seq": self.last_seq,
+                "action": self._action[0],
+                "action_name": self._action[1],
+                "time": time.time(),
+                "type": event_type
+            }
+            event.update(fields)
+            
+            for listener in list(self.listeners):
+                listener(event)
+    
+    def _change(self, event_type, before, after, **fields):
+        """Emit a state change event unless the state is unchanged.
+        
+        Args:
+            event_type (str): The type of the event
+            before: The value before the change
+            after: The value after the change
+            **fields: Other data identifying what changed
+        """
+        if before != after:
+            self._emit(event_type, before=before, after=after, **fields)
+    
+    def add_team(self, name, color="#3498db"):
+        """Add a team to the game.
+        
+        Args:
+            name (str): The name of the team
+            color (str, optional): The color associated with the team. Defaults to "#3498db".
+            
+        Returns:
+            int: The ID of the new team
+            
+        Raises:
+            TeamError: If a team with the same name exists
+        """
+        before = self.teams.to_list()
+        team = self.teams.add(name, color)
+        self._change("teams", before, self.teams.to_list())
+        return team["id"]
+    
+    def set_teams(self, teams):
+        """Replace the teams and give control to the first one.
+        
+        Teams that keep the "id" of an existing team stay the same team, renamed or
+        not; teams without one are given IDs no team of this game has had.
+        
+        Args:
+            teams (list): List of team dictionaries, which are copied
+            
+        Raises:
+            TeamError: If two teams have the same name
+        """
+        registry = TeamRegistry(teams, self.teams.next_id)
+        
+        with self.action("set_teams"):
+            before = self.teams.to_list()
+            self.teams = registry
+            self._change("teams", before, registry.to_list())
+            self.set_current_team(registry[0]["id"] if registry else None)
+    
+    def set_current_team(self, team_id):
+        """Give control of the board to a team.
+        
+        Args:
+            team_id (int): The ID of the team
+        """
+        before = self.current_team_id
+        self.current_team_id = team_id
+        self._change("turn", before, team_id)
+    
+    def next_team(self):
+        """Move to the next team's turn.
+        
+        Returns:
+            dict: The new current team
+        """
+        if not self.teams:
+            return None
+        
+        position = self.current_team_index
+        position = 0 if position is None else (position + 1) % len(self.teams)
+        self.set_current_team(self.teams[position]["id"])
+        return self.current_team
+    
+    def update_score(self, team_id, points, correct=True, clue=None):
+        """Update a team's score.
+        
+        Args:
+            team_id (int): The ID of the team to update
+            points (int): The points to add (or subtract if correct is False)
+            correct (bool, optional): Whether the answer was correct. Defaults to True.
+            clue (tuple, optional): The (round, category, value) of the clue that was
+                answered, recorded in the event. Defaults to None.
+        """
+        team = self.teams.get(team_id)
+        if team is not None:
+            before = team["score"]
+            if correct:
+                team["score"] += points
+            else:
+                team["score"] -= points
+            if clue is None:
+                self._change("score", before, team["score"], team=team_id)
+            else:
+                self._change("score", before, team["score"], team=team_id, clue=list(clue))
+    
+    def reset_scores(self):
+        """Reset all team scores to zero."""
+        with self.action("reset_scores"):
+            for team in self.teams:
+                before = team["score"]
+                team["score"] = 0
+                self._change("score", before, 0, team=team["id"])
+    
+    def select_question(self, category, value):
+        """Select a question from the current round's board.
+        
+        Args:
+            category (str): The category name
+            value (int): The value of the question
+            
+        Returns:
+            Question: The selected question, or None if it is not on the board or already played
+        """
+        question = self.current_round.get_question(category, value)
+        if not question or question.played:
+            return None
+        
+        self._emit("select", round=self.current_round_name, category=category, value=value,
+                   team=self.current_team_id)
+        return question
+    
+    def play_question(self, question):
+        """Mark a question as played.
+        
+        Args:
+            question (Question): The question, which must belong to one of the game's rounds
+        """
+        before = question.played
+        question.play()
+        self._change("played", before, True, round=question._round.name,
+                     category=question.category, value=question.value)
+    
+    def place_daily_double_wager(self, wager):
+        """Record the current team's wager on a Daily Double.
+        
+        Args:
+            wager (int): The amount wagered
+        """
+        before = self.daily_double_wager
+        self.daily_double_wager = wager
+        self._change("daily_double_wager", before, wager, team=self.current_team_id)
+    
+    def place_final_wager(self, team_id, wager):
+        """Record a team's Final Jeopardy wager.
+        
+        Args:
+            team_id (int): The ID of the team
+            wager (int): The amount wagered
+        """
+        before = self.final_wagers.get(team_id)
+        self.final_wagers[team_id] = wager
+        self._change("final_wager", before, wager, team=team_id)
+    
+    def rule(self, question, team_id, correct):
+        """Apply the host's ruling on an answer to a board question.
+        
+        The team's score changes by the question's value, or by the Daily Double wager,
+        and the question is marked as played. On a regular question a correct answer
+        gives the answering team control and a wrong one passes control on.
+        
+        Args:
+            question (Question): The question that was answered
+            team_id (int): The ID of the team that answered
+            correct (bool): Whether the answer was correct
+            
+        Returns:
+            int: The points won or lost
+        """
+        clue = (question._round.name, question.category, question.value)
+        with self.action("rule"):
+            if question.is_daily_double:
+                points = self.daily_double_wager or 0
+                self.update_score(team_id, points, correct, clue)
+                self.play_question(question)
+                self.place_daily_double_wager(None)
+            else:
+                points = question.value
+                self.update_score(team_id, points, correct, clue)
+                self.play_question(question)
+                if correct:
+                    self.set_current_team(team_id)
+                else:
+                    self.next_team()
+        return points
+    
+    def rule_final(self, team_id, correct):
+        """Apply the host's ruling on a team's Final Jeopardy answer.
+        
+        Args:
+            team_id (int): The ID of the team
+            correct (bool): Whether the answer was correct
+        """
+        final = self.rounds[ROUND_NAMES[2]]
+        clue = (final.name, final.categories[0] if final.categories else None, 0)
+        with self.action("rule_final"):
+            self.update_score(team_id, self.final_wagers.get(team_id, 0), correct, clue)
+    
+    def end_game(self):
+        """Mark the game as over."""
+        before = self.game_over
+        self.game_over = True
+        self._change("game_over", before, True)
+    
+    def setup_round(self, round_name, categories, questions_data, values=None):
+        """Set up a round with categories and questions.
+        
+        Args:
+            round_name (str): The name of the round to set up
+            categories (list): List of category names
+            questions_data (dict): Dictionary of questions data by category and value
+            values (list, optional): The round's value ladder, in board order. Defaults to
+                the values of the questions in the order they appear.
+        """
+        if round_name not in self.rounds:
+            return
+        
+        round_obj = self.rounds[round_name]
+        
+        # Clear existing data
+        round_obj.clear()
+        
+        # Add categories and value columns
+        for category in categories:
+            round_obj.add_category(category)
+        for value in values or ():
+            round_obj.add_value(value)
+        
+        # Add questions
+        for category in questions_data:
+            for value, data in questions_data[category].items():
+                question = Question(
+                    category=category,
+                    value=value,
+                    text=data["question"],
+                    answer=data["answer"],
+                    is_daily_double=data.get("is_daily_double", False)
+                )
+                round_obj.add_question(question)
+                
+                if question.is_daily_double:
+                    self.daily_doubles.append((round_name, category, value))
+    
+    def install_rounds(self, rounds, daily_doubles):
+        """Start a new game on rounds built by build_rounds.
+        
+        Scores, wagers and control of the board are reset.
+        
+        Args:
+            rounds (dict): Dictionary of round objects by round name
+            daily_doubles (list): List of (round name, category, value) Daily Doubles
+        """
+        self.rounds = rounds
+        self.daily_doubles = list(daily_doubles)
+        self._reset_state()
+        self._emit("load")
+    
+    def setup_final_jeopardy(self, category, question, answer):
+        """Set up the Final Jeopardy round.
+        
+        Args:
+            category (str): The Final Jeopardy category
+            question (str): The Final Jeopardy question
+            answer (str): The Final Jeopardy answer
+        """
+        final_round = self.rounds[ROUND_NAMES[2]]
+        if isinstance(final_round, FinalJeopardyRound):
+            final_round.set_question(category, question, answer)
+    
+    def next_round(self):
+        """Move to the next round.
+        
+        Returns:
+            str: The name of the new current round, or None if game is over
+        """
+        current_index = ROUND_NAMES.index(self.current_round_name)
+        if current_index < len(ROUND_NAMES) - 1:
+            self.current_round_name = ROUND_NAMES[current_index + 1]
+            self._change("round", ROUND_NAMES[current_index], self.current_round_name)
+            return self.current_round_name
+        else:
+            self.end_game()
+            return None
+    
+    def get_winners(self):
+        """Get the team(s) with the highest score.
+        
+        Returns:
+            list: A list of winning team dictionaries
+        """
+        if not self.teams:
+            return []
+        
+        max_score = max(team["score"] for team in self.teams)
+        return [team for team in self.teams if team["score"] == max_score]
+    
+    def reset_game(self):
+        """Reset the game to its initial state."""
+        self._reset_state()
+        self.daily_doubles = []
+        
+        for round_name in self.rounds:
+            if round_name == ROUND_NAMES[2]:
+                self.rounds[round_name] = FinalJeopardyRound()
+            else:
+                self.rounds[round_name] = JeopardyRound(round_name)
+        
+        self._emit("reset")
+    
+    def _reset_state(self):
+        """Reset scores, wagers, the current round and control of the board."""
+        for team in self.teams:
+            team["score"] = 0
+        
+        self.current_team_id = self.teams[0]["id"] if self.teams else None
+        self.current_round_name = ROUND_NAMES[0]
+        self.game_over = False
+        self.daily_double_wager = None
+        self.final_wagers = {}
+    
+    def apply_event(self, event, reverse=False, emit=False):
+        """Apply a state change event to the game.
+        
+        Args:
+            event (dict): An event emitted by this or an identical game
+            reverse (bool, optional): Whether to undo the event instead. Defaults to False.
+            emit (bool, optional): Whether to emit the change as a new event. Defaults to False,
+                as when replaying a journal.
+        """
+        event_type = event["type"]
+        if "after" not in event:
+            return  # Markers such as "select" and "load" carry no state change
+        
+        value = event["before"] if reverse else event["after"]
+        
+        if event_type == "score":
+            self.teams.get(event["team"])["score"] = value
+        elif event_type == "played":
+            self.rounds[event["round"]].get_question(event["category"], event["value"]).played = value
+        elif event_type == "turn":
+            self.current_team_id = value
+        elif event_type == "round":
+            self.current_round_name = value
+        elif event_type == "game_over":
+            self.game_over = value
+        elif event_type == "daily_double_wager":
+            self.daily_double_wager = value
+        elif event_type == "final_wager":
+            if value is None:
+                self.final_wagers.pop(event["team"], None)
+            else:
+                self.final_wagers[event["team"]] = value
+        elif event_type == "teams":
+            # IDs are never handed out twice, even after undoing the teams that had them
+            self.teams = TeamRegistry(value, self.teams.next_id)
+        
+        if emit:
+            fields = {key: field for key, field in event.items() if key not in _EVENT_STAMP_FIELDS}
+            fields["before"] = event["after"] if reverse else event["before"]
+            fields["after"] = value
+            self._emit(event_type, **fields)
+    
+    def snapshot(self, include_board=True):
+        """Capture the game state as JSON-compatible data.
+        
+        Args:
+            include_board (bool, optional): Whether to include the questions themselves.
+                Without them only the played flags are kept, and the snapshot can only be
+                restored on top of the same board. Defaults to True.
+                
+        Returns:
+            dict: The game state, which restore accepts
+        """
+        rounds = {}
+        for round_name, round_obj in self.rounds.items():
+            if include_board:
+                rounds[round_name] = {
+                    "categories": list(round_obj.categories),
+                    "values": list(round_obj.values),
+                    "questions": [
+                        [q.category, q.value, q.text, q.answer, q.is_daily_double, q.played]
+                        for q in round_obj.iter_questions()
+                    ]
+                }
+            else:
+                rounds[round_name] = {
+                    "played": [index for index, q in enumerate(round_obj.iter_questions()) if q.played]
+                }
+        
+        return {
+            "seq": self.last_seq,
+            "teams": self.teams.to_list(),
+            "next_team_id": self.teams.next_id,
+            "current_team_id": self.current_team_id,
+            "current_round_name": self.current_round_name,
+            "game_over": self.game_over,
+            "daily_double_wager": self.daily_double_wager,
+            "final_wagers": [[team_id, wager] for team_id, wager in sorted(self.final_wagers.items())],
+            "daily_doubles": [list(dd) for dd in self.daily_doubles],
+            "rounds": rounds
+        }
+    
+    def restore(self, state):
+        """Replace the game state with a snapshot, without emitting events.
+        
+        A snapshot taken without the board must be restored on top of a game that
+        already has that board.
+        
+        Args:
+            state (dict): A snapshot as returned by snapshot
+        """
+        self.teams = TeamRegistry(state["teams"], state.get("next_team_id", 1))
+        self.current_team_id = state["current_team_id"]
+        self.current_round_name = state["current_round_name"]
+        self.game_over = state["game_over"]
+        self.daily_double_wager = state["daily_double_wager"]
+        self.final_wagers = {team_id: wager for team_id, wager in state["final_wagers"]}
+        self.daily_doubles = [tuple(dd) for dd in state["daily_doubles"]]
+        self.last_seq = state["seq"]
+        
+        for round_name, round_state in state["rounds"].items():
+            if "questions" not in round_state:
+                played = set(round_state["played"])
+                for index, question in enumerate(self.rounds[round_name].iter_questions()):
+                    question.played = index in played
+                continue
+            
+            round_obj = FinalJeopardyRound() if round_name == ROUND_NAMES[2] else JeopardyRound(round_name)
+            for category in round_state["categories"]:
+                round_obj.add_category(category)
+            for value in round_state.get("values", ()):
+                round_obj.add_value(value)
+            for category, value, text, answer, is_daily_double, played in round_state["questions"]:
+                question = Question(category, value, text, answer, is_daily_double)
+                question.played = played
+                round_obj.add_question(question)
+            self.rounds[round_name] = round_obj
+    
+    def load_state(self, *states):
+        """Replace the game state with snapshots, as when resuming a saved game.
+        
+        Unlike restore, this emits a "load" event so listeners treat the game as a
+        newly loaded one.
+        
+        Args:
+            *states (dict): Snapshots to restore in order, starting with one that
+                includes the board
+        """
+        for state in states:
+            self.restore(state)
+        self._emit("load")
+    
+    def set_daily_doubles(self, round_name, num_daily_doubles=1):
+        """Randomly assign Daily Doubles to questions in a round.
+        
+        Args:
+            round_name (str): The name of the round to set Daily Doubles for
+            num_daily_doubles (int, optional): Number of Daily Doubles to set. Defaults to 1.
+        """
+        if round_name not in self.rounds:
+            return
+        
+        round_obj = self.rounds[round_name]
+        available_questions = []
+        
+        for question in round_obj.iter_questions():
+            if not question.is_daily_double:
+                available_questions.append((question.category, question.value, question))
+        
+        # Make sure we don't try to set more Daily Doubles than there are questions
+        num_daily_doubles = min(num_daily_doubles, len(available_questions))
+        
+        # Remove any existing Daily Doubles for this round
+        self.daily_doubles = [dd for dd in self.daily_doubles if dd[0] != round_name]
+        
+        # Randomly select questions to be Daily Doubles
+        for _ in range(num_daily_doubles):
+            if not available_questions:
+                break
+                
+            idx = random.randrange(len(available_questions))
+            category, value, question = available_questions.pop(idx)
+            
+            question.is_daily_double = True
+            self.daily_doubles.append((round_name, category, value))
+
+
+def build_rounds(game_data):
+    """Build the round objects for parsed game data without touching a running game.
+    
+    The rounds can be built on a worker thread and then swapped into a game in one
+    step with JeopardyGame.install_rounds.
+    
+    Args:
+        game_data (dict): Game data as returned by PackParser.read_game_data
+        
+    Returns:
+        dict: Dictionary of round objects by round name
+    """
+    staging = JeopardyGame()
+    
+    for round_name in ROUND_NAMES[:2]:
+        round_data = game_data["rounds"][round_name]
+        staging.setup_round(round_name, round_data["categories"], round_data["questions"], round_data.get("values"))
+    
+    final_data = game_data["rounds"][ROUND_NAMES[2]]
+    staging.setup_final_jeopardy(final_data["category"], final_data["question"], final_data["answer"])
+    
+    return staging.rounds
\ No newline at end of file
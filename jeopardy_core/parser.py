@@ -0,0 +1,1128 @@
+"""
+Jeopardy Game - Pack Parser
+---------------------------
+This module parses and validates Excel question packs for the Jeopardy game. It has
+no GUI dependencies: problems are raised as ExcelParseError, so the parser can run
+in worker processes, servers and tests without a display.
+"""
+
+import os
+import re
+import random
+from config import (
+    EXCEL_SHEET_NAMES, ROUND_NAMES, JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES,
+    DEFAULT_TEMPLATE_PATH, EXCEL_PARSE_ENGINE
+)
+from jeopardy_core.errors import ExcelParseError, LoadCancelled, TemplateError
+from jeopardy_core.xlsx_reader import read_workbook_rows
+
+
+def _no_progress(stage, done, total):
+    """Progress callback that ignores all progress reports."""
+
+
+class PackParser:
+    """Parses and validates Excel question packs without any user interaction."""
+    
+    def __init__(self, engine=EXCEL_PARSE_ENGINE, cache=None, vectorized=True):
+        """Initialize a PackParser object.
+        
+        Args:
+            engine (str, optional): The parsing engine to use: "lightweight", "streaming" or "pandas".
+                Defaults to EXCEL_PARSE_ENGINE.
+            cache (PackCache, optional): Cache of previously parsed packs. Defaults to None.
+            vectorized (bool, optional): Whether the pandas engine parses whole columns at once
+                instead of looping over rows. Defaults to True.
+        """
+        self.engine = engine
+        self.cache = cache
+        self.vectorized = vectorized
+    
+    def create_template(self, save_path, num_categories=1, round_values=None):
+        """Create a template Excel file for Jeopardy game.
+        
+        Args:
+            save_path (str): Path to save the template file
+            num_categories (int, optional): Number of sample categories in each round. Defaults to 1.
+            round_values (tuple, optional): The value ladders of the Jeopardy and Double Jeopardy
+                rounds, which also set the number of question columns. Defaults to
+                (JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES).
+            
+        Returns:
+            str: Path to the created template file
+            
+        Raises:
+            TemplateError: If the template could not be written
+        """
+        round_values = round_values or (JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES)
+        
+        try:
+            import pandas as pd
+            
+            # Create DataFrames for each sheet, with sample rows showing the format
+            round_dfs = []
+            for values in round_values:
+                sample_rows = [
+                    [f'Category {c+1}' if num_categories > 1 else 'Category Name'] +
+                    [f'Question: Sample question for ${value} | Answer: Sample answer' for value in values]
+                    for c in range(num_categories)
+                ]
+                round_dfs.append(pd.DataFrame(
+                    sample_rows, columns=['Category'] + [f'Question {i+1}' for i in range(len(values))]
+                ))
+            jeopardy_df, double_jeopardy_df = round_dfs
+            
+            values_df = pd.DataFrame({
+                'Round': ROUND_NAMES[:2],
+                'Values': [', '.join(str(value) for value in values) for values in round_values]
+            })
+            final_jeopardy_df = pd.DataFrame({
+                'Item': ['Category', 'Question', 'Answer'],
+                'Value': ['', '', '']
+            })
+            daily_doubles_df = pd.DataFrame({
+                'Round': ['Jeopardy', 'Double Jeopardy', 'Double Jeopardy'],
+                'Category': ['', '', ''],
+                'Value': ['', '', '']
+            })
+            
+            # Create the Excel writer and write each sheet
+            with pd.ExcelWriter(save_path, engine='openpyxl') as writer:
+                jeopardy_df.to_excel(writer, sheet_name=EXCEL_SHEET_NAMES[0], index=False)
+                double_jeopardy_df.to_excel(writer, sheet_name=EXCEL_SHEET_NAMES[1], index=False)
+                final_jeopardy_df.to_excel(writer, sheet_name=EXCEL_SHEET_NAMES[2], index=False)
+                daily_doubles_df.to_excel(writer, sheet_name='Daily Doubles', index=False)
+                values_df.to_excel(writer, sheet_name='Values', index=False)
+                
+                # Add a help sheet
+                help_df = pd.DataFrame({
+                    'Instructions': [
+                        'How to use this template:',
+                        '1. For Jeopardy and Double Jeopardy rounds, add categories in the Category column.',
+                        '2. Add questions and answers in the format "Question: [text] | Answer: [text]"',
+                        '3. For Final Jeopardy, fill in the Category, Question, and Answer in the Value column.',
+                        '4. For Daily Doubles, specify the Round, Category, and Value of each Daily Double.',
+                        '5. You can add as many categories as needed by adding more rows.',
+                        '6. For more questions per category, add columns named Question 6, Question 7 and so on.',
+                        '7. The Values sheet lists the values of each round\'s question columns in order, '
+                        'separated by commas. Without it the standard values are used.',
+                        '8. Save the file and load it in the Jeopardy Game application.'
+                    ]
+                })
+                help_df.to_excel(writer, sheet_name='Help', index=False)
+            
+            return save_path
+            
+        except Exception as e:
+            raise TemplateError(f"Error creating template: {str(e)}") from e
+    
+    def read_game_data(self, file_path, engine=None, progress=None):
+        """Parse the Excel file and extract game data.
+        
+        Safe to call from a worker thread or process.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            engine (str, optional): Overrides the handler's parsing engine. Defaults to None.
+            progress (callable, optional): Called as progress(stage, done, total) after each sheet
+                and, for the row-based engines, after each category. It may raise LoadCancelled
+                to stop parsing. Defaults to None.
+            
+        Returns:
+            dict: Dictionary containing game data
+            
+        Raises:
+            ExcelParseError: If the file could not be parsed
+            LoadCancelled: If the progress callback cancelled the load
+        """
+        engine = engine or self.engine
+        
+        if self.cache:
+            game_data = self.cache.get(file_path)
+            if game_data:
+                return game_data
+        
+        game_data = self._parse_file(file_path, engine, progress or _no_progress)
+        if self.cache:
+            self.cache.put(file_path, game_data)
+            
+        return game_data
+    
+    def _parse_file(self, file_path, engine, progress):
+        """Parse the Excel file with the given engine, bypassing the cache.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            engine (str): The parsing engine to use
+            progress (callable): The progress callback
+            
+        Returns:
+            dict: Dictionary containing game data
+        """
+        try:
+            # Initialize game data structure
+            game_data = {
+                "rounds": {
+                    ROUND_NAMES[0]: {"categories": [], "values": [], "questions": {}},
+                    ROUND_NAMES[1]: {"categories": [], "values": [], "questions": {}},
+                    ROUND_NAMES[2]: {"category": "", "question": "", "answer": ""}
+                },
+                "daily_doubles": []
+            }
+            
+            if engine == "lightweight":
+                sheets = read_workbook_rows(file_path)
+                progress("Reading workbook", 1, 1)
+                return self._parse_sheet_rows(sheets, game_data, progress)
+            
+            if engine == "streaming":
+                sheets = self._read_workbook_rows(file_path)
+                progress("Reading workbook", 1, 1)
+                return self._parse_sheet_rows(sheets, game_data, progress)
+            
+            # pandas is only imported when the pandas engine is used
+            import pandas as pd
+            
+            # Read Excel file
+            xl = pd.ExcelFile(file_path)
+            
+            # Check if the required sheets are present
+            for sheet_name in EXCEL_SHEET_NAMES:
+                if sheet_name not in xl.sheet_names:
+                    raise ExcelParseError(f"Sheet '{sheet_name}' not found in the Excel file.", sheet_name)
+            
+            if self.vectorized:
+                parse_round = self._parse_jeopardy_round_vectorized
+                parse_daily_doubles = self._parse_daily_doubles_vectorized
+            else:
+                parse_round = self._parse_jeopardy_round
+                parse_daily_doubles = self._parse_daily_doubles
+            
+            # Read the value ladders if the pack defines its own
+            ladders = {}
+            if 'Values' in xl.sheet_names:
+                values_df = pd.read_excel(file_path, sheet_name='Values')
+                if 'Round' in values_df.columns and 'Values' in values_df.columns:
+                    ladders = self._value_ladders(
+                        values_df[['Round', 'Values']].dropna().itertuples(index=False, name=None)
+                    )
+            
+            # Parse the Jeopardy and Double Jeopardy rounds
+            for sheet_name, round_name in zip(EXCEL_SHEET_NAMES[:2], ROUND_NAMES[:2]):
+                round_df = pd.read_excel(file_path, sheet_name=sheet_name)
+                values = self._round_values(round_name, question_columns(round_df.columns), ladders)
+                parse_round(round_df, game_data, round_name, values)
+                progress(round_name, 1, 1)
+            
+            # Parse Final Jeopardy
+            final_df = pd.read_excel(file_path, sheet_name=EXCEL_SHEET_NAMES[2])
+            self._parse_final_jeopardy(final_df, game_data)
+            progress(ROUND_NAMES[2], 1, 1)
+            
+            # Parse Daily Doubles if the sheet exists
+            if 'Daily Doubles' in xl.sheet_names:
+                dd_df = pd.read_excel(file_path, sheet_name='Daily Doubles')
+                parse_daily_doubles(dd_df, game_data)
+            else:
+                # Automatically assign Daily Doubles if not specified
+                self._assign_random_daily_doubles(game_data)
+            
+            return game_data
+            
+        except (ExcelParseError, LoadCancelled):
+            raise
+        except Exception as e:
+            raise ExcelParseError(f"Error parsing Excel file: {str(e)}") from e
+    
+    def _parse_sheet_rows(self, sheets, game_data, progress):
+        """Parse game data from the rows of every sheet, read in a single pass over the workbook.
+        
+        Args:
+            sheets (dict): Mapping of sheet name to a (columns, rows) tuple
+            game_data (dict): The game data dictionary to update
+            progress (callable): The progress callback
+            
+        Returns:
+            dict: The updated game data dictionary
+        """
+        # Check if the required sheets are present
+        for sheet_name in EXCEL_SHEET_NAMES:
+            if sheet_name not in sheets:
+                raise ExcelParseError(f"Sheet '{sheet_name}' not found in the Excel file.", sheet_name)
+        
+        ladders = self._parse_values_rows(sheets['Values']) if 'Values' in sheets else {}
+        for sheet_name, round_name in zip(EXCEL_SHEET_NAMES[:2], ROUND_NAMES[:2]):
+            sheet = sheets[sheet_name]
+            values = self._round_values(round_name, question_columns(sheet[0]), ladders)
+            self._parse_jeopardy_rows(sheet, game_data, round_name, values, progress)
+        self._parse_final_jeopardy_rows(sheets[EXCEL_SHEET_NAMES[2]], game_data)
+        progress(ROUND_NAMES[2], 1, 1)
+        
+        if 'Daily Doubles' in sheets:
+            self._parse_daily_doubles_rows(sheets['Daily Doubles'], game_data)
+        else:
+            self._assign_random_daily_doubles(game_data)
+        
+        return game_data
+    
+    def _read_workbook_rows(self, file_path):
+        """Open a workbook once and read the rows of every sheet.
+        
+        The first row of each sheet is treated as the header, matching pandas.read_excel.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            dict: Mapping of sheet name to a (columns, rows) tuple, where columns maps each
+                header name to its column index and rows is a list of value tuples
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheets = {}
+            for worksheet in workbook.worksheets:
+                rows = worksheet.iter_rows(values_only=True)
+                header = next(rows, ())
+                
+                columns = {}
+                for index, name in enumerate(header):
+                    if name is not None and str(name) not in columns:
+                        columns[str(name)] = index
+                
+                sheets[worksheet.title] = (columns, list(rows))
+            return sheets
+        finally:
+            workbook.close()
+    
+    def _parse_jeopardy_rows(self, sheet, game_data, round_name, values, progress=_no_progress):
+        """Parse a regular Jeopardy round from streamed worksheet rows.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the round's sheet
+            game_data (dict): The game data dictionary to update
+            round_name (str): The name of the round
+            values (list): The point values of the question columns, in order
+            progress (callable, optional): Called after each category. Defaults to no reporting.
+        """
+        columns, rows = sheet
+        category_index = columns['Category']
+        question_indices = [(columns[name], value) for name, value in zip(question_columns(columns), values)]
+        
+        categories = []
+        questions = {}
+        for row_number, row in enumerate(rows, 1):
+            category = _cell(row, category_index)
+            if category is None:
+                continue
+            categories.append(category)
+            progress(round_name, row_number, len(rows))
+            questions.setdefault(category, {})
+            
+            if category == '':
+                continue
+                
+            for column_index, value in question_indices:
+                qa_text = _cell(row, column_index)
+                if qa_text is None or qa_text == '':
+                    continue
+                    
+                question, answer = self._parse_qa_text(qa_text)
+                if question and answer:
+                    questions[category][value] = {
+                        "question": question,
+                        "answer": answer,
+                        "is_daily_double": False
+                    }
+        
+        game_data["rounds"][round_name]["categories"] = categories
+        game_data["rounds"][round_name]["values"] = [value for _, value in question_indices]
+        game_data["rounds"][round_name]["questions"] = questions
+    
+    def _parse_values_rows(self, sheet):
+        """Parse the value ladders from the streamed rows of the Values sheet.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the Values sheet
+            
+        Returns:
+            dict: The value ladder of each round that has one
+        """
+        columns, rows = sheet
+        round_index = columns.get('Round')
+        values_index = columns.get('Values')
+        if round_index is None or values_index is None:
+            return {}
+        return self._value_ladders((_cell(row, round_index), _cell(row, values_index)) for row in rows)
+    
+    def _value_ladders(self, entries):
+        """Read value ladders from the rows of the Values sheet.
+        
+        Args:
+            entries (iterable): (round name, values) pairs, where values is a comma-separated
+                list of whole numbers or a single number
+                
+        Returns:
+            dict: The value ladder of each round that has one
+            
+        Raises:
+            ExcelParseError: If a round is unknown or its values are not distinct whole numbers
+        """
+        ladders = {}
+        for round_name, values in entries:
+            if round_name is None or values is None:
+                continue
+                
+            round_name = str(round_name).strip()
+            if round_name not in ROUND_NAMES[:2]:
+                raise ExcelParseError(f"Unknown round '{round_name}' in the Values sheet.", 'Values')
+            
+            ladder = []
+            for part in str(values).replace('$', '').split(','):
+                try:
+                    number = float(part)
+                except ValueError:
+                    number = None
+                if number is None or not number.is_integer():
+                    raise ExcelParseError(
+                        f"'{part.strip()}' in the {round_name} values is not a whole number.", 'Values'
+                    )
+                ladder.append(int(number))
+                
+            if len(set(ladder)) != len(ladder):
+                raise ExcelParseError(f"The {round_name} values must all be different.", 'Values')
+            ladders[round_name] = ladder
+        return ladders
+    
+    def _round_values(self, round_name, columns, ladders):
+        """Get the values of a round's question columns.
+        
+        Args:
+            round_name (str): The name of the round
+            columns (list): The round's question columns, in order
+            ladders (dict): The value ladders from the Values sheet
+            
+        Returns:
+            list: One value per question column
+            
+        Raises:
+            ExcelParseError: If the round's ladder has fewer values than question columns
+        """
+        values = ladders.get(round_name) or default_values(round_name, len(columns))
+        if len(values) < len(columns):
+            raise ExcelParseError(
+                f"The {round_name} round has {len(columns)} question columns but only {len(values)} values.",
+                'Values'
+            )
+        return values[:len(columns)]
+    
+    def _parse_final_jeopardy_rows(self, sheet, game_data):
+        """Parse the Final Jeopardy round from streamed worksheet rows.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the Final Jeopardy sheet
+            game_data (dict): The game data dictionary to update
+        """
+        columns, rows = sheet
+        item_index = columns['Item']
+        value_index = columns.get('Value')
+        if value_index is None:
+            return
+            
+        final_data = game_data["rounds"][ROUND_NAMES[2]]
+        found = set()
+        for row in rows:
+            item = _cell(row, item_index)
+            key = {'Category': "category", 'Question': "question", 'Answer': "answer"}.get(item)
+            if key is None or key in found:
+                continue
+                
+            found.add(key)
+            value = _cell(row, value_index)
+            if value is not None:
+                final_data[key] = str(value)
+    
+    def _parse_daily_doubles_rows(self, sheet, game_data):
+        """Parse the Daily Doubles from streamed worksheet rows.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the Daily Doubles sheet
+            game_data (dict): The game data dictionary to update
+        """
+        columns, rows = sheet
+        round_index = columns.get('Round')
+        category_index = columns.get('Category')
+        value_index = columns.get('Value')
+        
+        daily_doubles = []
+        for row in rows:
+            self._add_daily_double(
+                game_data,
+                _cell(row, round_index),
+                _cell(row, category_index),
+                _cell(row, value_index),
+                daily_doubles
+            )
+        
+        game_data["daily_doubles"] = daily_doubles
+        
+        # If no valid Daily Doubles were found, assign them randomly
+        if not daily_doubles:
+            self._assign_random_daily_doubles(game_data)
+    
+    def validate_file(self, file_path):
+        """Check a question file against the parsing rules and report every problem found.
+        
+        Unlike read_game_data, validation does not stop at the first problem.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            list: Issue dictionaries with "severity" ("error" or "warning"), "sheet", "cell"
+                (an A1-style reference, or None for whole-sheet problems) and "message"
+        """
+        issues = []
+        
+        try:
+            sheets = read_workbook_rows(file_path)
+        except Exception as e:
+            return [_issue("error", None, None, f"Cannot read workbook: {str(e)}")]
+        
+        for sheet_name in EXCEL_SHEET_NAMES:
+            if sheet_name not in sheets:
+                issues.append(_issue("error", sheet_name, None, f"Sheet '{sheet_name}' not found in the Excel file."))
+        
+        ladders = {}
+        if 'Values' in sheets:
+            try:
+                ladders = self._parse_values_rows(sheets['Values'])
+            except ExcelParseError as e:
+                issues.append(_issue("error", e.sheet, e.cell, str(e)))
+        
+        board = {}
+        for sheet_name, round_name in zip(EXCEL_SHEET_NAMES[:2], ROUND_NAMES[:2]):
+            if sheet_name not in sheets:
+                continue
+            columns = question_columns(sheets[sheet_name][0])
+            try:
+                values = self._round_values(round_name, columns, ladders)
+            except ExcelParseError as e:
+                issues.append(_issue("error", e.sheet, e.cell, str(e)))
+                values = default_values(round_name, len(columns))
+            board[round_name] = self._validate_round_rows(sheets[sheet_name], sheet_name, values, issues)
+        
+        if EXCEL_SHEET_NAMES[2] in sheets:
+            self._validate_final_jeopardy_rows(sheets[EXCEL_SHEET_NAMES[2]], issues)
+        
+        if 'Daily Doubles' in sheets:
+            self._validate_daily_doubles_rows(sheets['Daily Doubles'], board, issues)
+        else:
+            issues.append(_issue("warning", 'Daily Doubles', None,
+                                 "No Daily Doubles sheet; Daily Doubles will be assigned randomly."))
+        
+        return issues
+    
+    def _validate_round_rows(self, sheet, sheet_name, values, issues):
+        """Validate the rows of a regular round sheet.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the round's sheet
+            sheet_name (str): The name of the sheet
+            values (list): The point values of the question columns, in order
+            issues (list): The list of issues to add to
+            
+        Returns:
+            dict: The values of the playable questions in each category
+        """
+        columns, rows = sheet
+        board = {}
+        
+        category_index = columns.get('Category')
+        if category_index is None:
+            issues.append(_issue("error", sheet_name, "A1", "Column 'Category' not found."))
+            return board
+        
+        names = question_columns(columns)
+        if not names:
+            issues.append(_issue("error", sheet_name, None, "No question columns ('Question 1', 'Question 2', ...) found."))
+        else:
+            # Columns must be numbered without gaps for the values to line up
+            numbers = {_question_number(name) for name in names}
+            for number in range(1, max(numbers) + 1):
+                if number not in numbers:
+                    issues.append(_issue("error", sheet_name, None, f"Column 'Question {number}' not found."))
+        question_indices = [(columns[name], value) for name, value in zip(names, values)]
+        
+        for row_offset, row in enumerate(rows):
+            row_number = row_offset + 2  # Rows are 1-based and row 1 is the header
+            category = _cell(row, category_index)
+            has_questions = any(_cell(row, index) not in (None, '') for index, _ in question_indices)
+            
+            if category is None or category == '':
+                if has_questions:
+                    issues.append(_issue("error", sheet_name, _cell_ref(row_number, category_index),
+                                         "Questions in this row have no category and will be ignored."))
+                continue
+            
+            if category in board:
+                issues.append(_issue("warning", sheet_name, _cell_ref(row_number, category_index),
+                                     f"Duplicate category '{category}'; its questions are merged."))
+            category_values = board.setdefault(category, set())
+            
+            for column_index, value in question_indices:
+                cell = _cell_ref(row_number, column_index)
+                qa_text = _cell(row, column_index)
+                
+                if qa_text is None or qa_text == '':
+                    issues.append(_issue("error", sheet_name, cell, f"Missing ${value} question for '{category}'."))
+                    continue
+                if not isinstance(qa_text, str):
+                    issues.append(_issue("error", sheet_name, cell, "Cell is not text and will be ignored."))
+                    continue
+                
+                question, answer = self._parse_qa_text(qa_text)
+                if not question:
+                    issues.append(_issue("error", sheet_name, cell, "Question text is empty."))
+                elif not answer:
+                    issues.append(_issue("error", sheet_name, cell, "Answer text is empty."))
+                else:
+                    if answer == "No answer provided":
+                        issues.append(_issue("warning", sheet_name, cell,
+                                             "No answer found; use the format 'Question: X | Answer: Y'."))
+                    category_values.add(value)
+        
+        return board
+    
+    def _validate_final_jeopardy_rows(self, sheet, issues):
+        """Validate the rows of the Final Jeopardy sheet.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the Final Jeopardy sheet
+            issues (list): The list of issues to add to
+        """
+        columns, rows = sheet
+        sheet_name = EXCEL_SHEET_NAMES[2]
+        item_index = columns.get('Item')
+        value_index = columns.get('Value')
+        
+        if item_index is None or value_index is None:
+            missing = 'Item' if item_index is None else 'Value'
+            issues.append(_issue("error", sheet_name, "A1", f"Column '{missing}' not found."))
+            return
+        
+        found = {}
+        for row_offset, row in enumerate(rows):
+            item = _cell(row, item_index)
+            if item in ('Category', 'Question', 'Answer') and item not in found:
+                found[item] = (row_offset + 2, _cell(row, value_index))
+        
+        for item in ('Category', 'Question', 'Answer'):
+            if item not in found:
+                issues.append(_issue("error", sheet_name, None, f"Row '{item}' not found."))
+            elif found[item][1] is None or str(found[item][1]).strip() == '':
+                issues.append(_issue("error", sheet_name, _cell_ref(found[item][0], value_index),
+                                     f"Final Jeopardy {item.lower()} is empty."))
+    
+    def _validate_daily_doubles_rows(self, sheet, board, issues):
+        """Validate the rows of the Daily Doubles sheet.
+        
+        Args:
+            sheet (tuple): The (columns, rows) tuple for the Daily Doubles sheet
+            board (dict): The playable question values by round name and category
+            issues (list): The list of issues to add to
+        """
+        columns, rows = sheet
+        sheet_name = 'Daily Doubles'
+        indices = [columns.get('Round'), columns.get('Category'), columns.get('Value')]
+        
+        for name, index in zip(('Round', 'Category', 'Value'), indices):
+            if index is None:
+                issues.append(_issue("error", sheet_name, None, f"Column '{name}' not found."))
+        if None in indices:
+            return
+        
+        round_index, category_index, value_index = indices
+        valid = 0
+        for row_offset, row in enumerate(rows):
+            row_number = row_offset + 2
+            round_name, category, value = (_cell(row, index) for index in indices)
+            
+            if round_name is None and category is None and value is None:
+                continue
+            if round_name is None or category is None or value is None:
+                issues.append(_issue("error", sheet_name, _cell_ref(row_number, round_index),
+                                     "Daily Double row is incomplete and will be ignored."))
+                continue
+            
+            round_name = str(round_name).strip()
+            category = str(category).strip()
+            if round_name not in ROUND_NAMES[:2]:
+                issues.append(_issue("error", sheet_name, _cell_ref(row_number, round_index),
+                                     f"Unknown round '{round_name}'; use '{ROUND_NAMES[0]}' or '{ROUND_NAMES[1]}'."))
+                continue
+            
+            try:
+                value = int(value)
+            except (ValueError, TypeError):
+                issues.append(_issue("error", sheet_name, _cell_ref(row_number, value_index),
+                                     f"Value '{value}' is not a whole number."))
+                continue
+            
+            categories = board.get(round_name, {})
+            if category not in categories:
+                issues.append(_issue("error", sheet_name, _cell_ref(row_number, category_index),
+                                     f"Category '{category}' not found in the {round_name} round."))
+            elif value not in categories[category]:
+                issues.append(_issue("error", sheet_name, _cell_ref(row_number, value_index),
+                                     f"No ${value} question in '{category}'."))
+            else:
+                valid += 1
+        
+        if not valid:
+            issues.append(_issue("warning", sheet_name, None,
+                                 "No valid Daily Doubles; they will be assigned randomly."))
+    
+    def _parse_jeopardy_round(self, df, game_data, round_name, values):
+        """Parse a regular Jeopardy round from a DataFrame.
+        
+        Args:
+            df (DataFrame): The DataFrame containing round data
+            game_data (dict): The game data dictionary to update
+            round_name (str): The name of the round
+            values (list): The point values of the question columns, in order
+        """
+        import pandas as pd
+        
+        # Get categories (first column)
+        categories = df['Category'].dropna().tolist()
+        columns = list(zip(question_columns(df.columns), values))
+        game_data["rounds"][round_name]["categories"] = categories
+        game_data["rounds"][round_name]["values"] = [value for _, value in columns]
+        
+        # Initialize questions dictionary
+        questions = {}
+        for category in categories:
+            questions[category] = {}
+        
+        # Process each row (category)
+        for _, row in df.iterrows():
+            category = row['Category']
+            if pd.isna(category) or category == '':
+                continue
+                
+            # Process each question column
+            for col_name, value in columns:
+                if pd.isna(row[col_name]) or row[col_name] == '':
+                    continue
+                    
+                # Parse question and answer
+                qa_text = row[col_name]
+                question, answer = self._parse_qa_text(qa_text)
+                
+                if question and answer:
+                    if category not in questions:
+                        questions[category] = {}
+                        
+                    questions[category][value] = {
+                        "question": question,
+                        "answer": answer,
+                        "is_daily_double": False
+                    }
+        
+        game_data["rounds"][round_name]["questions"] = questions
+    
+    def _parse_jeopardy_round_vectorized(self, df, game_data, round_name, values):
+        """Parse a regular Jeopardy round from a DataFrame one column at a time.
+        
+        Produces the same result as _parse_jeopardy_round, but splits the question
+        and answer text with vectorized string operations over each column.
+        
+        Args:
+            df (DataFrame): The DataFrame containing round data
+            game_data (dict): The game data dictionary to update
+            round_name (str): The name of the round
+            values (list): The point values of the question columns, in order
+        """
+        category_column = df['Category']
+        categories = category_column.dropna().tolist()
+        columns = list(zip(question_columns(df.columns), values))
+        game_data["rounds"][round_name]["categories"] = categories
+        game_data["rounds"][round_name]["values"] = [value for _, value in columns]
+        
+        questions = {category: {} for category in categories}
+        has_category = category_column.notna() & (category_column != '')
+        
+        for col_name, value in columns:
+            question_column, answer_column = self._split_qa_column(df[col_name])
+            valid = (has_category & question_column.notna() & answer_column.notna() &
+                     (question_column != '') & (answer_column != ''))
+            
+            for category, question, answer in zip(
+                category_column[valid], question_column[valid], answer_column[valid]
+            ):
+                questions[category][value] = {
+                    "question": question,
+                    "answer": answer,
+                    "is_daily_double": False
+                }
+        
+        game_data["rounds"][round_name]["questions"] = questions
+    
+    def _split_qa_column(self, column):
+        """Split a column of "Question: X | Answer: Y" cells into questions and answers.
+        
+        Applies the rules of _parse_qa_text to the whole column at once.
+        
+        Args:
+            column (Series): The question column
+            
+        Returns:
+            tuple: A (questions, answers) tuple of Series; cells that are not text are NaN
+        """
+        import pandas as pd
+        
+        try:
+            text = column.astype(object).str
+        except AttributeError:
+            # The column holds no text at all
+            empty = pd.Series(float('nan'), index=column.index, dtype=object)
+            return empty, empty
+        
+        # Split by the '|' character, falling back to newlines
+        pipe_parts = text.split('|')
+        parts = pipe_parts.where(pipe_parts.str.len() >= 2, text.split('\n'))
+        has_answer = parts.str.len() >= 2
+        
+        # Remove "Question:" and "Answer:" prefixes if present
+        # (kept as objects, since a column where no cell has an answer gives all-NaN floats)
+        questions = parts.str.get(0).astype(object).str.strip().str.replace(_QUESTION_PREFIX, '', regex=True)
+        answers = parts.str.get(1).astype(object).str.strip().str.replace(_ANSWER_PREFIX, '', regex=True)
+        
+        # Text without an answer is used as the question as-is
+        questions = questions.where(has_answer, text.strip())
+        answers = answers.where(has_answer | questions.isna(), "No answer provided")
+        return questions, answers
+    
+    def _parse_final_jeopardy(self, df, game_data):
+        """Parse the Final Jeopardy round from a DataFrame.
+        
+        Args:
+            df (DataFrame): The DataFrame containing Final Jeopardy data
+            game_data (dict): The game data dictionary to update
+        """
+        # Find the rows for category, question, and answer
+        category_row = df[df['Item'] == 'Category']
+        question_row = df[df['Item'] == 'Question']
+        answer_row = df[df['Item'] == 'Answer']
+        
+        if not category_row.empty and 'Value' in category_row.columns:
+            game_data["rounds"][ROUND_NAMES[2]]["category"] = str(category_row['Value'].iloc[0])
+            
+        if not question_row.empty and 'Value' in question_row.columns:
+            game_data["rounds"][ROUND_NAMES[2]]["question"] = str(question_row['Value'].iloc[0])
+            
+        if not answer_row.empty and 'Value' in answer_row.columns:
+            game_data["rounds"][ROUND_NAMES[2]]["answer"] = str(answer_row['Value'].iloc[0])
+    
+    def _parse_daily_doubles(self, df, game_data):
+        """Parse the Daily Doubles from a DataFrame.
+        
+        Args:
+            df (DataFrame): The DataFrame containing Daily Doubles data
+            game_data (dict): The game data dictionary to update
+        """
+        import pandas as pd
+        
+        daily_doubles = []
+        
+        for _, row in df.iterrows():
+            round_name = row.get('Round')
+            category = row.get('Category')
+            value = row.get('Value')
+            
+            if pd.isna(round_name) or pd.isna(category) or pd.isna(value):
+                continue
+                
+            self._add_daily_double(game_data, round_name, category, value, daily_doubles)
+        
+        game_data["daily_doubles"] = daily_doubles
+        
+        # If no valid Daily Doubles were found, assign them randomly
+        if not daily_doubles:
+            self._assign_random_daily_doubles(game_data)
+    
+    def _parse_daily_doubles_vectorized(self, df, game_data):
+        """Parse the Daily Doubles from a DataFrame, dropping incomplete rows in bulk.
+        
+        Args:
+            df (DataFrame): The DataFrame containing Daily Doubles data
+            game_data (dict): The game data dictionary to update
+        """
+        daily_doubles = []
+        
+        columns = ['Round', 'Category', 'Value']
+        if all(column in df.columns for column in columns):
+            entries = df[columns].dropna()
+            for round_name, category, value in entries.itertuples(index=False, name=None):
+                self._add_daily_double(game_data, round_name, category, value, daily_doubles)
+        
+        game_data["daily_doubles"] = daily_doubles
+        
+        # If no valid Daily Doubles were found, assign them randomly
+        if not daily_doubles:
+            self._assign_random_daily_doubles(game_data)
+    
+    def _add_daily_double(self, game_data, round_name, category, value, daily_doubles):
+        """Mark a specified question as a Daily Double if it exists.
+        
+        Args:
+            game_data (dict): The game data dictionary to update
+            round_name: The round name read from the Daily Doubles sheet
+            category: The category read from the Daily Doubles sheet
+            value: The question value read from the Daily Doubles sheet
+            daily_doubles (list): The list of current Daily Doubles to update
+        """
+        if round_name is None or category is None or value is None:
+            return
+            
+        round_name = str(round_name).strip()
+        category = str(category).strip()
+        
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            return
+            
+        if round_name in ROUND_NAMES and round_name != ROUND_NAMES[2]:  # No Daily Doubles in Final Jeopardy
+            # Verify the category and value exist
+            if category in game_data["rounds"][round_name]["categories"]:
+                if category in game_data["rounds"][round_name]["questions"]:
+                    if value in game_data["rounds"][round_name]["questions"][category]:
+                        # Mark this question as a Daily Double
+                        game_data["rounds"][round_name]["questions"][category][value]["is_daily_double"] = True
+                        daily_doubles.append((round_name, category, value))
+    
+    def _assign_random_daily_doubles(self, game_data):
+        """Assign Daily Doubles randomly if none were specified.
+        
+        Args:
+            game_data (dict): The game data dictionary to update
+        """
+        daily_doubles = []
+        
+        # One Daily Double in Jeopardy round
+        self._add_random_daily_double(game_data, ROUND_NAMES[0], daily_doubles)
+        
+        # Two Daily Doubles in Double Jeopardy round
+        self._add_random_daily_double(game_data, ROUND_NAMES[1], daily_doubles)
+        self._add_random_daily_double(game_data, ROUND_NAMES[1], daily_doubles)
+        
+        game_data["daily_doubles"] = daily_doubles
+    
+    def _add_random_daily_double(self, game_data, round_name, daily_doubles):
+        """Add a random Daily Double to a round.
+        
+        Args:
+            game_data (dict): The game data dictionary to update
+            round_name (str): The name of the round to add the Daily Double to
+            daily_doubles (list): The list of current Daily Doubles to update
+        """
+        round_data = game_data["rounds"][round_name]
+        categories = round_data["categories"]
+        if not categories:
+            return
+            
+        # Get all available questions
+        available_questions = []
+        for category in categories:
+            if category in round_data["questions"]:
+                for value, question_data in round_data["questions"][category].items():
+                    if not question_data.get("is_daily_double", False):
+                        available_questions.append((category, value))
+        
+        if not available_questions:
+            return
+            
+        # Randomly select a question
+        category, value = random.choice(available_questions)
+        
+        # Mark it as a Daily Double
+        round_data["questions"][category][value]["is_daily_double"] = True
+        daily_doubles.append((round_name, category, value))
+    
+    def _parse_qa_text(self, text):
+        """Parse question and answer from text in the format "Question: X | Answer: Y".
+        
+        Args:
+            text (str): The text to parse
+            
+        Returns:
+            tuple: A tuple containing (question, answer), or (None, None) if parsing failed
+        """
+        if not isinstance(text, str):
+            return None, None
+            
+        try:
+            # Split by the '|' character
+            parts = text.split('|')
+            
+            if len(parts) < 2:
+                # Try to split by newline as an alternative
+                parts = text.split('\n')
+                
+            if len(parts) < 2:
+                # Simple fallback: assume the text is the question and there is no answer
+                return text.strip(), "No answer provided"
+            
+            # Extract question and answer
+            question_part = parts[0].strip()
+            answer_part = parts[1].strip()
+            
+            # Remove "Question:" and "Answer:" prefixes if present
+            if question_part.lower().startswith("question:"):
+                question_part = question_part[9:].strip()
+                
+            if answer_part.lower().startswith("answer:"):
+                answer_part = answer_part[7:].strip()
+            
+            return question_part, answer_part
+            
+        except Exception:
+            return text.strip(), "No answer provided"
+    
+    def ensure_template_exists(self):
+        """Ensure that the template Excel file exists.
+        
+        Returns:
+            str: Path to the template file
+        """
+        if not os.path.exists(DEFAULT_TEMPLATE_PATH):
+            # Create the templates directory if it doesn't exist
+            os.makedirs(os.path.dirname(DEFAULT_TEMPLATE_PATH), exist_ok=True)
+            
+            # Create the template file
+            return self.create_template(DEFAULT_TEMPLATE_PATH)
+        
+        return DEFAULT_TEMPLATE_PATH
+
+
+_QUESTION_PREFIX = re.compile(r'^question:\s*', re.IGNORECASE)
+_ANSWER_PREFIX = re.compile(r'^answer:\s*', re.IGNORECASE)
+_QUESTION_COLUMN = re.compile(r'^Question (\d+)$')
+
+
+def question_columns(names):
+    """Find the question columns of a round sheet, in board order.
+    
+    Args:
+        names (iterable): The sheet's column names
+        
+    Returns:
+        list: The names of the "Question N" columns, ordered by N
+    """
+    return sorted(
+        (name for name in names if _question_number(name) is not None),
+        key=_question_number
+    )
+
+
+def _question_number(name):
+    """Get the number of a "Question N" column.
+    
+    Args:
+        name: The column name
+        
+    Returns:
+        int: N, or None if the column is not a question column
+    """
+    match = _QUESTION_COLUMN.match(str(name).strip())
+    return int(match.group(1)) if match else None
+
+
+def default_values(round_name, num_rows):
+    """Build the standard value ladder for a round with any number of rows.
+    
+    The configured ladder is used as far as it goes and continued in steps of its
+    first value, so a 10-row Jeopardy round runs from $200 to $2000.
+    
+    Args:
+        round_name (str): The name of the round
+        num_rows (int): The number of questions in each category
+        
+    Returns:
+        list: The values
+    """
+    base = DOUBLE_JEOPARDY_VALUES if round_name == ROUND_NAMES[1] else JEOPARDY_VALUES
+    return list(base[:num_rows]) + [base[0] * (row + 1) for row in range(len(base), num_rows)]
+
+
+def find_workbooks(paths):
+    """Expand files and directories into a sorted list of workbook paths.
+    
+    Args:
+        paths (list): Files and directories
+        
+    Returns:
+        list: Paths of .xlsx files
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, file_names in os.walk(path):
+                found.extend(
+                    os.path.join(directory, file_name) for file_name in file_names
+                    if file_name.lower().endswith(".xlsx") and not file_name.startswith("~$")
+                )
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+def _issue(severity, sheet, cell, message):
+    """Build a validation issue.
+    
+    Args:
+        severity (str): "error" or "warning"
+        sheet (str): The sheet the issue is in, or None
+        cell (str): The A1-style cell reference, or None
+        message (str): Description of the issue
+        
+    Returns:
+        dict: The issue
+    """
+    return {"severity": severity, "sheet": sheet, "cell": cell, "message": message}
+
+
+def _cell_ref(row_number, column_index):
+    """Build an A1-style cell reference.
+    
+    Args:
+        row_number (int): The 1-based row number
+        column_index (int): The 0-based column index
+        
+    Returns:
+        str: The cell reference, such as "B3"
+    """
+    letters = ""
+    column_number = column_index + 1
+    while column_number:
+        column_number, remainder = divmod(column_number - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return f"{letters}{row_number}"
+
+
+def _cell(row, index):
+    """Return a cell value from a streamed row, treating empty cells as None.
+    
+    Args:
+        row (tuple): The row values
+        index (int): The column index, or None if the column is missing
+        
+    Returns:
+        The cell value, or None if the cell is empty or out of range
+    """
+    if index is None or index >= len(row):
+        return None
+    return row[index]
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+Jeopardy Game - Lightweight Workbook Reader
+-------------------------------------------
+This module reads the cell values of .xlsx workbooks using only the standard
+library, so question packs can be loaded without importing pandas or openpyxl.
+
+Numbers in cells with a date or time number format are read as datetime, time or
+timedelta values, as openpyxl (and so pandas) reads them.
+"""
+
+import datetime
+import posixpath
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse, fromstring
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+# Day zero of the workbook's date serial numbers, for the 1900 and 1904 date systems
+_EPOCH_1900 = datetime.datetime(1899, 12, 30)
+_EPOCH_1904 = datetime.datetime(1904, 1, 1)
+
+# Built-in number formats that show dates, times or elapsed time
+_BUILTIN_DATE_FORMATS = {
+    14: "mm-dd-yy", 15: "d-mmm-yy", 16: "d-mmm", 17: "mmm-yy", 18: "h:mm AM/PM",
+    19: "h:mm:ss AM/PM", 20: "h:mm", 21: "h:mm:ss", 22: "m/d/yy h:mm", 45: "mm:ss",
+    46: "[h]:mm:ss", 47: "mmss.0"
+}
+
+# Quoted text and bracketed colors or locales, which are shown as-is rather than read as codes
+_FORMAT_LITERAL = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_CODE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+_ELAPSED_CODE = re.compile(r"\[hh?\]|\[mm?\]|\[ss?\]", re.I)
+
+
+def read_workbook_rows(file_path):
+    """Read the rows of every sheet in a workbook.
+    
+    The first row of each sheet is treated as the header, matching pandas.read_excel.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        dict: Mapping of sheet name to a (columns, rows) tuple, where columns maps each
+            header name to its column index and rows is a list of value tuples
+    """
+    sheets = {}
+    with zipfile.ZipFile(file_path) as archive:
+        shared_strings = _read_shared_strings(archive)
+        date_styles = _read_date_styles(archive)
+        epoch = _date_epoch(archive)
+        
+        for sheet_name, sheet_path in _sheet_paths(archive):
+            with archive.open(sheet_path) as sheet_file:
+                rows = _read_sheet(sheet_file, shared_strings, date_styles, epoch)
+                
+            header = rows[0] if rows else ()
+            columns = {}
+            for index, name in enumerate(header):
+                if name is not None and str(name) not in columns:
+                    columns[str(name)] = index
+                    
+            sheets[sheet_name] = (columns, rows[1:])
+            
+    return sheets
+
+
+def _sheet_paths(archive):
+    """List the sheets of a workbook in order.
+    
+    Args:
+        archive (ZipFile): The open workbook archive
+        
+    Returns:
+        list: (sheet name, path inside the archive) tuples
+    """
+    targets = {}
+    relationships = fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for relationship in relationships.iter(f"{_PACKAGE_REL_NS}Relationship"):
+        target = relationship.get("Target")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join("xl", target))
+        targets[relationship.get("Id")] = target
+        
+    workbook = fromstring(archive.read("xl/workbook.xml"))
+    return [
+        (sheet.get("name"), targets[sheet.get(f"{_REL_NS}id")])
+        for sheet in workbook.iter(f"{_MAIN_NS}sheet")
+    ]
+
+
+def _read_shared_strings(archive):
+    """Read the shared string table of a workbook.
+    
+    Args:
+        archive (ZipFile): The open workbook archive
+        
+    Returns:
+        list: The shared strings, in index order
+    """
+    try:
+        data = archive.read("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+        
+    return [_text_of(item) for item in fromstring(data).iter(f"{_MAIN_NS}si")]
+
+
+def _read_date_styles(archive):
+    """Find the cell styles whose number format shows a date or time.
+    
+    Args:
+        archive (ZipFile): The open workbook archive
+        
+    Returns:
+        dict: Mapping of cell style index to True if the format shows elapsed time
+            (such as [h]:mm) rather than a date or time of day
+    """
+    try:
+        styles = fromstring(archive.read("xl/styles.xml"))
+    except KeyError:
+        return {}
+        
+    formats = dict(_BUILTIN_DATE_FORMATS)
+    for number_format in styles.iter(f"{_MAIN_NS}numFmt"):
+        formats[int(number_format.get("numFmtId"))] = number_format.get("formatCode", "")
+        
+    date_styles = {}
+    cell_styles = styles.find(f"{_MAIN_NS}cellXfs")
+    for index, style in enumerate(cell_styles if cell_styles is not None else ()):
+        # Only the format for positive numbers decides how the cell is read
+        code = formats.get(int(style.get("numFmtId", 0)), "").split(";")[0]
+        if _DATE_CODE.search(_FORMAT_LITERAL.sub("", code)):
+            date_styles[index] = _ELAPSED_CODE.search(code) is not None
+    return date_styles
+
+
+def _date_epoch(archive):
+    """Get day zero of a workbook's date serial numbers.
+    
+    Args:
+        archive (ZipFile): The open workbook archive
+        
+    Returns:
+        datetime: The epoch of the 1904 date system if the workbook uses it, otherwise
+            that of the 1900 date system
+    """
+    properties = fromstring(archive.read("xl/workbook.xml")).find(f"{_MAIN_NS}workbookPr")
+    if properties is not None and properties.get("date1904", "0").lower() in ("1", "true"):
+        return _EPOCH_1904
+    return _EPOCH_1900
+
+
+def _text_of(element):
+    """Join the text runs of a string item, skipping phonetic guides.
+    
+    Args:
+        element (Element): An <si> or <is> element
+        
+    Returns:
+        str: The string value
+    """
+    parts = []
+    for child in element:
+        if child.tag == f"{_MAIN_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_MAIN_NS}r":
+            for run_text in child.iter(f"{_MAIN_NS}t"):
+                parts.append(run_text.text or "")
+    return "".join(parts)
+
+
+def _read_sheet(sheet_file, shared_strings, date_styles=None, epoch=_EPOCH_1900):
+    """Stream the cell values of a worksheet.
+    
+    Args:
+        sheet_file (file): The worksheet XML file
+        shared_strings (list): The workbook's shared strings
+        date_styles (dict, optional): The date styles from _read_date_styles. Defaults to none.
+        epoch (datetime, optional): Day zero of date serial numbers. Defaults to the 1900
+            date system's.
+        
+    Returns:
+        list: One tuple of values per row, with None for empty cells
+    """
+    rows = []
+    row_tag = f"{_MAIN_NS}row"
+    cell_tag = f"{_MAIN_NS}c"
+    
+    for _, element in iterparse(sheet_file):
+        if element.tag != row_tag:
+            continue
+            
+        # Keep row numbers aligned when empty rows are omitted from the file
+        row_number = int(element.get("r", len(rows) + 1))
+        while len(rows) < row_number - 1:
+            rows.append(())
+            
+        values = []
+        for cell in element.iter(cell_tag):
+            match = _CELL_REF.match(cell.get("r", ""))
+            if match:
+                column_index = _column_index(match.group(1))
+                values.extend([None] * (column_index - len(values)))
+            values.append(_cell_value(cell, shared_strings, date_styles or {}, epoch))
+            
+        rows.append(tuple(values))
+        element.clear()
+        
+    # Pad rows to a common width so every column index is addressable
+    width = max((len(row) for row in rows), default=0)
+    return [row + (None,) * (width - len(row)) for row in rows]
+
+
+def _cell_value(cell, shared_strings, date_styles, epoch):
+    """Convert a <c> element to a Python value.
+    
+    Args:
+        cell (Element): The cell element
+        shared_strings (list): The workbook's shared strings
+        date_styles (dict): The date styles from _read_date_styles
+        epoch (datetime): Day zero of date serial numbers
+        
+    Returns:
+        The cell value as str, int, float, bool, datetime, time or timedelta, or None
+            if the cell is empty
+    """
+    cell_type = cell.get("t", "n")
+    
+    if cell_type == "inlineStr":
+        inline = cell.find(f"{_MAIN_NS}is")
+        return _text_of(inline) if inline is not None else None
+        
+    value = cell.findtext(f"{_MAIN_NS}v")
+    if value is None:
+        return None
+        
+    if cell_type == "s":
+        return shared_strings[int(value)]
+    if cell_type == "str":
+        return value
+    if cell_type == "b":
+        return value == "1"
+    if cell_type == "e":
+        return None
+    if cell_type == "d":
+        return datetime.datetime.fromisoformat(value)
+        
+    number = float(value)
+    style = int(cell.get("s", 0))
+    if style in date_styles:
+        return _date_value(number, epoch, date_styles[style])
+    return int(number) if number.is_integer() else number
+
+
+def _date_value(number, epoch, elapsed):
+    """Convert a date serial number to the value openpyxl reads for it.
+    
+    Args:
+        number (float): The serial number, in days since the epoch
+        epoch (datetime): Day zero of date serial numbers
+        elapsed (bool): Whether the number is an elapsed time rather than a date
+        
+    Returns:
+        datetime, time or timedelta: The value, or None if it is outside the range of dates
+    """
+    try:
+        if elapsed:
+            elapsed_time = datetime.timedelta(days=number)
+            if elapsed_time.microseconds:
+                # Kept to the millisecond, as openpyxl does
+                elapsed_time = datetime.timedelta(
+                    seconds=elapsed_time.total_seconds() // 1,
+                    microseconds=round(elapsed_time.microseconds, -3)
+                )
+            return elapsed_time
+            
+        day, fraction = divmod(number, 1)
+        time_of_day = datetime.timedelta(milliseconds=round(fraction * 86400000))
+        if 0 <= number < 1 and time_of_day.days == 0:
+            return (datetime.datetime.min + time_of_day).time()
+        if 0 < number < 60 and epoch == _EPOCH_1900:
+            day += 1  # Serial numbers before March 1900 count a February 29 that never was
+        return epoch + datetime.timedelta(days=day) + time_of_day
+    except OverflowError:
+        return None
+
+
+def _column_index(letters):
+    """Convert a column name such as "AB" to a zero-based index.
+    
+    Args:
+        letters (str): The column letters
+        
+    Returns:
+        int: The column index
+    """
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index - 1
\ No newline at end of file
@@ -14,9 +14,12 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from ui import JeopardyUI
-from game_logic import JeopardyGame
+from jeopardy_core import JeopardyGame
 from file_handler import ExcelHandler
-from config import DEFAULT_TEAMS, APP_TITLE, APP_SIZE
+from pack_cache import PackCache
+from game_journal import GameJournal, prune_journals
+from save_game import AutoSaver, prune_autosaves
+from config import DEFAULT_TEAMS, APP_TITLE, APP_SIZE, JOURNAL_KEEP, AUTOSAVE_KEEP
 
 
 def main():
@@ -29,24 +32,78 @@ def main():
     root.resizable(True, True)
     
     # Set up the Excel handler for loading game data
-    excel_handler = ExcelHandler()
+    excel_handler = ExcelHandler(cache=PackCache())
     
     # Initialize the game logic with default teams
     game = JeopardyGame(teams=DEFAULT_TEAMS)
     
-    # Create the UI and connect it to the game logic
-    ui = JeopardyUI(root, game, excel_handler)
+    # Journal and autosave the game once one is loaded
+    recorder = GameRecorder(game)
     
-    # Set up protocol for closing the application
-    root.protocol("WM_DELETE_WINDOW", lambda: on_closing(root))
+    # Create the UI and connect it to the game logic; it starts the buzzers if enabled.
+    # Closing the window and every Exit command go through on_closing.
+    ui = JeopardyUI(root, game, excel_handler, on_exit=lambda: on_closing(root, recorder, ui))
     
     # Start the main event loop
     root.mainloop()
 
 
-def on_closing(root):
+class GameRecorder:
+    """Starts the game journal and the autosave when the first game is loaded.
+    
+    Launches that never load questions or resume a game leave no files behind, and
+    only the most recent journals and autosaves are kept.
+    """
+    
+    def __init__(self, game):
+        """Initialize a GameRecorder object.
+        
+        Args:
+            game (JeopardyGame): The game to record
+        """
+        self.game = game
+        self.journal = None
+        self.autosaver = None
+        game.add_listener(self.record)
+    
+    def record(self, event):
+        """Start recording when a board is loaded (called by the game for every event).
+        
+        Args:
+            event (dict): The game event
+        """
+        if event["type"] != "load":
+            return
+            
+        self.game.remove_listener(self.record)
+        
+        # Delete old files first, leaving room for this game's
+        prune_journals(keep=JOURNAL_KEEP - 1)
+        prune_autosaves(keep=AUTOSAVE_KEEP - 1)
+        
+        # Record every game event so the game can be reconstructed later
+        self.journal = GameJournal()
+        self.journal.attach(self.game)
+        
+        # Save the game after every change so it can be resumed after a crash
+        self.autosaver = AutoSaver()
+        self.autosaver.attach(self.game)
+    
+    def close(self):
+        """Write everything still queued and stop recording."""
+        self.game.remove_listener(self.record)
+        if self.journal:
+            self.journal.close()
+        if self.autosaver:
+            self.autosaver.close()
+
+
+def on_closing(root, recorder, ui):
     """Handle the application closing event."""
     if messagebox.askokcancel("Quit", "Do you want to quit the game?"):
+        recorder.close()
+        if ui.buzzer:
+            ui.buzzer.stop()
         root.destroy()
 
 
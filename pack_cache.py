@@ -0,0 +1,186 @@
+"""
+Jeopardy Game - Game Pack Cache
+-------------------------------
+This module caches parsed game data on disk so that reloading a workbook
+does not need to parse the Excel file again.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+import zlib
+
+from config import PACK_CACHE_DIR, PACK_CACHE_MAX_BYTES
+
+# Bump when the layout of game data or of the cache files changes
+CACHE_FORMAT_VERSION = 3
+
+
+class PackCache:
+    """A size-bounded LRU cache of compiled game packs.
+    
+    Entries are keyed by a hash of the workbook contents. The file's modification
+    time and size are remembered so that an unchanged file is not hashed again.
+    Game data is stored with marshal and zlib, so a cache hit needs neither pandas
+    nor openpyxl. Daily Doubles are stored as they were assigned when the pack was
+    first parsed, so random placements stay the same on every cache hit.
+    """
+    
+    def __init__(self, cache_dir=PACK_CACHE_DIR, max_bytes=PACK_CACHE_MAX_BYTES):
+        """Initialize a PackCache object.
+        
+        Args:
+            cache_dir (str, optional): Directory for cache files. Defaults to PACK_CACHE_DIR.
+            max_bytes (int, optional): Maximum total size of cached packs. Defaults to PACK_CACHE_MAX_BYTES.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._index = None
+    
+    def get(self, file_path):
+        """Get the cached game data for a workbook.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            dict: The cached game data, or None if the workbook is not cached
+        """
+        try:
+            key = self._key_for(file_path)
+            index = self._load_index()
+            entry = index["entries"].get(key)
+            if entry is None:
+                return None
+                
+            with open(self._entry_path(key), "rb") as f:
+                game_data = marshal.loads(zlib.decompress(f.read()))
+                
+            entry["last_used"] = time.time()
+            self._save_index()
+            return game_data
+        except (OSError, ValueError, EOFError, TypeError, zlib.error):
+            return None
+    
+    def put(self, file_path, game_data):
+        """Store the game data parsed from a workbook.
+        
+        Args:
+            file_path (str): Path to the Excel file the data was parsed from
+            game_data (dict): The parsed game data
+        """
+        try:
+            key = self._key_for(file_path)
+            payload = zlib.compress(marshal.dumps(game_data))
+            
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = self._entry_path(key) + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, self._entry_path(key))
+            
+            index = self._load_index()
+            index["entries"][key] = {"bytes": len(payload), "last_used": time.time()}
+            self._evict()
+            self._save_index()
+        except (OSError, ValueError):
+            # The cache is an optimization; failing to write it is not an error
+            pass
+    
+    def clear(self):
+        """Remove every cached pack."""
+        index = self._load_index()
+        for key in list(index["entries"]):
+            self._remove_entry(key)
+        index["files"] = {}
+        self._save_index()
+    
+    def _key_for(self, file_path):
+        """Get the cache key for a workbook, hashing it only if it has changed.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            str: The cache key
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        index = self._load_index()
+        
+        known = index["files"].get(path)
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            return known["key"]
+            
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+                
+        # marshal data is only readable by the Python version that wrote it
+        key = f"{digest.hexdigest()}-v{CACHE_FORMAT_VERSION}-py{sys.version_info[0]}{sys.version_info[1]}"
+        index["files"][path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "key": key}
+        return key
+    
+    def _evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = self._load_index()["entries"]
+        total = sum(entry["bytes"] for entry in entries.values())
+        
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["bytes"]
+            self._remove_entry(key)
+    
+    def _remove_entry(self, key):
+        """Remove a single cache entry and its file.
+        
+        Args:
+            key (str): The cache key to remove
+        """
+        index = self._load_index()
+        index["entries"].pop(key, None)
+        index["files"] = {path: known for path, known in index["files"].items() if known["key"] != key}
+        
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+    
+    def _entry_path(self, key):
+        """Get the path of the file holding a cache entry.
+        
+        Args:
+            key (str): The cache key
+            
+        Returns:
+            str: Path to the entry file
+        """
+        return os.path.join(self.cache_dir, f"{key}.pack")
+    
+    def _load_index(self):
+        """Load the cache index from disk, or start an empty one.
+        
+        Returns:
+            dict: The cache index
+        """
+        if self._index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {"files": {}, "entries": {}}
+        return self._index
+    
+    def _save_index(self):
+        """Write the cache index to disk."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, self.index_path)
\ No newline at end of file
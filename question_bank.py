@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Question Bank
+-----------------------------
+This module stores clues from any number of question packs in a local SQLite
+database with a full-text index, so clues can be searched across packs and
+assembled into new games.
+
+Usage:
+    python question_bank.py ingest packs/ more_packs/pack.xlsx
+    python question_bank.py search --keyword "telephone" --value 400
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sqlite3
+import time
+
+from config import ROUND_NAMES, JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES, QUESTION_BANK_PATH
+from jeopardy_core import PackParser, ExcelParseError, find_workbooks
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS packs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    path TEXT,
+    content_hash TEXT NOT NULL UNIQUE,
+    imported_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clues (
+    id INTEGER PRIMARY KEY,
+    pack_id INTEGER NOT NULL REFERENCES packs(id) ON DELETE CASCADE,
+    round TEXT NOT NULL,
+    category TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS clues_by_category ON clues(category COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS clues_by_value ON clues(value);
+CREATE INDEX IF NOT EXISTS clues_by_board ON clues(pack_id, round, category, position);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS clues_fts USING fts5(
+    category, question, answer,
+    content='clues', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS clues_fts_insert AFTER INSERT ON clues BEGIN
+    INSERT INTO clues_fts(rowid, category, question, answer)
+    VALUES (new.id, new.category, new.question, new.answer);
+END;
+
+CREATE TRIGGER IF NOT EXISTS clues_fts_delete AFTER DELETE ON clues BEGIN
+    INSERT INTO clues_fts(clues_fts, rowid, category, question, answer)
+    VALUES ('delete', old.id, old.category, old.question, old.answer);
+END;
+"""
+
+CLUE_COLUMNS = "clues.id, packs.name, clues.round, clues.category, clues.value, clues.question, clues.answer"
+
+
+class QuestionBank:
+    """An indexed store of clues ingested from question packs."""
+    
+    def __init__(self, db_path=QUESTION_BANK_PATH, parser=None):
+        """Initialize a QuestionBank object, creating the database if needed.
+        
+        Args:
+            db_path (str, optional): Path to the SQLite database. Defaults to QUESTION_BANK_PATH.
+            parser (PackParser, optional): Parser used to ingest packs. Defaults to None.
+        """
+        if db_path != ":memory:" and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            
+        self.parser = parser or PackParser()
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+    
+    def ingest(self, file_path):
+        """Parse a question pack and add its clues to the bank.
+        
+        Packs are identified by content, so ingesting the same workbook twice is a no-op.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            int: The ID of the pack in the bank
+            
+        Raises:
+            ExcelParseError: If the file could not be parsed
+        """
+        content_hash = _file_hash(file_path)
+        existing = self._pack_id(content_hash)
+        if existing is not None:
+            return existing
+            
+        game_data = self.parser.read_game_data(file_path)
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return self.ingest_game_data(game_data, name, content_hash, os.path.abspath(file_path))
+    
+    def ingest_paths(self, paths):
+        """Ingest every .xlsx file in the given files and directories.
+        
+        Args:
+            paths (list): Files and directories to ingest
+            
+        Returns:
+            tuple: (number of packs ingested, list of (path, error message) failures)
+        """
+        ingested = 0
+        failures = []
+        for file_path in find_workbooks(paths):
+            try:
+                self.ingest(file_path)
+                ingested += 1
+            except (ExcelParseError, OSError) as e:
+                failures.append((file_path, str(e)))
+        return ingested, failures
+    
+    def ingest_game_data(self, game_data, name, content_hash, path=None):
+        """Add already parsed game data to the bank.
+        
+        Args:
+            game_data (dict): Game data as returned by PackParser.read_game_data
+            name (str): Display name of the pack
+            content_hash (str): Identifier of the pack's contents
+            path (str, optional): Where the pack was loaded from. Defaults to None.
+            
+        Returns:
+            int: The ID of the pack in the bank
+        """
+        existing = self._pack_id(content_hash)
+        if existing is not None:
+            return existing
+            
+        rows = []
+        for round_name in ROUND_NAMES[:2]:
+            round_data = game_data["rounds"][round_name]
+            for category in round_data["categories"]:
+                questions = round_data["questions"].get(category, {})
+                for position, value in enumerate(sorted(questions)):
+                    clue = questions[value]
+                    rows.append((round_name, str(category), position, value, clue["question"], clue["answer"]))
+                    
+        final_data = game_data["rounds"][ROUND_NAMES[2]]
+        if final_data["question"]:
+            rows.append((ROUND_NAMES[2], final_data["category"], 0, 0, final_data["question"], final_data["answer"]))
+            
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO packs (name, path, content_hash, imported_at) VALUES (?, ?, ?, ?)",
+                (name, path, content_hash, time.time())
+            )
+            pack_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO clues (pack_id, round, category, position, value, question, answer) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(pack_id,) + row for row in rows]
+            )
+        return pack_id
+    
+    def remove_pack(self, pack_id):
+        """Remove a pack and all of its clues from the bank.
+        
+        Args:
+            pack_id (int): The ID of the pack
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM clues WHERE pack_id = ?", (pack_id,))
+            self.connection.execute("DELETE FROM packs WHERE id = ?", (pack_id,))
+    
+    def search(self, keyword=None, category=None, value=None, round_name=None, limit=50):
+        """Search for clues.
+        
+        Args:
+            keyword (str, optional): Words that must appear in the category, question or answer.
+                Defaults to None.
+            category (str, optional): Exact category name, ignoring case. Defaults to None.
+            value (int, optional): Exact clue value. Defaults to None.
+            round_name (str, optional): Round the clue was written for. Defaults to None.
+            limit (int, optional): Maximum number of clues to return. Defaults to 50.
+            
+        Returns:
+            list: Clue dictionaries with id, pack, round, category, value, question and answer,
+                best full-text matches first
+        """
+        conditions = []
+        parameters = []
+        
+        if keyword:
+            source = "clues_fts JOIN clues ON clues.id = clues_fts.rowid JOIN packs ON packs.id = clues.pack_id"
+            conditions.append("clues_fts MATCH ?")
+            parameters.append(_match_query(keyword))
+            order = "clues_fts.rank"
+        else:
+            source = "clues JOIN packs ON packs.id = clues.pack_id"
+            order = "clues.id"
+            
+        if category is not None:
+            conditions.append("clues.category = ? COLLATE NOCASE")
+            parameters.append(category)
+        if value is not None:
+            conditions.append("clues.value = ?")
+            parameters.append(value)
+        if round_name is not None:
+            conditions.append("clues.round = ?")
+            parameters.append(round_name)
+            
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.connection.execute(
+            f"SELECT {CLUE_COLUMNS} FROM {source} {where} ORDER BY {order} LIMIT ?",
+            parameters + [limit]
+        )
+        return [_clue_dict(row) for row in rows]
+    
+    def categories(self, round_name=None, min_clues=None):
+        """List the categories in the bank.
+        
+        Args:
+            round_name (str, optional): Only list categories from this round. Defaults to None.
+            min_clues (int, optional): Only list categories with at least this many clues.
+                Defaults to None.
+                
+        Returns:
+            list: Category references as (pack ID, round name, category) tuples
+        """
+        conditions = ["round != ?"]
+        parameters = [ROUND_NAMES[2]]
+        if round_name is not None:
+            conditions.append("round = ?")
+            parameters.append(round_name)
+            
+        having = ""
+        if min_clues is not None:
+            having = "HAVING COUNT(*) >= ?"
+            parameters.append(min_clues)
+            
+        rows = self.connection.execute(
+            f"SELECT pack_id, round, category FROM clues WHERE {' AND '.join(conditions)} "
+            f"GROUP BY pack_id, round, category {having} ORDER BY pack_id, round, MIN(id)",
+            parameters
+        )
+        return [tuple(row) for row in rows]
+    
+    def random_categories(self, count, values=JEOPARDY_VALUES):
+        """Pick random categories that can fill a whole board column.
+        
+        Args:
+            count (int): Number of categories to pick
+            values (list, optional): The value ladder to fill. Defaults to JEOPARDY_VALUES.
+            
+        Returns:
+            list: Category references as (pack ID, round name, category) tuples
+        """
+        candidates = self.categories(min_clues=len(values))
+        return random.sample(candidates, min(count, len(candidates)))
+    
+    def export_game_data(self, jeopardy_categories, double_jeopardy_categories, final_clue_id=None):
+        """Assemble a game from categories in the bank.
+        
+        Clues keep their order within a category and are revalued to the target round's
+        value ladder, so a category from any round of any pack can be used in either round.
+        Daily Doubles are assigned randomly.
+        
+        Args:
+            jeopardy_categories (list): Category references for the Jeopardy round
+            double_jeopardy_categories (list): Category references for the Double Jeopardy round
+            final_clue_id (int, optional): ID of the Final Jeopardy clue. Defaults to a random one.
+            
+        Returns:
+            dict: Game data in the shape returned by PackParser.read_game_data
+        """
+        game_data = {
+            "rounds": {
+                ROUND_NAMES[0]: self._export_round(jeopardy_categories, JEOPARDY_VALUES),
+                ROUND_NAMES[1]: self._export_round(double_jeopardy_categories, DOUBLE_JEOPARDY_VALUES),
+                ROUND_NAMES[2]: self._export_final(final_clue_id)
+            },
+            "daily_doubles": []
+        }
+        self.parser._assign_random_daily_doubles(game_data)
+        return game_data
+    
+    def _export_round(self, category_refs, values):
+        """Build one round of exported game data.
+        
+        Args:
+            category_refs (list): Category references for the round
+            values (list): The round's value ladder
+            
+        Returns:
+            dict: The round's categories, value ladder and questions
+        """
+        categories = []
+        questions = {}
+        for pack_id, round_name, category in category_refs:
+            # Names must be unique on a board; the same category can come from several packs
+            name = category
+            suffix = 2
+            while name in questions:
+                name = f"{category} ({suffix})"
+                suffix += 1
+                
+            rows = self.connection.execute(
+                "SELECT question, answer FROM clues WHERE pack_id = ? AND round = ? AND category = ? "
+                "ORDER BY position LIMIT ?",
+                (pack_id, round_name, category, len(values))
+            )
+            categories.append(name)
+            questions[name] = {
+                value: {"question": row["question"], "answer": row["answer"], "is_daily_double": False}
+                for value, row in zip(values, rows)
+            }
+        return {"categories": categories, "values": list(values), "questions": questions}
+    
+    def _export_final(self, final_clue_id):
+        """Build the Final Jeopardy part of exported game data.
+        
+        Args:
+            final_clue_id (int): ID of the Final Jeopardy clue, or None for a random one
+            
+        Returns:
+            dict: The Final Jeopardy category, question and answer
+        """
+        if final_clue_id is None:
+            row = self.connection.execute(
+                "SELECT category, question, answer FROM clues WHERE round = ? ORDER BY RANDOM() LIMIT 1",
+                (ROUND_NAMES[2],)
+            ).fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT category, question, answer FROM clues WHERE id = ?", (final_clue_id,)
+            ).fetchone()
+            
+        if row is None:
+            return {"category": "", "question": "", "answer": ""}
+        return {"category": row["category"], "question": row["question"], "answer": row["answer"]}
+    
+    def _pack_id(self, content_hash):
+        """Look up a pack by its content hash.
+        
+        Args:
+            content_hash (str): Identifier of the pack's contents
+            
+        Returns:
+            int: The pack ID, or None if the pack is not in the bank
+        """
+        row = self.connection.execute("SELECT id FROM packs WHERE content_hash = ?", (content_hash,)).fetchone()
+        return row["id"] if row else None
+
+
+def _file_hash(file_path):
+    """Hash the contents of a file.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        str: Hex SHA-256 digest of the file
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _match_query(keyword):
+    """Turn free text into an FTS5 query that matches all of its words literally.
+    
+    Args:
+        keyword (str): The search text
+        
+    Returns:
+        str: The FTS5 MATCH expression
+    """
+    terms = keyword.split()
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _clue_dict(row):
+    """Convert a clue row to a dictionary.
+    
+    Args:
+        row (Row): A row selected with CLUE_COLUMNS
+        
+    Returns:
+        dict: The clue
+    """
+    return {
+        "id": row[0],
+        "pack": row[1],
+        "round": row[2],
+        "category": row[3],
+        "value": row[4],
+        "question": row[5],
+        "answer": row[6]
+    }
+
+
+def main():
+    """Command-line interface for the question bank."""
+    parser = argparse.ArgumentParser(description="Manage the Jeopardy question bank.")
+    parser.add_argument("--db", default=QUESTION_BANK_PATH, help="path to the question bank database")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    ingest_parser = commands.add_parser("ingest", help="add question packs to the bank")
+    ingest_parser.add_argument("paths", nargs="+", help=".xlsx files or directories of them")
+    
+    search_parser = commands.add_parser("search", help="search for clues")
+    search_parser.add_argument("--keyword", help="words in the category, question or answer")
+    search_parser.add_argument("--category", help="exact category name")
+    search_parser.add_argument("--value", type=int, help="clue value")
+    search_parser.add_argument("--round", dest="round_name", choices=ROUND_NAMES, help="round name")
+    search_parser.add_argument("--limit", type=int, default=20, help="maximum number of results")
+    
+    args = parser.parse_args()
+    bank = QuestionBank(args.db)
+    try:
+        if args.command == "ingest":
+            ingested, failures = bank.ingest_paths(args.paths)
+            print(f"Ingested {ingested} pack(s).")
+            for file_path, message in failures:
+                print(f"Skipped {file_path}: {message}")
+        else:
+            start = time.perf_counter()
+            clues = bank.search(args.keyword, args.category, args.value, args.round_name, args.limit)
+            elapsed = time.perf_counter() - start
+            for clue in clues:
+                print(f"[{clue['pack']}] {clue['round']} / {clue['category']} / ${clue['value']}")
+                print(f"    Q: {clue['question']}")
+                print(f"    A: {clue['answer']}")
+            print(f"{len(clues)} clue(s) in {elapsed * 1000:.1f} ms")
+    finally:
+        bank.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
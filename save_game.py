@@ -0,0 +1,317 @@
+"""
+Jeopardy Game - Saved Games
+---------------------------
+This module saves games in progress to a compact binary file and resumes them,
+without the question workbook being parsed again.
+
+A save file is a fixed header followed by two zlib-compressed JSON sections: the
+board, as snapshotted when it was loaded, and the current game state (scores,
+wagers, played clues, current team and round). The header holds a format version,
+the sequence number of the last event and a checksum of both sections.
+
+Saves are written to a temporary file that replaces the old one only once it is
+complete, so a crash mid-write leaves the previous save intact.
+"""
+
+import json
+import os
+import queue
+import re
+import struct
+import threading
+import time
+import zlib
+
+from config import SAVE_DIR, AUTOSAVE_DELAY, AUTOSAVE_KEEP
+from jeopardy_core import JeopardyGame
+
+SAVE_MAGIC = b"JEOPSAVE"
+SAVE_EXTENSION = ".jsave"
+
+# Bump when the layout of the header or of the sections changes
+SAVE_FORMAT_VERSION = 1
+
+# Magic, format version, reserved flags, last event, board bytes, state bytes, CRC-32
+_HEADER = struct.Struct("<8sHHQIII")
+
+# Autosaves are named for the time they were started, unlike the saves the host names
+_AUTOSAVE_NAME = re.compile(r"game-\d{8}-\d{6}" + re.escape(SAVE_EXTENSION) + "$")
+
+
+class SaveError(Exception):
+    """Exception raised when a save file cannot be read."""
+    pass
+
+
+def encode_section(data):
+    """Encode one section of a save file.
+    
+    Args:
+        data (dict): JSON-compatible data
+        
+    Returns:
+        bytes: The compressed section
+    """
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+def encode_save(board_section, state):
+    """Build the contents of a save file.
+    
+    Args:
+        board_section (bytes): The encoded board snapshot, from encode_section
+        state (dict): Snapshot of the game state taken without the board
+        
+    Returns:
+        bytes: The save file contents
+    """
+    state_section = encode_section(state)
+    checksum = zlib.crc32(state_section, zlib.crc32(board_section))
+    header = _HEADER.pack(SAVE_MAGIC, SAVE_FORMAT_VERSION, 0, state["seq"],
+                          len(board_section), len(state_section), checksum)
+    return header + board_section + state_section
+
+
+def write_save(path, data):
+    """Write a save file atomically.
+    
+    Args:
+        path (str): Path of the save file
+        data (bytes): The save file contents
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def read_save(path):
+    """Read and check a save file.
+    
+    Args:
+        path (str): Path of the save file
+        
+    Returns:
+        tuple: The board snapshot and the game state snapshot, to be restored in that order
+        
+    Raises:
+        SaveError: If the file is missing, damaged or from a newer version of the game
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise SaveError(f"Could not read {path}: {e}")
+        
+    if len(data) < _HEADER.size:
+        raise SaveError(f"{path} is not a saved game.")
+    magic, version, _, _, board_size, state_size, checksum = _HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise SaveError(f"{path} is not a saved game.")
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveError(f"{path} was saved by a newer version of the game.")
+        
+    body = memoryview(data)[_HEADER.size:]
+    if len(body) != board_size + state_size or zlib.crc32(body) != checksum:
+        raise SaveError(f"{path} is damaged.")
+        
+    try:
+        board = json.loads(zlib.decompress(body[:board_size]))
+        state = json.loads(zlib.decompress(body[board_size:]))
+    except (zlib.error, ValueError) as e:
+        raise SaveError(f"{path} is damaged: {e}")
+    return board, state
+
+
+def save_game(game, path):
+    """Save a game now, on the calling thread.
+    
+    Args:
+        game (JeopardyGame): The game to save
+        path (str): Path of the save file
+    """
+    write_save(path, encode_save(encode_section(game.snapshot(include_board=True)), game.snapshot(include_board=False)))
+
+
+def load_game(path, game=None):
+    """Resume a saved game.
+    
+    Args:
+        path (str): Path of the save file
+        game (JeopardyGame, optional): Game to load the save into, keeping its
+            listeners. Defaults to a new game.
+            
+    Returns:
+        JeopardyGame: The resumed game
+        
+    Raises:
+        SaveError: If the save file cannot be read
+    """
+    board, state = read_save(path)
+    game = game or JeopardyGame()
+    game.load_state(board, state)
+    return game
+
+
+def list_saves(directory=SAVE_DIR):
+    """List the save files in a directory, newest first.
+    
+    Args:
+        directory (str, optional): The directory. Defaults to SAVE_DIR.
+        
+    Returns:
+        list: Dictionaries of the form {"path": str, "modified": float}
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+        
+    saves = []
+    for name in names:
+        if name.endswith(SAVE_EXTENSION):
+            path = os.path.join(directory, name)
+            saves.append({"path": path, "modified": os.path.getmtime(path)})
+    return sorted(saves, key=lambda save: save["modified"], reverse=True)
+
+
+def prune_autosaves(directory=SAVE_DIR, keep=AUTOSAVE_KEEP):
+    """Delete all but the newest autosaves in a directory. Saves the host named are kept.
+    
+    Args:
+        directory (str, optional): The directory. Defaults to SAVE_DIR.
+        keep (int, optional): Number of autosaves to keep. Defaults to AUTOSAVE_KEEP.
+        
+    Returns:
+        list: Paths of the deleted autosaves
+    """
+    autosaves = [save["path"] for save in list_saves(directory)
+                 if _AUTOSAVE_NAME.match(os.path.basename(save["path"]))]
+    deleted = []
+    for path in autosaves[keep:]:
+        try:
+            os.remove(path)
+            deleted.append(path)
+        except OSError:
+            pass  # Left for the next time
+    return deleted
+
+
+class AutoSaver:
+    """Saves a game after every change on a background thread.
+    
+    The game's events are queued and applied to a copy of the game on the writer
+    thread, so the game itself is only read when a new board is loaded. Changes
+    made in quick succession, such as the events of one ruling, are written once.
+    """
+    
+    def __init__(self, path=None, delay=AUTOSAVE_DELAY):
+        """Initialize an AutoSaver object and start its writer thread.
+        
+        Args:
+            path (str, optional): Path of the save file. Defaults to a new timestamped
+                file in SAVE_DIR.
+            delay (float, optional): Seconds to collect changes before each write.
+                Defaults to AUTOSAVE_DELAY.
+        """
+        if path is None:
+            path = os.path.join(SAVE_DIR, time.strftime(f"game-%Y%m%d-%H%M%S{SAVE_EXTENSION}"))
+        self.path = path
+        self.delay = delay
+        self.game = None
+        self.error = None  # The last error raised while writing, if any
+        self._queue = queue.Queue()
+        
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+    
+    def attach(self, game):
+        """Start saving a game, beginning with its current state.
+        
+        Args:
+            game (JeopardyGame): The game to save
+        """
+        self.detach()
+        self.game = game
+        game.add_listener(self.record)
+        self._queue.put(("board", game.snapshot(include_board=True)))
+    
+    def detach(self):
+        """Stop saving the attached game."""
+        if self.game is not None:
+            self.game.remove_listener(self.record)
+            self.game = None
+    
+    def record(self, event):
+        """Queue a game event (called by the game for every event).
+        
+        Args:
+            event (dict): The game event
+        """
+        if event["type"] in ("load", "reset"):
+            # A new board cannot be rebuilt from events
+            self._queue.put(("board", self.game.snapshot(include_board=True)))
+        elif "after" in event:
+            self._queue.put(("event", event))
+    
+    def flush(self):
+        """Wait until every queued change has been saved."""
+        self._queue.join()
+    
+    def close(self):
+        """Save everything still queued and stop the writer thread."""
+        self.detach()
+        self._queue.put(None)
+        self._writer.join()
+    
+    def _write_loop(self):
+        """Apply queued changes and write the save file (runs on the writer thread)."""
+        shadow = JeopardyGame()
+        board_section = None
+        
+        while True:
+            # Block for the first change, then give the game a moment to make more
+            batch = [self._queue.get()]
+            if batch[0] is not None:
+                time.sleep(self.delay)
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                        
+            # Whatever goes wrong, the thread must keep taking items off the queue, or
+            # flush and close would wait for it forever
+            try:
+                for item in batch:
+                    if item is None:
+                        continue
+                    kind, data = item
+                    if kind == "board":
+                        shadow.restore(data)
+                        board_section = encode_section(data)
+                    else:
+                        shadow.apply_event(data)
+                        shadow.last_seq = data["seq"]
+                        
+                if board_section is not None and any(item is not None for item in batch):
+                    write_save(self.path, encode_save(board_section, shadow.snapshot(include_board=False)))
+                    self.error = None
+            except OSError as e:
+                self.error = e
+            except Exception as e:
+                # The copy of the game may no longer match the game, so keep the last good
+                # save rather than overwrite it until the next board is loaded
+                self.error = e
+                board_section = None
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if None in batch:
+                return
\ No newline at end of file
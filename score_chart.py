@@ -0,0 +1,132 @@
+"""
+Jeopardy Game - Score Chart
+---------------------------
+This module draws a live chart of the teams' scores over time from a ScoreHistory.
+
+Each update draws only the points recorded since the last one. When a point falls
+outside the chart, the axis it overflows is doubled and the chart redrawn once, so
+redraws become rarer as the game goes on.
+"""
+
+import tkinter as tk
+
+from config import BG_COLOR, TEXT_COLOR, SCORE_CHART_TIME_SPAN, SCORE_CHART_SCORE_SPAN
+
+# Space around the plot for the axis labels, in pixels
+_MARGIN = 50
+
+
+class ScoreChart:
+    """A canvas showing every team's score as a step line over time."""
+    
+    def __init__(self, parent, history, width=800, height=400):
+        """Initialize a ScoreChart object.
+        
+        Args:
+            parent (tk.Widget): The widget to draw the chart in
+            history (ScoreHistory): The score history to chart
+            width (int, optional): Initial width in pixels. Defaults to 800.
+            height (int, optional): Initial height in pixels. Defaults to 400.
+        """
+        self.history = history
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=BG_COLOR, highlightthickness=0)
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.time_span = SCORE_CHART_TIME_SPAN
+        self.score_min = -SCORE_CHART_SCORE_SPAN
+        self.score_max = SCORE_CHART_SCORE_SPAN
+        self._drawn = 0
+        self._start_time = None
+        self._last = {}  # Dict of form {team ID: (x, y) of the team's last point}
+        self._width = width - 2 * _MARGIN  # Plot size, measured on each redraw
+        self._height = height - 2 * _MARGIN
+    
+    def update(self):
+        """Draw the points recorded since the last update."""
+        history = self.history
+        if history.start_time != self._start_time or len(history) < self._drawn:
+            self.redraw()  # The history was started again
+            return
+            
+        points = history.since(self._drawn)
+        if not points:
+            return
+        if self._fit(points):
+            self.redraw()
+            return
+        self._draw(points)
+    
+    def redraw(self):
+        """Draw the whole chart again."""
+        self.canvas.delete("all")
+        self._drawn = 0
+        self._start_time = self.history.start_time
+        self._last = {}
+        self._width = max(self.canvas.winfo_width(), int(self.canvas["width"])) - 2 * _MARGIN
+        self._height = max(self.canvas.winfo_height(), int(self.canvas["height"])) - 2 * _MARGIN
+        
+        points = self.history.since(0)
+        self._fit(points)
+        self._draw_axes()
+        self._draw(points)
+    
+    def _fit(self, points):
+        """Grow the axes to fit new points.
+        
+        Args:
+            points (list): The points to fit
+            
+        Returns:
+            bool: True if an axis had to grow
+        """
+        grew = False
+        for seconds, _, _, score, _ in points:
+            while seconds > self.time_span:
+                self.time_span *= 2
+                grew = True
+            while score > self.score_max or score < self.score_min:
+                self.score_max *= 2
+                self.score_min *= 2
+                grew = True
+        return grew
+    
+    def _position(self, seconds, score):
+        """Get the canvas position of a point.
+        
+        Args:
+            seconds (float): Seconds since the history started
+            score (int): The score
+            
+        Returns:
+            tuple: The x and y coordinates
+        """
+        x = _MARGIN + self._width * seconds / self.time_span
+        y = _MARGIN + self._height * (self.score_max - score) / (self.score_max - self.score_min)
+        return x, y
+    
+    def _draw_axes(self):
+        """Draw the zero line and the axis labels."""
+        left, zero = self._position(0, 0)
+        right, top = self._position(self.time_span, self.score_max)
+        _, bottom = self._position(0, self.score_min)
+        self.canvas.create_line(left, zero, right, zero, fill=TEXT_COLOR, dash=(2, 4))
+        self.canvas.create_line(left, top, left, bottom, fill=TEXT_COLOR)
+        for y, score in ((top, self.score_max), (zero, 0), (bottom, self.score_min)):
+            self.canvas.create_text(left - 5, y, text=f"${score}", fill=TEXT_COLOR, anchor=tk.E)
+        self.canvas.create_text(right, bottom + 15, text=f"{self.time_span // 60} min",
+                                fill=TEXT_COLOR, anchor=tk.E)
+    
+    def _draw(self, points):
+        """Draw new points as steps from each team's previous point.
+        
+        Args:
+            points (list): The points recorded since the last draw
+        """
+        teams = self.history.teams
+        for seconds, team_id, _, score, _ in points:
+            x, y = self._position(seconds, score)
+            last = self._last.get(team_id)
+            if last is not None:
+                self.canvas.create_line(last[0], last[1], x, last[1], x, y,
+                                        fill=teams[team_id]["color"], width=2)
+            self._last[team_id] = (x, y)
+        self._drawn += len(points)
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Jeopardy Game - Score History
+-----------------------------
+This module records every score change of a game as a time series, for live
+score charts and for analysis after the game.
+
+Changes are stored column by column in typed arrays rather than as one object per
+change, so a recorded change costs a fixed 20 bytes. Clues are stored as indices
+into a table of the clues that changed a score.
+"""
+
+import csv
+import time
+from array import array
+
+
+class ScoreHistory:
+    """Records a game's score changes over time.
+    
+    Each point is a (time, team ID, change, score after, clue) tuple, where time is
+    in seconds since the history started and clue is a (round, category, value)
+    tuple, or None for changes not made by ruling on a clue. Loading or resetting
+    a game starts a new history, beginning with a point at every team's score.
+    """
+    
+    # Column name and array type code
+    COLUMNS = (("time", "f"), ("team", "I"), ("change", "i"), ("score", "i"), ("clue", "i"))
+    
+    def __init__(self, game):
+        """Initialize a ScoreHistory object and start recording the game's score changes.
+        
+        Args:
+            game (JeopardyGame): The game to record
+        """
+        self.game = game
+        self.clear()
+        game.add_listener(self._record)
+    
+    def detach(self):
+        """Stop recording the game's score changes."""
+        self.game.remove_listener(self._record)
+    
+    def clear(self):
+        """Forget all recorded points and start again from the teams' current scores."""
+        self.start_time = time.time()
+        self.teams = {}  # Dict of form {team ID: {"name": str, "color": str}}, including removed teams
+        self._columns = {name: array(code) for name, code in self.COLUMNS}
+        self._clues = []
+        self._clue_index = {}
+        self._add_teams(self.game.teams, self.start_time)
+    
+    def __len__(self):
+        """Get the number of recorded points."""
+        return len(self._columns["time"])
+    
+    @property
+    def bytes_per_point(self):
+        """The memory used by each recorded point, not counting the clue table.
+        
+        Returns:
+            int: Bytes per point
+        """
+        return sum(column.itemsize for column in self._columns.values())
+    
+    def point(self, index):
+        """Get a recorded point.
+        
+        Args:
+            index (int): The position of the point
+            
+        Returns:
+            tuple: The point, as (time, team ID, change, score, clue)
+        """
+        columns = self._columns
+        clue = columns["clue"][index]
+        return (columns["time"][index], columns["team"][index], columns["change"][index],
+                columns["score"][index], self._clues[clue] if clue >= 0 else None)
+    
+    def since(self, start):
+        """Get the points recorded after a given number of points, to draw only new ones.
+        
+        Args:
+            start (int): The number of points already seen
+            
+        Returns:
+            list: The new points, as tuples of (time, team ID, change, score, clue)
+        """
+        return [self.point(index) for index in range(start, len(self))]
+    
+    def series(self, team_id):
+        """Get one team's scores over time.
+        
+        Args:
+            team_id (int): The ID of the team
+            
+        Returns:
+            tuple: Lists of times and scores
+        """
+        columns = self._columns
+        indices = [index for index, team in enumerate(columns["team"]) if team == team_id]
+        return [columns["time"][index] for index in indices], [columns["score"][index] for index in indices]
+    
+    def to_columns(self):
+        """Export the recorded points as columns.
+        
+        The time, team, change, score and clue columns are copies of the underlying
+        arrays, which support the buffer protocol (e.g. numpy.frombuffer); clue holds
+        indices into the clues list, or -1.
+        
+        Returns:
+            dict: Dictionary of the form {column name: array, "clues": list, "teams": dict,
+                "start_time": float}
+        """
+        columns = {name: array(column.typecode, column) for name, column in self._columns.items()}
+        columns["clues"] = list(self._clues)
+        columns["teams"] = {team_id: dict(team) for team_id, team in self.teams.items()}
+        columns["start_time"] = self.start_time
+        return columns
+    
+    def export_csv(self, file_path):
+        """Write the recorded points to a CSV file, one row per point.
+        
+        Args:
+            file_path (str): Path of the CSV file
+        """
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["time", "team_id", "team", "change", "score", "round", "category", "value"])
+            for index in range(len(self)):
+                seconds, team_id, change, score, clue = self.point(index)
+                writer.writerow([
+                    round(seconds, 3), team_id, self.teams[team_id]["name"], change, score,
+                    *(clue or ("", "", ""))
+                ])
+    
+    def _record(self, event):
+        """Record a game event (called by the game for every event).
+        
+        Args:
+            event (dict): The game event
+        """
+        event_type = event["type"]
+        if event_type == "score":
+            clue = event.get("clue")
+            self._append(event["time"], event["team"], event["after"] - event["before"], event["after"],
+                         tuple(clue) if clue else None)
+        elif event_type in ("load", "reset"):
+            self.clear()
+        elif event_type == "teams":
+            self._add_teams(event["after"], event["time"])
+    
+    def _add_teams(self, teams, now):
+        """Note the names and colors of teams, starting a series for new ones.
+        
+        Args:
+            teams (iterable): Team dictionaries
+            now (float): The time of the change
+        """
+        for team in teams:
+            is_new = team["id"] not in self.teams
+            self.teams[team["id"]] = {"name": team["name"], "color": team["color"]}
+            if is_new:
+                self._append(now, team["id"], 0, team["score"], None)
+    
+    def _append(self, now, team_id, change, score, clue):
+        """Append a point to the columns.
+        
+        Args:
+            now (float): The time of the change
+            team_id (int): The ID of the team
+            change (int): The change in score
+            score (int): The score after the change
+            clue (tuple): The clue answered, or None
+        """
+        if clue is None:
+            clue_index = -1
+        else:
+            clue_index = self._clue_index.get(clue)
+            if clue_index is None:
+                clue_index = self._clue_index[clue] = len(self._clues)
+                self._clues.append(clue)
+                
+        columns = self._columns
+        columns["time"].append(now - self.start_time)
+        columns["team"].append(team_id)
+        columns["change"].append(change)
+        columns["score"].append(score)
+        columns["clue"].append(clue_index)
\ No newline at end of file
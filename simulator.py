@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Monte Carlo Simulator
+-------------------------------------
+This module plays large numbers of games without the GUI to evaluate scoring
+rules, board sizes and wagering strategies. Games are simulated in batches, with
+each team's score held in a NumPy array over every game in the batch, so one
+board step costs a handful of array operations however many games are played.
+
+The rules follow JeopardyGame: the team in control picks the clues, a correct
+answer gives the responding team control, the Daily Double belongs to the team in
+control and may be wagered up to the larger of its score and the round's top
+value, and only teams with a positive score wager in Final Jeopardy.
+
+Usage:
+    python simulator.py --games 1000000 --accuracy 0.6 0.5 0.4
+    python simulator.py --games 200000 --daily-double-wager half --final-wager shutout
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from config import (
+    JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES, SIMULATION_BATCH_SIZE, SIMULATION_DAILY_DOUBLES
+)
+
+
+class SkillModel:
+    """How likely each team is to respond to a clue and to answer it correctly."""
+    
+    def __init__(self, accuracy, buzz=None, attempt_rate=0.9, final_accuracy=None):
+        """Initialize a SkillModel object.
+        
+        Args:
+            accuracy (list): Probability that each team answers a clue correctly
+            buzz (list, optional): Relative chance of each team winning the buzzer.
+                Defaults to equal chances.
+            attempt_rate (float, optional): Probability that any team responds to a clue.
+                Defaults to 0.9.
+            final_accuracy (list, optional): Probability that each team answers Final
+                Jeopardy correctly. Defaults to accuracy.
+                
+        Raises:
+            ValueError: If the lists have different lengths or a probability is out of range
+        """
+        self.accuracy = np.asarray(accuracy, dtype=np.float64)
+        num_teams = len(self.accuracy)
+        self.buzz = np.ones(num_teams) if buzz is None else np.asarray(buzz, dtype=np.float64)
+        self.attempt_rate = float(attempt_rate)
+        self.final_accuracy = self.accuracy if final_accuracy is None else np.asarray(final_accuracy, dtype=np.float64)
+        
+        if num_teams == 0 or len(self.buzz) != num_teams or len(self.final_accuracy) != num_teams:
+            raise ValueError("accuracy, buzz and final_accuracy must have one entry per team.")
+        for probabilities in (self.accuracy, self.final_accuracy, [self.attempt_rate]):
+            if np.any((np.asarray(probabilities) < 0) | (np.asarray(probabilities) > 1)):
+                raise ValueError("Probabilities must be between 0 and 1.")
+        if np.any(self.buzz < 0) or not self.buzz.sum():
+            raise ValueError("Buzz weights must be non-negative and not all zero.")
+    
+    @property
+    def num_teams(self):
+        """Get the number of teams.
+        
+        Returns:
+            int: The number of teams
+        """
+        return len(self.accuracy)
+    
+    def responder_thresholds(self):
+        """Get cumulative probabilities for choosing the responding team.
+        
+        A uniform draw below thresholds[i] and above thresholds[i - 1] means team i
+        responds; a draw above the last threshold means nobody responds.
+        
+        Returns:
+            ndarray: The cumulative probability of each team responding
+        """
+        return np.cumsum(self.buzz / self.buzz.sum() * self.attempt_rate)
+
+
+def daily_double_true(scores, round_max):
+    """Wager everything allowed on a Daily Double.
+    
+    Args:
+        scores (ndarray): The wagering team's score in each game
+        round_max (int): The top clue value of the round
+        
+    Returns:
+        ndarray: The wager in each game
+    """
+    return np.maximum(scores, round_max)
+
+
+def daily_double_fraction(fraction):
+    """Build a wager model that bets a fixed share of the maximum Daily Double wager.
+    
+    Args:
+        fraction (float): The share of the maximum wager to bet
+        
+    Returns:
+        callable: The wager model
+    """
+    def wager(scores, round_max):
+        return np.maximum(1, (np.maximum(scores, round_max) * fraction).astype(np.int64))
+    return wager
+
+
+def final_all_in(scores):
+    """Wager every positive score in Final Jeopardy.
+    
+    Args:
+        scores (ndarray): Scores of shape (games, teams)
+        
+    Returns:
+        ndarray: Wagers of the same shape
+    """
+    return np.maximum(scores, 0)
+
+
+def final_zero(scores):
+    """Wager nothing in Final Jeopardy.
+    
+    Args:
+        scores (ndarray): Scores of shape (games, teams)
+        
+    Returns:
+        ndarray: Wagers of the same shape
+    """
+    return np.zeros_like(scores)
+
+
+def final_shutout(scores):
+    """Wager to lock the game when leading and everything otherwise.
+    
+    The leader bets just enough to stay ahead of the second-place team doubling its
+    score, or nothing if that is already impossible.
+    
+    Args:
+        scores (ndarray): Scores of shape (games, teams)
+        
+    Returns:
+        ndarray: Wagers of the same shape
+    """
+    wagers = np.maximum(scores, 0)
+    if scores.shape[1] < 2:
+        return wagers
+        
+    order = np.argsort(scores, axis=1)
+    rows = np.arange(len(scores))
+    leader = order[:, -1]
+    leading_score = scores[rows, leader]
+    second_score = scores[rows, order[:, -2]]
+    
+    lock = np.clip(2 * second_score - leading_score + 1, 0, np.maximum(leading_score, 0))
+    wagers[rows, leader] = lock
+    return wagers
+
+
+DAILY_DOUBLE_WAGERS = {
+    "true": daily_double_true,
+    "half": daily_double_fraction(0.5),
+    "quarter": daily_double_fraction(0.25)
+}
+FINAL_WAGERS = {
+    "all": final_all_in,
+    "zero": final_zero,
+    "shutout": final_shutout
+}
+
+
+class SimulationResult:
+    """Final scores of a set of simulated games, with summary statistics."""
+    
+    def __init__(self, scores, seconds):
+        """Initialize a SimulationResult object.
+        
+        Args:
+            scores (ndarray): Final scores of shape (games, teams)
+            seconds (float): Time taken by the simulation
+        """
+        self.scores = scores
+        self.seconds = seconds
+    
+    @property
+    def num_games(self):
+        """Get the number of games simulated.
+        
+        Returns:
+            int: The number of games
+        """
+        return len(self.scores)
+    
+    def win_rates(self):
+        """Get each team's share of wins, splitting ties evenly.
+        
+        Returns:
+            ndarray: The win rate of each team
+        """
+        best = self.scores.max(axis=1, keepdims=True)
+        winners = (self.scores == best).astype(np.float64)
+        return (winners / winners.sum(axis=1, keepdims=True)).mean(axis=0)
+    
+    def percentiles(self, points=(5, 25, 50, 75, 95)):
+        """Get percentiles of each team's final score.
+        
+        Args:
+            points (tuple, optional): The percentiles to compute. Defaults to (5, 25, 50, 75, 95).
+            
+        Returns:
+            ndarray: Array of shape (len(points), teams)
+        """
+        return np.percentile(self.scores, points, axis=0)
+    
+    def seconds_per_million(self):
+        """Get the simulation time scaled to one million games.
+        
+        Returns:
+            float: Seconds per million games
+        """
+        return self.seconds / self.num_games * 1_000_000
+    
+    def format_report(self):
+        """Format the score distributions and runtime as text.
+        
+        Returns:
+            str: The report
+        """
+        points = (5, 25, 50, 75, 95)
+        percentiles = self.percentiles(points)
+        lines = [
+            f"{self.num_games:,} games in {self.seconds:.2f} s ({self.seconds_per_million():.2f} s per million games)",
+            "",
+            f"{'team':>6} {'win rate':>9} {'mean':>9} {'std':>9} " + " ".join(f"{f'p{p}':>8}" for p in points)
+        ]
+        for team, win_rate in enumerate(self.win_rates()):
+            team_scores = self.scores[:, team]
+            lines.append(
+                f"{team + 1:>6} {win_rate:>9.1%} {team_scores.mean():>9.0f} {team_scores.std():>9.0f} " +
+                " ".join(f"{percentiles[i, team]:>8.0f}" for i in range(len(points)))
+            )
+        lines.append(f"{'':>6} negative final score in {np.mean(self.scores.max(axis=1) <= 0):.2%} of games")
+        return "\n".join(lines)
+
+
+def simulate_games(num_games, skill, daily_double_wager=daily_double_true, final_wager=final_all_in,
+                   num_categories=6, round_values=(JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES),
+                   daily_doubles=SIMULATION_DAILY_DOUBLES, seed=None, batch_size=SIMULATION_BATCH_SIZE):
+    """Simulate complete games.
+    
+    Args:
+        num_games (int): Number of games to play
+        skill (SkillModel): How the teams respond and answer
+        daily_double_wager (callable, optional): Function of (scores, round_max) returning
+            Daily Double wagers. Defaults to daily_double_true.
+        final_wager (callable, optional): Function of the (games, teams) score array
+            returning Final Jeopardy wagers. Defaults to final_all_in.
+        num_categories (int, optional): Categories per round. Defaults to 6.
+        round_values (tuple, optional): The value ladder of each regular round.
+            Defaults to (JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES).
+        daily_doubles (tuple, optional): Daily Doubles in each regular round.
+            Defaults to SIMULATION_DAILY_DOUBLES.
+        seed (int, optional): Seed for the random generator. Defaults to None.
+        batch_size (int, optional): Games simulated at once. Defaults to SIMULATION_BATCH_SIZE.
+        
+    Returns:
+        SimulationResult: The final scores
+    """
+    rng = np.random.default_rng(seed)
+    thresholds = skill.responder_thresholds()
+    scores = np.empty((num_games, skill.num_teams), dtype=np.int64)
+    
+    start = time.perf_counter()
+    for batch_start in range(0, num_games, batch_size):
+        batch = min(batch_size, num_games - batch_start)
+        scores[batch_start:batch_start + batch] = _simulate_batch(
+            batch, skill, thresholds, daily_double_wager, final_wager,
+            num_categories, round_values, daily_doubles, rng
+        )
+    return SimulationResult(scores, time.perf_counter() - start)
+
+
+def _simulate_batch(batch, skill, thresholds, daily_double_wager, final_wager,
+                    num_categories, round_values, daily_doubles, rng):
+    """Simulate one batch of games.
+    
+    Args:
+        batch (int): Number of games in the batch
+        skill (SkillModel): How the teams respond and answer
+        thresholds (ndarray): The skill model's responder thresholds
+        daily_double_wager (callable): The Daily Double wager model
+        final_wager (callable): The Final Jeopardy wager model
+        num_categories (int): Categories per round
+        round_values (tuple): The value ladder of each regular round
+        daily_doubles (tuple): Daily Doubles in each regular round
+        rng (Generator): The random generator
+        
+    Returns:
+        ndarray: Final scores of shape (batch, teams)
+    """
+    num_teams = skill.num_teams
+    rows = np.arange(batch)
+    accuracy = np.append(skill.accuracy, 0).astype(np.float32)  # Indexed by responder
+    
+    # Scores are stored team by team so that each team's scores are contiguous
+    scores = np.zeros((num_teams, batch), dtype=np.int32)
+    control = rng.integers(num_teams, size=batch)
+    
+    for values, num_daily_doubles in zip(round_values, daily_doubles):
+        values = np.asarray(values, dtype=np.int32)  # Pack ladders can go past int16
+        num_clues = num_categories * len(values)
+        round_max = int(values.max())
+        
+        # Each game plays the board in its own random order. Every random draw for the
+        # round is made up front, one row per board step; the per-round arrays use the
+        # smallest dtypes that fit, as their size sets the cost of every operation.
+        order = np.argsort(rng.random((batch, num_clues), dtype=np.float32), axis=1)
+        step_values = values[order.T % len(values)]
+        
+        buzz_draws = rng.random((num_clues, batch), dtype=np.float32)
+        responders = np.zeros((num_clues, batch), dtype=np.int8)
+        for threshold in thresholds:
+            responders += buzz_draws >= threshold  # num_teams means nobody responded
+        answer_draws = rng.random((num_clues, batch), dtype=np.float32)
+        
+        is_daily_double = np.zeros((num_clues, batch), dtype=bool)
+        is_daily_double[_distinct_steps(rng, batch, num_clues, num_daily_doubles), rows] = True
+        
+        # Regular clues go to whichever team won the buzzer, if any, and their score
+        # changes are worked out for the whole round at once
+        correct = answer_draws < accuracy[responders]
+        won = correct & ~is_daily_double  # accuracy is 0 for nobody, so this implies a response
+        change = step_values * (won.view(np.int8) * 2 - (responders < num_teams) * ~is_daily_double)
+        
+        for step in range(num_clues):
+            responder = responders[step]
+            for team in range(num_teams):
+                scores[team] += change[step] * (responder == team)
+                
+            # Daily Doubles go to the team in control, which keeps control either way
+            games = np.flatnonzero(is_daily_double[step])
+            if len(games):
+                team = control[games]
+                wager = daily_double_wager(scores[team, games], round_max)
+                right = answer_draws[step, games] < accuracy[team]
+                scores[team, games] += np.where(right, wager, -wager)
+            control = np.where(won[step], responder, control)
+    
+    # Final Jeopardy: only teams with a positive score may wager
+    scores = scores.T
+    wagers = np.where(scores > 0, np.clip(final_wager(scores), 0, np.maximum(scores, 0)), 0)
+    correct = rng.random((batch, num_teams)) < skill.final_accuracy
+    return scores + np.where(correct, wagers, -wagers)
+
+
+def _distinct_steps(rng, batch, num_clues, count):
+    """Choose distinct board steps in every game of a batch.
+    
+    Args:
+        rng (Generator): The random generator
+        batch (int): Number of games
+        num_clues (int): Number of steps on the board
+        count (int): Number of steps to choose in each game
+        
+    Returns:
+        ndarray: Array of shape (count, batch) of step indices
+    """
+    count = min(count, num_clues)
+    steps = rng.integers(num_clues, size=(count, batch))
+    
+    # Redraw any step that repeats an earlier choice; collisions are rare on a full board
+    for j in range(1, count):
+        while True:
+            clash = (steps[j] == steps[:j]).any(axis=0)
+            if not clash.any():
+                break
+            steps[j, clash] = rng.integers(num_clues, size=int(clash.sum()))
+    return steps
+
+
+def main():
+    """Command-line interface for the simulator."""
+    parser = argparse.ArgumentParser(description="Simulate Jeopardy games.")
+    parser.add_argument("--games", type=int, default=1_000_000, help="number of games to simulate")
+    parser.add_argument("--accuracy", type=float, nargs="+", default=[0.6, 0.55, 0.5],
+                        help="probability of a correct answer, one per team")
+    parser.add_argument("--buzz", type=float, nargs="+", help="relative buzzer speed, one per team")
+    parser.add_argument("--attempt-rate", type=float, default=0.9, help="probability that any team responds")
+    parser.add_argument("--categories", type=int, default=6, help="categories per round")
+    parser.add_argument("--daily-double-wager", choices=sorted(DAILY_DOUBLE_WAGERS), default="true")
+    parser.add_argument("--final-wager", choices=sorted(FINAL_WAGERS), default="all")
+    parser.add_argument("--seed", type=int, help="random seed")
+    args = parser.parse_args()
+    
+    skill = SkillModel(args.accuracy, args.buzz, args.attempt_rate)
+    result = simulate_games(
+        args.games, skill,
+        daily_double_wager=DAILY_DOUBLE_WAGERS[args.daily_double_wager],
+        final_wager=FINAL_WAGERS[args.final_wager],
+        num_categories=args.categories,
+        seed=args.seed
+    )
+    print(result.format_report())
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
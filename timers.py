@@ -0,0 +1,144 @@
+"""
+Jeopardy Game - Timers
+----------------------
+This module runs countdown timers on the Tk event loop. Any number of named timers
+can run at once, such as a clue clock, a per-team answer clock and the Final
+Jeopardy clock, without any threads.
+
+Each timer counts down to a deadline on the monotonic clock, and every tick is
+scheduled for the next whole interval before that deadline. A late tick therefore
+shows the true time left and the countdown does not drift, however busy the event
+loop is.
+"""
+
+import math
+import time
+
+from config import TIMER_TICK_INTERVAL
+
+
+class _Timer:
+    """One running countdown."""
+    
+    __slots__ = ("name", "deadline", "interval", "on_tick", "on_finish", "after_id")
+    
+    def __init__(self, name, deadline, interval, on_tick, on_finish):
+        """Initialize a _Timer object.
+        
+        Args:
+            name (str): The name of the timer
+            deadline (float): Monotonic clock time at which the timer runs out
+            interval (float): Seconds between ticks
+            on_tick (callable): Called with the seconds left on every tick, or None
+            on_finish (callable): Called when the timer runs out, or None
+        """
+        self.name = name
+        self.deadline = deadline
+        self.interval = interval
+        self.on_tick = on_tick
+        self.on_finish = on_finish
+        self.after_id = None
+
+
+class TimerScheduler:
+    """Runs named countdown timers with the after() calls of a Tk widget."""
+    
+    def __init__(self, root, clock=time.monotonic):
+        """Initialize a TimerScheduler object.
+        
+        Args:
+            root (tk.Misc): Widget whose event loop runs the timers
+            clock (callable, optional): Monotonic clock returning seconds. Defaults to
+                time.monotonic.
+        """
+        self.root = root
+        self.clock = clock
+        self.timers = {}  # Dict of form {name: _Timer}
+    
+    def start(self, name, seconds, on_tick=None, on_finish=None, interval=TIMER_TICK_INTERVAL):
+        """Start a timer, replacing any running timer with the same name.
+        
+        Args:
+            name (str): The name of the timer
+            seconds (float): Length of the countdown
+            on_tick (callable, optional): Called as on_tick(seconds_left) when the timer
+                starts and every interval after. Defaults to None.
+            on_finish (callable, optional): Called with no arguments when the timer runs
+                out. Defaults to None.
+            interval (float, optional): Seconds between ticks. Defaults to TIMER_TICK_INTERVAL.
+        """
+        self.cancel(name)
+        timer = _Timer(name, self.clock() + seconds, interval, on_tick, on_finish)
+        self.timers[name] = timer
+        self._tick(timer)
+    
+    def cancel(self, name):
+        """Stop a timer without calling its on_finish callback.
+        
+        Args:
+            name (str): The name of the timer
+            
+        Returns:
+            bool: True if the timer was running
+        """
+        timer = self.timers.pop(name, None)
+        if timer is None:
+            return False
+        if timer.after_id is not None:
+            self.root.after_cancel(timer.after_id)
+        return True
+    
+    def cancel_all(self):
+        """Stop every running timer."""
+        for name in list(self.timers):
+            self.cancel(name)
+    
+    def remaining(self, name):
+        """Get the time left on a timer.
+        
+        Args:
+            name (str): The name of the timer
+            
+        Returns:
+            float: Seconds left, or None if the timer is not running
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            return None
+        return max(0.0, timer.deadline - self.clock())
+    
+    def is_running(self, name):
+        """Check whether a timer is running.
+        
+        Args:
+            name (str): The name of the timer
+            
+        Returns:
+            bool: True if the timer is running
+        """
+        return name in self.timers
+    
+    def _tick(self, timer):
+        """Report the time left on a timer and schedule its next tick or finish it.
+        
+        Args:
+            timer (_Timer): The timer
+        """
+        timer.after_id = None
+        left = timer.deadline - self.clock()
+        if left <= 0:
+            del self.timers[timer.name]
+            if timer.on_tick:
+                timer.on_tick(0.0)
+            if timer.on_finish:
+                timer.on_finish()
+            return
+            
+        if timer.on_tick:
+            timer.on_tick(left)
+            if self.timers.get(timer.name) is not timer:
+                return  # The callback cancelled or restarted the timer
+                
+        # Wake at the next whole interval before the deadline, so late ticks don't add up
+        delay = left % timer.interval or timer.interval
+        timer.after_id = self.root.after(max(1, math.ceil(delay * 1000)), self._tick, timer)
\ No newline at end of file
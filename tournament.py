@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Jeopardy Game - Tournament Host
+-------------------------------
+This module hosts many games at once in a single asyncio process for league
+nights. The question pack is parsed once and its sound and image assets are read
+once, and every game gets its own JeopardyGame, command queue and clue timers. A
+bracket scheduler plays the matches of each bracket round concurrently and
+advances the winners until one team is left.
+
+Usage:
+    python tournament.py questions.xlsx --teams 27
+    python tournament.py questions.xlsx --teams 30 --teams-per-game 2 --pace 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+from config import (
+    ROUND_NAMES, QUESTION_TIMER, FINAL_JEOPARDY_TIMER, DAILY_DOUBLE_SOUND, FINAL_JEOPARDY_SOUND,
+    DEFAULT_TEAMS, TOURNAMENT_TEAMS_PER_GAME
+)
+from jeopardy_core import JeopardyGame, PackParser, build_rounds
+
+
+class SharedPack:
+    """A parsed question pack and asset cache shared by every game in a tournament.
+    
+    The parsed game data is never modified; each game builds its own rounds from it,
+    so the played state of one board cannot leak into another.
+    """
+    
+    def __init__(self, game_data):
+        """Initialize a SharedPack object.
+        
+        Args:
+            game_data (dict): Game data as returned by PackParser.read_game_data
+        """
+        self.game_data = game_data
+        self._assets = {}
+    
+    @classmethod
+    def from_file(cls, file_path, cache=None):
+        """Parse a question workbook once for the whole tournament.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            cache (PackCache, optional): Cache of compiled packs. Defaults to None.
+            
+        Returns:
+            SharedPack: The shared pack
+            
+        Raises:
+            ExcelParseError: If the file could not be parsed
+        """
+        return cls(PackParser(cache=cache).read_game_data(file_path))
+    
+    def new_rounds(self):
+        """Build a fresh set of rounds for one game.
+        
+        Returns:
+            tuple: The rounds by round name and the list of Daily Doubles, as taken by
+                JeopardyGame.install_rounds
+        """
+        return build_rounds(self.game_data), self.game_data["daily_doubles"]
+    
+    def asset(self, path):
+        """Get the contents of a sound or image file, reading it only once.
+        
+        Args:
+            path (str): Path of the asset
+            
+        Returns:
+            bytes: The file contents, or None if the file does not exist
+        """
+        if path not in self._assets:
+            try:
+                with open(path, "rb") as f:
+                    self._assets[path] = f.read()
+            except OSError:
+                self._assets[path] = None
+        return self._assets[path]
+
+
+class TournamentGame:
+    """One game of a tournament, driven by commands from its host.
+    
+    Commands are queued and applied one at a time by the game's run task, so hosts
+    of different games never wait on each other except for their turn on the event
+    loop. Each command's latency, from submission until it has been applied, is
+    recorded.
+    """
+    
+    def __init__(self, game_id, pack, teams, clue_time=QUESTION_TIMER, final_time=FINAL_JEOPARDY_TIMER):
+        """Initialize a TournamentGame object with a new board from the pack.
+        
+        Args:
+            game_id (str): Name of the game within the tournament
+            pack (SharedPack): The shared question pack
+            teams (list): List of team dictionaries
+            clue_time (float, optional): Seconds to answer a clue. Defaults to QUESTION_TIMER.
+            final_time (float, optional): Seconds to answer Final Jeopardy. Defaults to FINAL_JEOPARDY_TIMER.
+        """
+        self.game_id = game_id
+        self.pack = pack
+        self.clue_time = clue_time
+        self.final_time = final_time
+        self.game = JeopardyGame(teams)
+        self.game.install_rounds(*pack.new_rounds())
+        
+        self.current_question = None
+        self.latencies = []  # Seconds from submission to completion of each command
+        self.timeouts = 0
+        self._ruled_final = set()
+        self._closed = False
+        self._commands = asyncio.Queue()
+        self._timer = None
+    
+    async def request(self, command, *args):
+        """Submit a command and wait until it has been applied.
+        
+        Args:
+            command (str): One of "select", "wager", "rule", "next_round",
+                "final_wager", "rule_final" and "stop"
+            *args: The command's arguments
+            
+        Returns:
+            The command's result
+            
+        Raises:
+            ValueError: If the command is unknown or not allowed at this point
+        """
+        if self._closed:
+            raise ValueError(f"Game {self.game_id} is over.")
+        future = asyncio.get_running_loop().create_future()
+        self._commands.put_nowait((time.perf_counter(), command, args, future))
+        return await future
+    
+    async def run(self):
+        """Apply submitted commands until the game is over or stopped.
+        
+        Returns:
+            list: The winning team dictionaries
+        """
+        try:
+            while not self.game.game_over:
+                submitted, command, args, future = await self._commands.get()
+                if command == "stop":
+                    future.set_result(None)
+                    break
+                    
+                handler = getattr(self, f"_{command}", None)
+                try:
+                    if handler is None:
+                        raise ValueError(f"Unknown command: {command}")
+                    future.set_result(handler(*args))
+                except ValueError as e:
+                    future.set_exception(e)
+                self.latencies.append(time.perf_counter() - submitted)
+        finally:
+            self._closed = True
+            self._cancel_timer()
+            
+            # Commands queued behind the end of the game are refused
+            while not self._commands.empty():
+                future = self._commands.get_nowait()[3]
+                if not future.done():
+                    future.set_exception(ValueError(f"Game {self.game_id} is over."))
+                    
+        return self.game.get_winners()
+    
+    def _select(self, category, value):
+        """Select a clue and start its timer.
+        
+        Args:
+            category (str): The category name
+            value (int): The value of the clue
+            
+        Returns:
+            tuple: The Question and the sound to play, or None
+        """
+        if self.current_question is not None:
+            raise ValueError("A clue is already in play.")
+        question = self.game.select_question(category, value)
+        if question is None:
+            raise ValueError(f"No unplayed clue for {category} ${value}.")
+            
+        self.current_question = question
+        self._start_timer(self.clue_time)
+        return question, self.pack.asset(DAILY_DOUBLE_SOUND) if question.is_daily_double else None
+    
+    def _wager(self, wager):
+        """Record the team in control's Daily Double wager.
+        
+        Args:
+            wager (int): The amount wagered
+        """
+        if self.current_question is None or not self.current_question.is_daily_double:
+            raise ValueError("There is no Daily Double in play.")
+        self.game.place_daily_double_wager(wager)
+    
+    def _rule(self, team_id, correct):
+        """Rule on the answer to the clue in play.
+        
+        Args:
+            team_id (int): The ID of the team that answered
+            correct (bool): Whether the answer was correct
+            
+        Returns:
+            int: The points won or lost
+        """
+        if self.current_question is None:
+            raise ValueError("There is no clue in play.")
+            
+        self._cancel_timer()
+        points = self.game.rule(self.current_question, team_id, correct)
+        self.current_question = None
+        return points
+    
+    def _next_round(self):
+        """Move to the next round, starting the Final Jeopardy timer on reaching it.
+        
+        Returns:
+            tuple: The name of the new round, or None if the game is over, and the sound
+                to play, or None
+        """
+        self._cancel_timer()
+        round_name = self.game.next_round()
+        if round_name != ROUND_NAMES[2]:
+            return round_name, None
+            
+        self._start_timer(self.final_time)
+        return round_name, self.pack.asset(FINAL_JEOPARDY_SOUND)
+    
+    def _final_wager(self, team_id, wager):
+        """Record a team's Final Jeopardy wager.
+        
+        Args:
+            team_id (int): The ID of the team
+            wager (int): The amount wagered
+        """
+        self.game.place_final_wager(team_id, wager)
+    
+    def _rule_final(self, team_id, correct):
+        """Rule on a team's Final Jeopardy answer, ending the game after the last team.
+        
+        Args:
+            team_id (int): The ID of the team
+            correct (bool): Whether the answer was correct
+        """
+        self.game.rule_final(team_id, correct)
+        self._ruled_final.add(team_id)
+        if len(self._ruled_final) == len(self.game.teams):
+            self._cancel_timer()
+            self.game.end_game()
+    
+    def _start_timer(self, seconds):
+        """Start a countdown, replacing any that is running.
+        
+        Args:
+            seconds (float): The time allowed
+        """
+        self._cancel_timer()
+        self._timer = asyncio.get_running_loop().call_later(seconds, self._time_up)
+    
+    def _cancel_timer(self):
+        """Stop the running countdown, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _time_up(self):
+        """Retire the clue in play without a score change when its time runs out."""
+        self._timer = None
+        self.timeouts += 1
+        if self.current_question is not None:
+            with self.game.action("time_up"):
+                self.game.play_question(self.current_question)
+                if self.current_question.is_daily_double:
+                    self.game.place_daily_double_wager(None)
+            self.current_question = None
+
+
+class Bracket:
+    """A single-elimination bracket of multi-team matches.
+    
+    Each bracket round splits the remaining teams, in seed order, into matches of up
+    to teams_per_game teams. A team left on its own gets a bye into the next round.
+    """
+    
+    def __init__(self, team_names, teams_per_game=TOURNAMENT_TEAMS_PER_GAME):
+        """Initialize a Bracket object.
+        
+        Args:
+            team_names (list): Team names in seed order
+            teams_per_game (int, optional): Teams in each match. Defaults to TOURNAMENT_TEAMS_PER_GAME.
+            
+        Raises:
+            ValueError: If there are no teams, a name repeats or teams_per_game is below 2
+        """
+        if not team_names:
+            raise ValueError("A tournament needs at least one team.")
+        if len(set(team_names)) != len(team_names):
+            raise ValueError("Team names must be unique.")
+        if teams_per_game < 2:
+            raise ValueError("Each game needs at least two teams.")
+            
+        self.teams_per_game = teams_per_game
+        self.remaining = list(team_names)
+        self.history = []  # One list of (match, winner) pairs per completed bracket round
+    
+    @property
+    def champion(self):
+        """Get the winner of the tournament.
+        
+        Returns:
+            str: The champion's name, or None while the tournament is still running
+        """
+        return self.remaining[0] if len(self.remaining) == 1 else None
+    
+    def matches(self):
+        """Get the matches of the next bracket round.
+        
+        Returns:
+            list: Lists of team names, one per match; a single-team list is a bye
+        """
+        size = self.teams_per_game
+        matches = [self.remaining[i:i + size] for i in range(0, len(self.remaining), size)]
+        
+        # Rather than a last match of one team against nobody, move a team from the
+        # previous match across when that still leaves two teams in each
+        if len(matches) > 1 and len(matches[-1]) == 1 and len(matches[-2]) > 2:
+            matches[-1].insert(0, matches[-2].pop())
+        return matches
+    
+    def advance(self, winners):
+        """Record the results of a bracket round.
+        
+        Args:
+            winners (list): The winner of each match returned by matches, in order
+            
+        Raises:
+            ValueError: If a winner did not play in its match
+        """
+        matches = self.matches()
+        if len(winners) != len(matches) or any(w not in m for w, m in zip(winners, matches)):
+            raise ValueError("Each match needs exactly one winner from its own teams.")
+            
+        self.history.append(list(zip(matches, winners)))
+        self.remaining = list(winners)
+
+
+class Tournament:
+    """Plays a bracket with every match of a bracket round hosted concurrently."""
+    
+    def __init__(self, pack, bracket, host, clue_time=QUESTION_TIMER, final_time=FINAL_JEOPARDY_TIMER):
+        """Initialize a Tournament object.
+        
+        Args:
+            pack (SharedPack): The question pack every game is played on
+            bracket (Bracket): The bracket to play
+            host (callable): Coroutine function taking a TournamentGame, which drives
+                the game to its end by awaiting TournamentGame.request
+            clue_time (float, optional): Seconds to answer a clue. Defaults to QUESTION_TIMER.
+            final_time (float, optional): Seconds to answer Final Jeopardy. Defaults to FINAL_JEOPARDY_TIMER.
+        """
+        self.pack = pack
+        self.bracket = bracket
+        self.host = host
+        self.clue_time = clue_time
+        self.final_time = final_time
+        self.games = []  # Every game played so far
+    
+    async def run(self):
+        """Play bracket rounds until one team is left.
+        
+        Returns:
+            str: The champion's name
+        """
+        while self.bracket.champion is None:
+            matches = self.bracket.matches()
+            winners = await asyncio.gather(*(self.play_match(match) for match in matches))
+            self.bracket.advance(winners)
+        return self.bracket.champion
+    
+    async def play_match(self, team_names):
+        """Host one match, or give a lone team a bye.
+        
+        Ties are won by the team seeded highest in the match.
+        
+        Args:
+            team_names (list): The names of the teams in the match
+            
+        Returns:
+            str: The winner's name
+        """
+        if len(team_names) == 1:
+            return team_names[0]
+            
+        teams = [
+            {"name": name, "score": 0, "color": DEFAULT_TEAMS[i % len(DEFAULT_TEAMS)]["color"]}
+            for i, name in enumerate(team_names)
+        ]
+        round_number = len(self.bracket.history) + 1
+        match = TournamentGame(
+            f"R{round_number}-G{len(self.games) + 1}", self.pack, teams, self.clue_time, self.final_time
+        )
+        self.games.append(match)
+        
+        run = asyncio.create_task(match.run())
+        try:
+            await self.host(match)
+        finally:
+            if not run.done():
+                await match.request("stop")
+        winners = {team["name"] for team in await run}
+        return next(name for name in team_names if name in winners)
+
+
+def simulated_host(accuracy=0.6, pace=0.0, seed=None):
+    """Build a host that plays games by itself with random rulings.
+    
+    Used for demonstrations and load tests.
+    
+    Args:
+        accuracy (float, optional): Probability that an answer is ruled correct. Defaults to 0.6.
+        pace (float, optional): Mean seconds the host waits between commands. Defaults to 0.0.
+        seed (int, optional): Seed for the host's random choices. Defaults to None.
+        
+    Returns:
+        callable: Coroutine function taking a TournamentGame
+    """
+    rng = random.Random(seed)
+    
+    async def pause():
+        await asyncio.sleep(rng.expovariate(1 / pace) if pace else 0)
+        
+    async def host(match):
+        game = match.game
+        for _ in ROUND_NAMES[:2]:
+            for question in list(game.current_round.iter_questions()):
+                await pause()
+                try:
+                    question, _ = await match.request("select", question.category, question.value)
+                except ValueError:
+                    continue  # Retired by its timer meanwhile
+                    
+                if question.is_daily_double:
+                    score = game.current_team["score"]
+                    await match.request("wager", rng.randint(5, max(score, question.value)))
+                    team_id = game.current_team_id
+                else:
+                    team_id = rng.choice(game.teams.ids())
+                await pause()
+                try:
+                    await match.request("rule", team_id, rng.random() < accuracy)
+                except ValueError:
+                    pass  # The clue ran out of time first
+            await match.request("next_round")
+            
+        for team in list(game.teams):
+            await match.request("final_wager", team["id"], rng.randint(0, max(team["score"], 0)))
+        await pause()
+        for team_id in game.teams.ids():
+            await match.request("rule_final", team_id, rng.random() < accuracy)
+            
+    return host
+
+
+def summarize_latencies(games):
+    """Summarize the command latencies of a set of games.
+    
+    Args:
+        games (list): TournamentGame objects
+        
+    Returns:
+        dict: Number of commands and their median, 99th percentile and maximum
+            latency in seconds
+    """
+    latencies = sorted(latency for game in games for latency in game.latencies)
+    if not latencies:
+        return {"commands": 0, "median": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "commands": len(latencies),
+        "median": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max": latencies[-1]
+    }
+
+
+def main():
+    """Command-line interface for running a simulated tournament."""
+    parser = argparse.ArgumentParser(description="Run a Jeopardy tournament with simulated hosts.")
+    parser.add_argument("path", help="question workbook shared by every game")
+    parser.add_argument("--teams", type=int, default=27, help="number of teams entered")
+    parser.add_argument("--teams-per-game", type=int, default=TOURNAMENT_TEAMS_PER_GAME)
+    parser.add_argument("--pace", type=float, default=0.0, help="mean seconds between host commands")
+    parser.add_argument("--seed", type=int, help="random seed for the hosts")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.path):
+        parser.error(f"{args.path} does not exist")
+        
+    pack = SharedPack.from_file(args.path)
+    bracket = Bracket([f"Team {i}" for i in range(1, args.teams + 1)], args.teams_per_game)
+    tournament = Tournament(pack, bracket, simulated_host(pace=args.pace, seed=args.seed))
+    
+    start = time.perf_counter()
+    champion = asyncio.run(tournament.run())
+    elapsed = time.perf_counter() - start
+    
+    for round_number, results in enumerate(bracket.history, 1):
+        print(f"Round {round_number}:")
+        for match, winner in results:
+            print(f"  {' vs '.join(match):50} -> {winner}")
+    stats = summarize_latencies(tournament.games)
+    print(f"\nChampion: {champion}")
+    print(f"{len(tournament.games)} games, {stats['commands']} commands in {elapsed:.2f} s; "
+          f"latency median {stats['median'] * 1e6:.0f} us, p99 {stats['p99'] * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -5,46 +5,79 @@ This module contains the user interface for the Jeopardy game.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import math
 import os
-import time
+import queue
 import threading
 import random
-from PIL import Image, ImageTk
-import pygame
+from concurrent.futures import ThreadPoolExecutor
 
+from jeopardy_core import ExcelParseError, LoadCancelled, build_rounds, default_values
+from board_view import BOARD_VIEWS
+from timers import TimerScheduler
+from audio import SoundBank
+from assets import AssetManager
+from history import GameHistory
+from score_history import ScoreHistory
+from score_chart import ScoreChart
+from save_game import save_game, load_game, SaveError, SAVE_EXTENSION
+from wager_optimizer import final_wager_advice, daily_double_advice
+from buzzer import BuzzerServer
 from config import (
-    ROUND_NAMES, JEOPARDY_VALUES, DOUBLE_JEOPARDY_VALUES,
-    BG_COLOR, TEXT_COLOR, SELECTED_COLOR, PLAYED_COLOR,
+    ROUND_NAMES,
+    BG_COLOR, TEXT_COLOR, SELECTED_COLOR,
     CORRECT_COLOR, INCORRECT_COLOR, DAILY_DOUBLE_COLOR,
     CATEGORY_FONT, QUESTION_FONT, ANSWER_FONT, SCORE_FONT,
     BUTTON_FONT, TEAM_FONT, VALUE_FONT,
-    TIMER_SOUND, DAILY_DOUBLE_SOUND, FINAL_JEOPARDY_SOUND,
-    QUESTION_TIMER, FINAL_JEOPARDY_TIMER
+    QUESTION_TIMER, FINAL_JEOPARDY_TIMER, ANSWER_TIMER, LOAD_POLL_INTERVAL, SAVE_DIR, BOARD_RENDERER,
+    BUZZERS_ENABLED, WAGER_POLL_INTERVAL
 )
 
 
+# Menu names for the host actions that can be undone
+ACTION_LABELS = {
+    "rule": "Ruling",
+    "rule_final": "Final Jeopardy Ruling",
+    "final_results": "Final Jeopardy Results",
+    "final_wagers": "Final Jeopardy Wagers",
+    "daily_double_wager": "Daily Double Wager",
+    "set_teams": "Team Changes",
+    "reset_scores": "Score Reset",
+    "round": "Next Round",
+    "game_over": "End of Game"
+}
+
+
 class JeopardyUI:
     """Main UI class for the Jeopardy game."""
     
-    def __init__(self, root, game, excel_handler):
+    def __init__(self, root, game, excel_handler, on_exit=None):
         """Initialize the UI.
         
         Args:
             root (Tk): The root Tkinter window
             game (JeopardyGame): The game logic object
             excel_handler (ExcelHandler): The Excel file handler
+            on_exit (callable, optional): Called when the window is closed or the host
+                chooses Exit. Defaults to None, which destroys the window.
         """
         self.root = root
         self.game = game
         self.excel_handler = excel_handler
+        self.on_exit = on_exit or root.destroy
+        root.protocol("WM_DELETE_WINDOW", self._exit)
+        self.history = GameHistory(game)
+        self.score_history = ScoreHistory(game)
+        self.score_chart = None  # Shown on request
+        self.buzzer = None  # Without buzzers the host picks the answering team
         
-        # Initialize pygame for sound
-        try:
-            pygame.mixer.init()
-            self.sound_enabled = True
-        except:
-            self.sound_enabled = False
+        # Sounds are decoded in the background so the first one plays without a delay
+        self.sounds = SoundBank()
+        self.sounds.preload()
+        
+        # Images are decoded once and their scaled copies cached by window size
+        self.assets = AssetManager(root)
         
         # Create UI elements
         self._create_menu()
@@ -55,14 +88,18 @@ class JeopardyUI:
         
         # Game state variables
         self.current_question = None
-        self.timer_running = False
-        self.timer_thread = None
-        self.timer_value = 0
+        self.timers = TimerScheduler(root)
+        self.timer_text = None
+        self.answer_clock = None  # Name of the answering team's running clock
         self.wagering = False
-        self.wager_amount = 0
+        self.load_worker = None
+        self.wager_executor = None  # Started with the first Final Jeopardy advice
         
         # Show welcome screen
         self._show_welcome_screen()
+        
+        if BUZZERS_ENABLED:
+            self._start_buzzers()
     
     def _create_menu(self):
         """Create the application menu."""
@@ -73,17 +110,36 @@ class JeopardyUI:
         file_menu.add_command(label="New Game", command=self._new_game)
         file_menu.add_command(label="Load Questions", command=self._load_questions)
         file_menu.add_command(label="Create Template", command=self._create_template)
+        file_menu.add_command(label="Create Custom Template...", command=self._create_custom_template)
+        file_menu.add_separator()
+        file_menu.add_command(label="Save Game...", command=self._save_game)
+        file_menu.add_command(label="Resume Game...", command=self._resume_game)
+        file_menu.add_command(label="Export Score History...", command=self._export_score_history)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._exit)
         menu_bar.add_cascade(label="File", menu=file_menu)
         
+        # Edit menu, relabelled with the actions to undo and redo each time it opens
+        self.edit_menu = tk.Menu(menu_bar, tearoff=0, postcommand=self._update_edit_menu)
+        self.edit_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self._undo)
+        self.edit_menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self._redo)
+        menu_bar.add_cascade(label="Edit", menu=self.edit_menu)
+        self.root.bind("<Control-z>", lambda event: self._undo())
+        self.root.bind("<Control-y>", lambda event: self._redo())
+        
         # Game menu
         game_menu = tk.Menu(menu_bar, tearoff=0)
         game_menu.add_command(label="Manage Teams", command=self._manage_teams)
         game_menu.add_command(label="Reset Scores", command=self._reset_scores)
+        game_menu.add_command(label="Score Chart", command=self._show_score_chart)
+        game_menu.add_command(label="Board Timings", command=self._show_board_timings)
+        game_menu.add_separator()
+        game_menu.add_command(label="Buzzers...", command=self._start_buzzers)
+        game_menu.add_command(label="Stop Buzzers", command=self._stop_buzzers, state=tk.DISABLED)
         game_menu.add_separator()
         game_menu.add_command(label="Next Round", command=self._next_round)
         menu_bar.add_cascade(label="Game", menu=game_menu)
+        self.game_menu = game_menu
         
         # Help menu
         help_menu = tk.Menu(menu_bar, tearoff=0)
@@ -166,9 +222,8 @@ class JeopardyUI:
         self.board_frame = ttk.Frame(self.gameboard_frame)
         self.board_frame.pack(fill=tk.BOTH, expand=True)
         
-        # We'll create the actual board when questions are loaded
-        self.category_labels = []
-        self.question_buttons = []
+        # The board is created when a round is first shown and kept between clues
+        self.board_view = BOARD_VIEWS[BOARD_RENDERER](self.board_frame, self._select_question)
     
     def _create_status_bar(self):
         """Create the status bar UI."""
@@ -197,8 +252,7 @@ class JeopardyUI:
     def _show_welcome_screen(self):
         """Show the welcome screen."""
         # Clear the game board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+        self._clear_board()
         
         # Create welcome message
         welcome_frame = ttk.Frame(self.board_frame, padding="20")
@@ -212,6 +266,31 @@ class JeopardyUI:
         )
         welcome_label.pack(pady=(20, 10))
         
+        # The logo and background are shown once they have been scaled to the screen
+        background_label = tk.Label(welcome_frame, borderwidth=0)
+        logo_label = ttk.Label(welcome_frame)
+        
+        def show_background(photo):
+            if photo is not None and background_label.winfo_exists():
+                background_label.config(image=photo)
+                background_label.image = photo  # Keep the image alive if the cache drops it
+                background_label.place(x=0, y=0, relwidth=1, relheight=1)
+                background_label.lower()
+                
+        def show_logo(photo):
+            if photo is not None and logo_label.winfo_exists():
+                logo_label.config(image=photo)
+                logo_label.image = photo
+                if not logo_label.winfo_manager():
+                    logo_label.pack(before=welcome_label, pady=(10, 0))
+                    
+        def resized(event):
+            self.assets.request("welcome background", "background", event.width, event.height,
+                                show_background, fill=True)
+            self.assets.request("welcome logo", "logo", event.width // 2, event.height // 4, show_logo)
+            
+        welcome_frame.bind("<Configure>", resized)
+        
         instructions = (
             "To start a new game:\n\n"
             "1. Load questions from an Excel file using File > Load Questions\n"
@@ -246,95 +325,39 @@ class JeopardyUI:
         )
         template_button.pack(side=tk.LEFT, padx=10)
     
-    def _build_game_board(self):
-        """Build the game board based on the current round."""
-        # Clear existing board
+    def _clear_board(self):
+        """Remove whatever is showing in the board area, keeping the game board."""
+        self.board_view.hide()
         for widget in self.board_frame.winfo_children():
-            widget.destroy()
+            if widget is not self.board_view.widget:
+                widget.destroy()
+    
+    def _show_game_board(self):
+        """Show the game board for the current round."""
+        self._clear_board()
+        
+        # Back on the board no clue is open, even if the last one was never ruled on
+        self.current_question = None
+            
+        # No clue is showing, so nobody can buzz in
+        if self.buzzer:
+            self.buzzer.close()
         
         current_round = self.game.current_round
-        categories = current_round.categories
         
-        if not categories:
+        if not current_round.categories:
             messagebox.showinfo("Information", "No categories found. Please load questions first.")
             self._show_welcome_screen()
             return
         
-        # Determine grid dimensions
-        num_categories = len(categories)
-        
         # If we're in Final Jeopardy, show a special screen
         if self.game.current_round_name == ROUND_NAMES[2]:
             self._show_final_jeopardy_board()
             return
         
-        # Determine point values for this round
-        values = JEOPARDY_VALUES if self.game.current_round_name == ROUND_NAMES[0] else DOUBLE_JEOPARDY_VALUES
-        
-        # Create a grid of categories and questions
-        self.category_labels = []
-        self.question_buttons = [[] for _ in range(num_categories)]
-        
-        # Create the board grid
-        board_grid = ttk.Frame(self.board_frame)
-        board_grid.pack(fill=tk.BOTH, expand=True)
-        
-        # Configure grid layout (make all columns equal width)
-        for i in range(num_categories):
-            board_grid.columnconfigure(i, weight=1)
-        
-        # Add categories
-        for i, category in enumerate(categories):
-            category_frame = ttk.Frame(board_grid, padding="5")
-            category_frame.grid(row=0, column=i, sticky="nsew", padx=2, pady=2)
-            
-            category_label = tk.Label(
-                category_frame,
-                text=category,
-                font=CATEGORY_FONT,
-                bg=BG_COLOR,
-                fg=TEXT_COLOR,
-                wraplength=150,
-                height=2,
-                justify=tk.CENTER
-            )
-            category_label.pack(fill=tk.BOTH, expand=True)
-            self.category_labels.append(category_label)
-        
-        # Add question buttons
-        for i, category in enumerate(categories):
-            for j, value in enumerate(values):
-                question_frame = ttk.Frame(board_grid, padding="5")
-                question_frame.grid(row=j+1, column=i, sticky="nsew", padx=2, pady=2)
-                
-                question = current_round.get_question(category, value)
-                if question and not question.played:
-                    question_button = tk.Button(
-                        question_frame,
-                        text=f"${value}",
-                        font=VALUE_FONT,
-                        bg=BG_COLOR,
-                        fg=TEXT_COLOR,
-                        command=lambda cat=category, val=value: self._select_question(cat, val),
-                        relief=tk.RAISED,
-                        bd=2
-                    )
-                    
-                    # Mark Daily Doubles with a different color
-                    if question.is_daily_double:
-                        question_button.configure(bg=DAILY_DOUBLE_COLOR)
-                        
-                    question_button.pack(fill=tk.BOTH, expand=True)
-                    self.question_buttons[i].append(question_button)
-                else:
-                    # Empty or played question
-                    empty_label = tk.Label(
-                        question_frame,
-                        bg=PLAYED_COLOR,
-                        relief=tk.FLAT
-                    )
-                    empty_label.pack(fill=tk.BOTH, expand=True)
-                    self.question_buttons[i].append(None)
+        # The board is only built on a round's first showing; after that only the
+        # tiles played or changed since are redrawn
+        self.board_view.show(current_round)
     
     def _show_final_jeopardy_board(self):
         """Show the Final Jeopardy board."""
@@ -400,17 +423,15 @@ class JeopardyUI:
             category (str): The selected category
             value (int): The point value of the question
         """
-        current_round = self.game.current_round
-        question = current_round.get_question(category, value)
-        
-        if not question or question.played:
+        question = self.game.select_question(category, value)
+        if not question:
             return
         
         self.current_question = question
         
         # If this is a Daily Double, show the wager screen
         if question.is_daily_double:
-            self._play_sound(DAILY_DOUBLE_SOUND)
+            self.sounds.play("daily_double")
             self._show_daily_double(question)
         else:
             # Otherwise show the question directly
@@ -423,8 +444,7 @@ class JeopardyUI:
             question (Question): The Daily Double question
         """
         # Clear the game board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+        self._clear_board()
         
         daily_double_frame = ttk.Frame(self.board_frame, padding="20")
         daily_double_frame.pack(fill=tk.BOTH, expand=True)
@@ -467,7 +487,7 @@ class JeopardyUI:
         wager_label.pack(side=tk.LEFT)
         
         # Calculate maximum wager
-        max_wager = max(team['score'], 1000) if self.game.current_round_name == ROUND_NAMES[0] else max(team['score'], 2000)
+        max_wager = max(team['score'], max(self.game.current_round.values, default=0))
         
         self.wager_entry = ttk.Entry(
             wager_frame,
@@ -485,6 +505,28 @@ class JeopardyUI:
         )
         max_wager_label.pack(pady=5)
         
+        # Suggested wager, allowing for the clues still to come this game; the rounds keep
+        # count of their unplayed values, so the board is not scanned
+        remaining_values = self.game.current_round.remaining_values()
+        if not question.played:
+            remaining_values[question.value] -= 1
+        if self.game.current_round_name == ROUND_NAMES[0]:
+            for value, count in self.game.rounds[ROUND_NAMES[1]].remaining_values().items():
+                remaining_values[value] = remaining_values.get(value, 0) + count
+        advice = daily_double_advice(
+            team['score'],
+            [other['score'] for other in self.game.teams if other['id'] != team['id']],
+            max_wager,
+            remaining_values
+        )
+        advice_label = ttk.Label(
+            daily_double_frame,
+            text=f"Suggested wager: ${advice['optimal']} ({advice['win_probability']:.0%} to win)  "
+                 f"Safe wager: ${advice['safe']}",
+            font=(TEAM_FONT[0], 12, "italic")
+        )
+        advice_label.pack(pady=5)
+        
         # Submit button
         submit_button = ttk.Button(
             daily_double_frame,
@@ -504,7 +546,7 @@ class JeopardyUI:
             
             # Validate wager
             team = self.game.current_team
-            max_wager = max(team['score'], 1000) if self.game.current_round_name == ROUND_NAMES[0] else max(team['score'], 2000)
+            max_wager = max(team['score'], max(self.game.current_round.values, default=0))
             
             if wager <= 0:
                 messagebox.showerror("Invalid Wager", "Wager must be positive.")
@@ -515,7 +557,7 @@ class JeopardyUI:
                 return
                 
             # Store the wager and show the question
-            self.wager_amount = wager
+            self.game.place_daily_double_wager(wager)
             self._show_question(self.current_question)
             
         except ValueError:
@@ -528,8 +570,7 @@ class JeopardyUI:
             question (Question): The question to display
         """
         # Clear the game board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+        self._clear_board()
         
         question_display = ttk.Frame(self.board_frame, padding="20")
         question_display.pack(fill=tk.BOTH, expand=True)
@@ -544,7 +585,7 @@ class JeopardyUI:
         
         # Value
         if question.is_daily_double:
-            value_text = f"Daily Double: ${self.wager_amount}"
+            value_text = f"Daily Double: ${self.game.daily_double_wager}"
         else:
             value_text = f"${question.value}"
             
@@ -610,7 +651,41 @@ class JeopardyUI:
                 width=15
             )
             team_dropdown.pack(side=tk.LEFT)
+            team_dropdown.bind(
+                "<<ComboboxSelected>>",
+                lambda event: self._start_answer_clock(self.answering_team_var.get())
+            )
             
+            # The answering team's own clock, next to the team selector
+            self.answer_clock_label = ttk.Label(
+                team_frame,
+                text="",
+                font=(TEAM_FONT[0], 12)
+            )
+            self.answer_clock_label.pack(side=tk.LEFT, padx=(10, 0))
+            
+            # Buzzers: armed while the clue is read, opened by the host
+            if self.buzzer:
+                self.buzzer.set_teams([team["name"] for team in self.game.teams])
+                self.buzzer.arm()
+                
+                buzzer_frame = ttk.Frame(question_display)
+                buzzer_frame.pack(pady=10)
+                
+                self.open_buzzers_button = ttk.Button(
+                    buzzer_frame,
+                    text="Open Buzzers",
+                    command=self._open_buzzers
+                )
+                self.open_buzzers_button.pack(side=tk.LEFT, padx=10)
+                
+                self.buzz_label = ttk.Label(
+                    buzzer_frame,
+                    text="Buzzing in now locks a team out briefly",
+                    font=(TEAM_FONT[0], 12)
+                )
+                self.buzz_label.pack(side=tk.LEFT, padx=10)
+                
             # Correct/Incorrect buttons frame
             answer_buttons_frame = ttk.Frame(question_display)
             answer_buttons_frame.pack(pady=10)
@@ -709,29 +784,16 @@ class JeopardyUI:
         
         # Find the team that answered
         team_name = self.answering_team_var.get()
-        team_index = -1
+        team = self.game.teams.by_name(team_name)
         
-        for i, team in enumerate(self.game.teams):
-            if team["name"] == team_name:
-                team_index = i
-                break
-                
-        if team_index == -1:
+        if team is None:
             return
             
-        # Update score
-        points = self.current_question.value
-        self.game.update_score(team_index, points, correct)
-        
-        # Mark question as played
-        self.current_question.play()
+        # Update the score, mark the question as played and pass control
+        # (if correct, the answering team gets to choose next)
+        points = self.game.rule(self.current_question, team["id"], correct)
+        self.current_question = None
         
-        # Update the next team's turn (if correct, the answering team gets to choose next)
-        if correct:
-            self.game.current_team_index = team_index
-        else:
-            self.game.next_team()
-            
         # Update the UI
         self._update_scoreboard()
         self._update_status_bar()
@@ -743,7 +805,7 @@ class JeopardyUI:
             messagebox.showinfo("Incorrect", f"{team_name} loses ${points}!")
             
         # Return to the game board
-        self._build_game_board()
+        self._show_game_board()
         
         # Check if the round is complete
         if self.game.current_round.is_complete():
@@ -762,26 +824,24 @@ class JeopardyUI:
         # Stop the timer
         self._stop_timer()
         
-        # Update score
-        team_index = self.game.current_team_index
+        # Update the score and mark the question as played
+        team_id = self.game.current_team_id
         team_name = self.game.current_team["name"]
         
-        self.game.update_score(team_index, self.wager_amount, correct)
-        
-        # Mark question as played
-        self.current_question.play()
+        wager = self.game.rule(self.current_question, team_id, correct)
+        self.current_question = None
         
         # Update the UI
         self._update_scoreboard()
         
         # Show a message
         if correct:
-            messagebox.showinfo("Correct", f"{team_name} wins ${self.wager_amount}!")
+            messagebox.showinfo("Correct", f"{team_name} wins ${wager}!")
         else:
-            messagebox.showinfo("Incorrect", f"{team_name} loses ${self.wager_amount}!")
+            messagebox.showinfo("Incorrect", f"{team_name} loses ${wager}!")
             
         # Return to the game board
-        self._build_game_board()
+        self._show_game_board()
         
         # Check if the round is complete
         if self.game.current_round.is_complete():
@@ -793,7 +853,7 @@ class JeopardyUI:
         # Create a top-level window for wagers
         wager_window = tk.Toplevel(self.root)
         wager_window.title("Final Jeopardy Wagers")
-        wager_window.geometry("500x400")
+        wager_window.geometry("700x400")
         wager_window.transient(self.root)
         wager_window.grab_set()
         
@@ -817,8 +877,9 @@ class JeopardyUI:
         )
         instructions.pack(pady=(0, 20))
         
-        # Create entries for each team
+        # Create entries for each team, with space for the suggested wagers
         team_entries = []
+        advice_labels = []
         
         for team in self.game.teams:
             team_frame = ttk.Frame(wager_frame)
@@ -838,7 +899,21 @@ class JeopardyUI:
             wager_entry.pack(side=tk.LEFT)
             wager_entry.insert(0, str(team['score']))  # Default to current score
             
+            advice_label = ttk.Label(
+                team_frame,
+                text="Working out suggested wager...",
+                font=(TEAM_FONT[0], 10, "italic")
+            )
+            advice_label.pack(side=tk.LEFT, padx=(10, 0))
+            advice_labels.append(advice_label)
+            
             team_entries.append((team, wager_entry))
+            
+        # Advice for many teams takes a moment, so it is worked out on a worker thread
+        if self.wager_executor is None:
+            self.wager_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wager-advice")
+        advice = self.wager_executor.submit(final_wager_advice, [team['score'] for team in self.game.teams])
+        self.root.after(WAGER_POLL_INTERVAL, self._poll_final_wager_advice, advice, advice_labels)
         
         # Submit button
         submit_frame = ttk.Frame(wager_frame)
@@ -851,6 +926,31 @@ class JeopardyUI:
         )
         submit_button.pack()
     
+    def _poll_final_wager_advice(self, advice, advice_labels):
+        """Show the suggested Final Jeopardy wagers once the worker thread has them.
+        
+        Args:
+            advice (Future): The advice being worked out
+            advice_labels (list): One label per team for its suggestion
+        """
+        if not advice.done():
+            self.root.after(WAGER_POLL_INTERVAL, self._poll_final_wager_advice, advice, advice_labels)
+            return
+            
+        if not advice_labels or not advice_labels[0].winfo_exists():
+            return  # The wager window has been closed meanwhile
+            
+        try:
+            suggestions = [
+                f"Suggested ${team_advice['optimal']}, safe ${team_advice['safe']}"
+                for team_advice in advice.result()
+            ]
+        except Exception:
+            suggestions = ["No suggested wager"] * len(advice_labels)
+            
+        for label, text in zip(advice_labels, suggestions):
+            label.config(text=text)
+    
     def _submit_final_wagers(self, team_entries, window):
         """Submit wagers for Final Jeopardy.
         
@@ -858,8 +958,8 @@ class JeopardyUI:
             team_entries (list): List of (team, entry) tuples
             window (Toplevel): The wager window to close
         """
-        # Store wagers
-        self.final_wagers = {}
+        # Check every wager before storing any of them
+        wagers = []
         
         for team, entry in team_entries:
             try:
@@ -874,12 +974,16 @@ class JeopardyUI:
                     messagebox.showerror("Invalid Wager", f"Wager for {team['name']} cannot exceed current score (${team['score']}).")
                     return
                     
-                self.final_wagers[team['name']] = wager
+                wagers.append((team["id"], wager))
                 
             except ValueError:
                 messagebox.showerror("Invalid Wager", f"Please enter a valid number for {team['name']}.")
                 return
         
+        with self.game.action("final_wagers"):
+            for team_id, wager in wagers:
+                self.game.place_final_wager(team_id, wager)
+        
         # Close the window
         window.destroy()
         
@@ -892,7 +996,7 @@ class JeopardyUI:
             return
             
         # Make sure wagers have been submitted
-        if not hasattr(self, 'final_wagers'):
+        if not self.game.final_wagers:
             messagebox.showinfo("Wagers Required", "Please submit wagers before showing the question.")
             self._make_final_wagers()
             return
@@ -904,14 +1008,16 @@ class JeopardyUI:
             return
             
         category = final_round.categories[0]
-        question = final_round.questions[category][0]
+        question = final_round.get_question(category, 0)
+        if question is None:
+            messagebox.showinfo("Error", "No Final Jeopardy question found.")
+            return
         
         # Play the Final Jeopardy sound
-        self._play_sound(FINAL_JEOPARDY_SOUND)
+        self.sounds.play("final_jeopardy")
         
         # Clear the game board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+        self._clear_board()
         
         final_question_frame = ttk.Frame(self.board_frame, padding="20")
         final_question_frame.pack(fill=tk.BOTH, expand=True)
@@ -952,7 +1058,7 @@ class JeopardyUI:
         self.timer_label.pack(pady=10)
         
         # Start the timer
-        self._start_timer(FINAL_JEOPARDY_TIMER)
+        self._start_timer(FINAL_JEOPARDY_TIMER, "final")
         
         # Buttons
         buttons_frame = ttk.Frame(final_question_frame)
@@ -1024,12 +1130,12 @@ class JeopardyUI:
             
             team_check = ttk.Checkbutton(
                 team_frame,
-                text=f"{team['name']} (Wagered: ${self.final_wagers.get(team['name'], 0)})",
+                text=f"{team['name']} (Wagered: ${self.game.final_wagers.get(team['id'], 0)})",
                 variable=correct_var
             )
             team_check.pack(side=tk.LEFT)
             
-            team_responses.append((team, correct_var))
+            team_responses.append((team["id"], correct_var))
         
         # Submit button
         submit_button = ttk.Button(
@@ -1043,17 +1149,13 @@ class JeopardyUI:
         """Process the Final Jeopardy results.
         
         Args:
-            team_responses (list): List of (team, correct_var) tuples
+            team_responses (list): List of (team ID, correct_var) tuples
             window (Toplevel): The window to close
         """
         # Update scores
-        for team, correct_var in team_responses:
-            wager = self.final_wagers.get(team['name'], 0)
-            
-            for i, game_team in enumerate(self.game.teams):
-                if game_team['name'] == team['name']:
-                    self.game.update_score(i, wager, correct_var.get())
-                    break
+        with self.game.action("final_results"):
+            for team_id, correct_var in team_responses:
+                self.game.rule_final(team_id, correct_var.get())
         
         # Close the window
         window.destroy()
@@ -1067,8 +1169,7 @@ class JeopardyUI:
     def _show_game_results(self):
         """Show the final game results."""
         # Clear the game board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+        self._clear_board()
         
         results_frame = ttk.Frame(self.board_frame, padding="20")
         results_frame.pack(fill=tk.BOTH, expand=True)
@@ -1136,83 +1237,144 @@ class JeopardyUI:
         exit_button = ttk.Button(
             buttons_frame,
             text="Exit",
-            command=self.root.quit
+            command=self._exit
         )
         exit_button.pack(side=tk.LEFT, padx=10)
         
         # Mark game as over
-        self.game.game_over = True
+        self.game.end_game()
     
-    def _start_timer(self, seconds):
-        """Start a countdown timer.
+    def _start_timer(self, seconds, name="clue"):
+        """Start a countdown timer shown in the timer label.
         
         Args:
             seconds (int): The number of seconds for the timer
+            name (str, optional): The name of the timer. Defaults to "clue".
         """
-        self.timer_value = seconds
-        self.timer_running = True
-        
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_running = False
-            self.timer_thread.join()
-            
-        self.timer_thread = threading.Thread(target=self._timer_countdown)
-        self.timer_thread.daemon = True
-        self.timer_thread.start()
+        self.timer_text = None
+        self.timers.start(name, seconds, on_tick=self._update_timer_label, on_finish=self._timer_finished)
         
         # Play the timer sound
-        self._play_sound(TIMER_SOUND)
-    
-    def _timer_countdown(self):
-        """Countdown timer thread function."""
-        while self.timer_running and self.timer_value > 0:
-            # Update the timer label
-            self.root.after(0, self._update_timer_label)
-            
-            # Wait 1 second
-            time.sleep(1)
-            self.timer_value -= 1
-            
-        # Timer finished
-        if self.timer_running and self.timer_value <= 0:
-            self.root.after(0, self._timer_finished)
+        self.sounds.play("timer")
     
-    def _update_timer_label(self):
-        """Update the timer label with current value."""
-        if hasattr(self, 'timer_label'):
-            self.timer_label.config(text=f"Time remaining: {self.timer_value} seconds")
+    def _update_timer_label(self, seconds_left):
+        """Update the timer label with the time left.
+        
+        Args:
+            seconds_left (float): Seconds left on the timer
+        """
+        # Ticks come several times a second; the label only changes once a second
+        text = f"Time remaining: {math.ceil(seconds_left)} seconds"
+        if text != self.timer_text and self.timer_label.winfo_exists():
+            self.timer_label.config(text=text)
+            self.timer_text = text
     
     def _timer_finished(self):
         """Handle timer finished event."""
-        if hasattr(self, 'timer_label'):
+        if self.timer_label.winfo_exists():
             self.timer_label.config(text="Time's up!")
             
         # Play a sound or show a message
         messagebox.showinfo("Time's Up", "The time has expired!")
     
-    def _stop_timer(self):
-        """Stop the countdown timer."""
-        self.timer_running = False
+    def _open_buzzers(self):
+        """Let teams buzz in on the clue being shown."""
+        self.buzzer.open()
+        self.open_buzzers_button.config(state=tk.DISABLED)
+        self.buzz_label.config(text="Buzzers open!")
+    
+    def _show_buzz_winner(self, team_name, reaction_time):
+        """Make the first team to buzz in the answering team.
         
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_thread.join(0.1)
+        Args:
+            team_name (str): The name of the team
+            reaction_time (float): Seconds from the buzzers opening to the buzz
+        """
+        if not self.buzz_label.winfo_exists():
+            return  # The clue has been closed meanwhile
+            
+        self.answering_team_var.set(team_name)
+        self.buzz_label.config(text=f"{team_name} buzzed in ({reaction_time:.3f} s)")
+        self._start_answer_clock(team_name)
     
-    def _play_sound(self, sound_file):
-        """Play a sound effect.
+    def _start_answer_clock(self, team_name):
+        """Start a team's answer clock, stopping the clock of any team that answered before.
+        
+        The clue timer keeps running alongside it.
         
         Args:
-            sound_file (str): Path to the sound file
+            team_name (str): The name of the team
         """
-        if not self.sound_enabled:
+        team = self.game.teams.by_name(team_name)
+        if team is None:
             return
             
-        try:
-            if os.path.exists(sound_file):
-                pygame.mixer.music.load(sound_file)
-                pygame.mixer.music.play()
-        except Exception:
-            # Silently fail if sound can't be played
-            pass
+        if self.answer_clock is not None:
+            self.timers.cancel(self.answer_clock)
+        self.answer_clock = f"answer {team['id']}"
+        self.timers.start(
+            self.answer_clock,
+            ANSWER_TIMER,
+            on_tick=lambda seconds_left: self._update_answer_clock(team_name, seconds_left),
+            on_finish=lambda: self._update_answer_clock(team_name, None)
+        )
+    
+    def _update_answer_clock(self, team_name, seconds_left):
+        """Show the time a team has left to answer.
+        
+        Args:
+            team_name (str): The name of the team
+            seconds_left (float): Seconds left on the team's clock, or None once it has run out
+        """
+        if not self.answer_clock_label.winfo_exists():
+            return
+            
+        if seconds_left is None:
+            text = f"Time's up for {team_name}!"
+        else:
+            text = f"{team_name}: {math.ceil(seconds_left)} s to answer"
+        if self.answer_clock_label.cget("text") != text:
+            self.answer_clock_label.config(text=text)
+    
+    def _start_buzzers(self):
+        """Start listening for buzzers, if they are not already, and show how to join."""
+        if self.buzzer is None:
+            # Called on the buzzer thread, so hand the result over to the Tk thread
+            buzzer = BuzzerServer(
+                on_winner=lambda team, reaction: self.root.after(0, self._show_buzz_winner, team, reaction)
+            )
+            try:
+                buzzer.start()
+            except OSError as e:
+                messagebox.showerror("Buzzers", f"The buzzers could not be started:\n{e}")
+                return
+            self.buzzer = buzzer
+            self.game_menu.entryconfig("Stop Buzzers", state=tk.NORMAL)
+            
+        self._show_buzzer_info()
+    
+    def _show_buzzer_info(self):
+        """Show the address buzzers connect to and this game's join token."""
+        host, port = self.buzzer.address
+        messagebox.showinfo(
+            "Buzzers",
+            f"Buzzers are listening on {host}, port {port}.\n\n"
+            f"Join token for this game: {self.buzzer.token}\n\n"
+            f"To buzz in from another computer, set BUZZER_HOST in config.py and run:\n"
+            f"python buzzer.py --team \"Team 1\" --server <this computer> --token {self.buzzer.token}"
+        )
+    
+    def _stop_buzzers(self):
+        """Stop listening for buzzers; the host picks the answering team again."""
+        if self.buzzer is not None:
+            self.buzzer.stop()
+            self.buzzer = None
+            self.game_menu.entryconfig("Stop Buzzers", state=tk.DISABLED)
+    
+    def _stop_timer(self):
+        """Stop the countdown timers."""
+        self.timers.cancel_all()
+        self.answer_clock = None
     
     def _update_scoreboard(self):
         """Update the scoreboard display."""
@@ -1237,6 +1399,126 @@ class JeopardyUI:
                 )
                 indicator.pack(fill=tk.X)
                 frame.indicator = indicator
+                
+        if self.score_chart:
+            self.score_chart.update()
+    
+    def _show_score_chart(self):
+        """Open a window charting the teams' scores over time."""
+        if self.score_chart:
+            self.score_chart.canvas.winfo_toplevel().lift()
+            return
+            
+        chart_window = tk.Toplevel(self.root)
+        chart_window.title("Score Chart")
+        chart_window.geometry("900x500")
+        self.score_chart = ScoreChart(chart_window, self.score_history)
+        self.score_chart.canvas.pack(fill=tk.BOTH, expand=True)
+        
+        def close():
+            self.score_chart = None
+            chart_window.destroy()
+            
+        chart_window.protocol("WM_DELETE_WINDOW", close)
+    
+    def _show_board_timings(self):
+        """Show how long building and updating the game board has taken."""
+        summary = self.board_view.timings.summary()
+        if not summary:
+            messagebox.showinfo("Board Timings", "The board has not been drawn yet.")
+            return
+            
+        labels = {"build": "Build round", "sync": "Return to board", "tile": "Redraw tile", "layout": "Resize"}
+        lines = [
+            f"{labels.get(operation, operation)}: {stats['count']} times, median "
+            f"{stats['median'] * 1000:.2f} ms, p99 {stats['p99'] * 1000:.2f} ms, max {stats['max'] * 1000:.2f} ms"
+            for operation, stats in summary.items()
+        ]
+        messagebox.showinfo("Board Timings", "\n".join(lines))
+    
+    def _export_score_history(self):
+        """Export the score history to a CSV file chosen by the host."""
+        file_path = filedialog.asksaveasfilename(
+            title="Export Score History",
+            defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv")]
+        )
+        if not file_path:
+            return
+            
+        try:
+            self.score_history.export_csv(file_path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not export the score history:\n{e}")
+    
+    def _update_edit_menu(self):
+        """Label the Undo and Redo menu items with the actions they would apply."""
+        for index, label, action_name in (
+            (0, "Undo", self.history.undo_label()),
+            (1, "Redo", self.history.redo_label())
+        ):
+            if action_name:
+                self.edit_menu.entryconfig(index, label=f"{label} {ACTION_LABELS.get(action_name, action_name)}",
+                                           state=tk.NORMAL)
+            else:
+                self.edit_menu.entryconfig(index, label=label, state=tk.DISABLED)
+    
+    def _undo(self):
+        """Undo the most recent host action."""
+        if self._clue_in_progress():
+            messagebox.showinfo("Undo", "Finish the current question before undoing.")
+            return
+        self._render_changes(self.history.undo())
+    
+    def _redo(self):
+        """Redo the most recently undone host action."""
+        if self._clue_in_progress():
+            messagebox.showinfo("Redo", "Finish the current question before redoing.")
+            return
+        self._render_changes(self.history.redo())
+    
+    def _clue_in_progress(self):
+        """Check whether a question has been selected but not yet ruled on.
+        
+        The current question is cleared once it is ruled on and whenever the board is
+        shown, so an undone question that is unplayed again does not count as open.
+        
+        Returns:
+            bool: True if a question is open
+        """
+        return self.current_question is not None and not self.current_question.played
+    
+    def _render_changes(self, events):
+        """Update only the parts of the UI affected by a set of game events.
+        
+        Args:
+            events (list): The events that were applied
+        """
+        if not events:
+            return
+        
+        changed = {event["type"] for event in events}
+        
+        if "teams" in changed:
+            for widget in self.scoreboard_frame.winfo_children():
+                widget.destroy()
+            self._create_scoreboard()
+        elif changed & {"score", "turn"}:
+            self._update_scoreboard()
+            
+        if changed & {"teams", "turn", "round"}:
+            self._update_status_bar()
+            
+        if changed & {"round", "game_over"}:
+            self._show_game_board()
+            return
+            
+        for event in events:
+            if event["type"] == "played" and event["round"] == self.game.current_round_name:
+                if not self.board_view.refresh(event["category"], event["value"]):
+                    # The board is not showing (e.g. after Final Jeopardy), so bring it back
+                    self._show_game_board()
+                    return
     
     def _update_status_bar(self):
         """Update the status bar."""
@@ -1249,57 +1531,137 @@ class JeopardyUI:
             self.current_team_label.config(text=f"Current Team: {team['name']}")
     
     def _load_questions(self):
-        """Load questions from an Excel file."""
-        file_path = self.excel_handler.load_file()
-        if not file_path:
+        """Load questions from an Excel file on a background thread.
+        
+        The current board stays usable while the file is parsed; the new questions
+        are swapped in once parsing has finished.
+        """
+        if self.load_worker and self.load_worker.is_alive():
+            messagebox.showinfo("Loading", "Questions are already being loaded.")
             return
             
-        # Parse the file
-        game_data = self.excel_handler.parse_file(file_path)
-        if not game_data:
+        file_path = self.excel_handler.load_file()
+        if not file_path:
             return
             
-        # Set up the game with the loaded data
+        self.load_results = queue.Queue()
+        self.load_cancel = threading.Event()
+        self._show_load_progress(file_path)
         
-        # Jeopardy round
-        jeopardy_data = game_data["rounds"][ROUND_NAMES[0]]
-        self.game.setup_round(
-            ROUND_NAMES[0],
-            jeopardy_data["categories"],
-            jeopardy_data["questions"]
+        self.load_worker = threading.Thread(
+            target=self._load_worker,
+            args=(file_path, self.load_results, self.load_cancel)
         )
+        self.load_worker.daemon = True
+        self.load_worker.start()
+        
+        self.root.after(LOAD_POLL_INTERVAL, self._poll_load)
+    
+    def _load_worker(self, file_path, results, cancel):
+        """Parse a questions file and build its rounds (runs on a worker thread).
+        
+        Args:
+            file_path (str): Path to the Excel file
+            results (Queue): Queue for progress and result messages to the UI thread
+            cancel (Event): Set by the UI thread to cancel the load
+        """
+        def report(stage, done, total):
+            if cancel.is_set():
+                raise LoadCancelled()
+            results.put(("progress", stage, done, total))
+        
+        try:
+            game_data = self.excel_handler.read_game_data(file_path, progress=report)
+            report("Building board", 1, 1)
+            rounds = build_rounds(game_data)
+            results.put(("done", game_data, rounds))
+        except LoadCancelled:
+            results.put(("cancelled",))
+        except ExcelParseError as e:
+            results.put(("error", str(e)))
+        except Exception as e:
+            results.put(("error", f"Error loading questions: {str(e)}"))
+    
+    def _show_load_progress(self, file_path):
+        """Show a progress window for a background load.
         
-        # Double Jeopardy round
-        double_data = game_data["rounds"][ROUND_NAMES[1]]
-        self.game.setup_round(
-            ROUND_NAMES[1],
-            double_data["categories"],
-            double_data["questions"]
+        Args:
+            file_path (str): Path to the file being loaded
+        """
+        self.load_window = tk.Toplevel(self.root)
+        self.load_window.title("Loading Questions")
+        self.load_window.geometry("400x150")
+        self.load_window.transient(self.root)
+        self.load_window.protocol("WM_DELETE_WINDOW", self._cancel_load)
+        
+        load_frame = ttk.Frame(self.load_window, padding="20")
+        load_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.load_label = ttk.Label(
+            load_frame,
+            text=f"Loading {os.path.basename(file_path)}...",
+            font=(TEAM_FONT[0], 12)
         )
+        self.load_label.pack(fill=tk.X)
+        
+        self.load_progress = ttk.Progressbar(load_frame, mode="determinate", maximum=1)
+        self.load_progress.pack(fill=tk.X, pady=10)
         
-        # Final Jeopardy
-        final_data = game_data["rounds"][ROUND_NAMES[2]]
-        self.game.setup_final_jeopardy(
-            final_data["category"],
-            final_data["question"],
-            final_data["answer"]
+        cancel_button = ttk.Button(
+            load_frame,
+            text="Cancel",
+            command=self._cancel_load
         )
+        cancel_button.pack()
+    
+    def _cancel_load(self):
+        """Cancel the background load that is in progress."""
+        self.load_cancel.set()
+        self.load_label.config(text="Cancelling...")
+    
+    def _poll_load(self):
+        """Apply progress and results sent by the load worker."""
+        try:
+            while True:
+                message = self.load_results.get_nowait()
+                kind = message[0]
+                
+                if kind == "progress":
+                    _, stage, done, total = message
+                    self.load_label.config(text=f"{stage}: {done} of {total}")
+                    self.load_progress.config(maximum=max(total, 1), value=done)
+                    continue
+                    
+                self.load_window.destroy()
+                
+                if kind == "done":
+                    self.sounds.use_pack(self.excel_handler.file_path)
+                    self._install_questions(message[1], message[2])
+                elif kind == "error":
+                    messagebox.showerror("Error", message[1])
+                return
+        except queue.Empty:
+            pass
+            
+        self.root.after(LOAD_POLL_INTERVAL, self._poll_load)
+    
+    def _install_questions(self, game_data, rounds):
+        """Swap newly loaded questions into the game.
         
-        # Set Daily Doubles
-        self.game.daily_doubles = game_data["daily_doubles"]
+        Args:
+            game_data (dict): The parsed game data
+            rounds (dict): Round objects built from the game data
+        """
+        self._stop_timer()
+        self.current_question = None
         
-        # Reset the game state
-        self.game.current_round_name = ROUND_NAMES[0]
-        self.game.current_team_index = 0
-        self.game.game_over = False
+        # Installing the rounds also resets scores, wagers and the current round
+        self.game.install_rounds(rounds, game_data["daily_doubles"])
         
-        for team in self.game.teams:
-            team["score"] = 0
-            
         # Update the UI
         self._update_scoreboard()
         self._update_status_bar()
-        self._build_game_board()
+        self._show_game_board()
         
         messagebox.showinfo("Success", "Questions loaded successfully!")
     
@@ -1310,13 +1672,82 @@ class JeopardyUI:
         if file_path:
             messagebox.showinfo("Template Created", f"Template file created at:\n{file_path}")
     
+    def _create_custom_template(self):
+        """Create a template Excel file for a board size chosen by the host."""
+        num_categories = simpledialog.askinteger(
+            "Custom Template", "Categories per round:", initialvalue=6, minvalue=1, maxvalue=50, parent=self.root
+        )
+        if not num_categories:
+            return
+        num_rows = simpledialog.askinteger(
+            "Custom Template", "Questions per category:", initialvalue=5, minvalue=1, maxvalue=50, parent=self.root
+        )
+        if not num_rows:
+            return
+            
+        round_values = tuple(default_values(round_name, num_rows) for round_name in ROUND_NAMES[:2])
+        file_path = self.excel_handler.create_template(num_categories=num_categories, round_values=round_values)
+        if file_path:
+            messagebox.showinfo("Template Created", f"Template file created at:\n{file_path}")
+    
+    def _exit(self):
+        """Quit the application, the same way whether from a menu, a button or the window."""
+        self.on_exit()
+    
     def _new_game(self):
         """Start a new game."""
         if messagebox.askyesno("New Game", "Start a new game? All scores will be reset."):
             self.game.reset_game()
             self._update_scoreboard()
             self._update_status_bar()
-            self._build_game_board()
+            self._show_game_board()
+            
+            # Each game has its own join token, so last game's players must join again
+            if self.buzzer:
+                self.buzzer.new_game()
+                self._show_buzzer_info()
+    
+    def _save_game(self):
+        """Save the game in progress to a file chosen by the host."""
+        os.makedirs(SAVE_DIR, exist_ok=True)
+        file_path = filedialog.asksaveasfilename(
+            title="Save Game",
+            initialdir=SAVE_DIR,
+            defaultextension=SAVE_EXTENSION,
+            filetypes=[("Saved Games", f"*{SAVE_EXTENSION}")]
+        )
+        if not file_path:
+            return
+            
+        try:
+            save_game(self.game, file_path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save the game:\n{e}")
+    
+    def _resume_game(self):
+        """Resume a saved game chosen by the host, in place of the current one."""
+        file_path = filedialog.askopenfilename(
+            title="Resume Game",
+            initialdir=SAVE_DIR,
+            filetypes=[("Saved Games", f"*{SAVE_EXTENSION}")]
+        )
+        if not file_path:
+            return
+            
+        self._stop_timer()
+        self.current_question = None
+        try:
+            load_game(file_path, self.game)
+        except SaveError as e:
+            messagebox.showerror("Error", f"Could not resume the game:\n{e}")
+            return
+            
+        # The saved game may have different teams
+        for widget in self.scoreboard_frame.winfo_children():
+            widget.destroy()
+        self._create_scoreboard()
+        self._update_status_bar()
+        self._show_game_board()
     
     def _manage_teams(self):
         """Open the team management dialog."""
@@ -1343,9 +1774,10 @@ class JeopardyUI:
         teams_list_frame = ttk.Frame(teams_frame)
         teams_list_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Team entries
+        # Team entries, with the ID of the team each row edits (None for new teams)
         team_entries = []
         team_colors = []
+        team_ids = []
         
         for i, team in enumerate(self.game.teams):
             team_frame = ttk.Frame(teams_list_frame)
@@ -1364,6 +1796,7 @@ class JeopardyUI:
             name_entry.insert(0, team["name"])
             name_entry.pack(side=tk.LEFT, padx=5)
             team_entries.append(name_entry)
+            team_ids.append(team["id"])
             
             # Team color picker (simplified)
             color_var = tk.StringVar(value=team["color"])
@@ -1400,7 +1833,8 @@ class JeopardyUI:
                 team_frame,
                 text="✕",
                 width=3,
-                command=lambda frame=team_frame, idx=i: self._remove_team_entry(frame, idx, team_entries, team_colors)
+                command=lambda frame=team_frame, entry=name_entry: self._remove_team_entry(
+                    frame, entry, team_entries, team_colors, team_ids)
             )
             delete_button.pack(side=tk.LEFT, padx=5)
         
@@ -1411,7 +1845,7 @@ class JeopardyUI:
         add_button = ttk.Button(
             add_frame,
             text="Add Team",
-            command=lambda: self._add_team_entry(teams_list_frame, team_entries, team_colors)
+            command=lambda: self._add_team_entry(teams_list_frame, team_entries, team_colors, team_ids)
         )
         add_button.pack(side=tk.LEFT)
         
@@ -1422,7 +1856,7 @@ class JeopardyUI:
         save_button = ttk.Button(
             buttons_frame,
             text="Save",
-            command=lambda: self._save_teams(team_entries, team_colors, teams_window)
+            command=lambda: self._save_teams(team_entries, team_colors, team_ids, teams_window)
         )
         save_button.pack(side=tk.LEFT, padx=10)
         
@@ -1433,13 +1867,14 @@ class JeopardyUI:
         )
         cancel_button.pack(side=tk.LEFT, padx=10)
     
-    def _add_team_entry(self, parent, entries, colors):
+    def _add_team_entry(self, parent, entries, colors, ids):
         """Add a new team entry to the team management dialog.
         
         Args:
             parent (Frame): The parent frame
             entries (list): List of team name entries
             colors (list): List of team color variables
+            ids (list): List of the team IDs the entries edit
         """
         team_frame = ttk.Frame(parent)
         team_frame.pack(fill=tk.X, pady=5)
@@ -1457,6 +1892,7 @@ class JeopardyUI:
         name_entry.insert(0, f"Team {len(entries)+1}")
         name_entry.pack(side=tk.LEFT, padx=5)
         entries.append(name_entry)
+        ids.append(None)  # A new team; the game gives it an ID when saved
         
         # Team color picker (simplified)
         color_var = tk.StringVar(value="#3498db")
@@ -1488,32 +1924,39 @@ class JeopardyUI:
             team_frame,
             text="✕",
             width=3,
-            command=lambda frame=team_frame, idx=len(entries)-1: self._remove_team_entry(frame, idx, entries, colors)
+            command=lambda frame=team_frame, entry=name_entry: self._remove_team_entry(frame, entry, entries, colors, ids)
         )
         delete_button.pack(side=tk.LEFT, padx=5)
     
-    def _remove_team_entry(self, frame, index, entries, colors):
+    def _remove_team_entry(self, frame, entry, entries, colors, ids):
         """Remove a team entry from the team management dialog.
         
         Args:
             frame (Frame): The team frame to remove
-            index (int): The index of the team entry
+            entry (Entry): The team's name entry
             entries (list): List of team name entries
             colors (list): List of team color variables
+            ids (list): List of the team IDs the entries edit
         """
         frame.destroy()
         
-        # Remove from lists
-        if 0 <= index < len(entries):
+        # Remove from lists; rows are found by their entry, as earlier removals shift the indices
+        if entry in entries:
+            index = entries.index(entry)
             entries.pop(index)
             colors.pop(index)
+            ids.pop(index)
     
-    def _save_teams(self, entries, colors, window):
+    def _save_teams(self, entries, colors, ids, window):
         """Save the teams from the team management dialog.
         
+        Rows for existing teams keep the team's ID, so a renamed team is still the same
+        team in the score history and wagers.
+        
         Args:
             entries (list): List of team name entries
             colors (list): List of team color variables
+            ids (list): List of the team IDs the entries edit, None for new teams
             window (Toplevel): The team management window to close
         """
         if not entries:
@@ -1543,11 +1986,14 @@ class JeopardyUI:
             color_name = colors[i].get()
             color_code = color_map.get(color_name, "#3498db")
             
-            new_teams.append({"name": name, "score": 0, "color": color_code})
+            new_teams.append({"id": ids[i], "name": name, "score": 0, "color": color_code})
         
         # Update the game's teams
-        self.game.teams = new_teams
-        self.game.current_team_index = 0
+        try:
+            self.game.set_teams(new_teams)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
         
         # Rebuild the scoreboard
         for widget in self.scoreboard_frame.winfo_children():
@@ -1562,9 +2008,7 @@ class JeopardyUI:
     def _reset_scores(self):
         """Reset all team scores."""
         if messagebox.askyesno("Reset Scores", "Reset all scores to zero?"):
-            for team in self.game.teams:
-                team["score"] = 0
-                
+            self.game.reset_scores()
             self._update_scoreboard()
     
     def _next_round(self):
@@ -1591,7 +2035,7 @@ class JeopardyUI:
         next_round = self.game.next_round()
         if next_round:
             self._update_status_bar()
-            self._build_game_board()
+            self._show_game_board()
     
     def _show_help(self):
         """Show the help information."""
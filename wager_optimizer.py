@@ -0,0 +1,325 @@
+"""
+Jeopardy Game - Wager Optimizer
+-------------------------------
+This module suggests wagers for Final Jeopardy and Daily Doubles, for the host's
+wager screens and for practice opponents.
+
+Final Jeopardy wagers are found by letting every team in turn pick its best reply
+to the others' wagers until no team wants to change, with each team answering
+correctly with a given probability; when that never settles, each team's best
+reply to the others betting safe is used. A team's chance of winning only changes where
+its final score passes another team's, so only those wagers need checking, and it
+is read off the distribution of the best rival score rather than by going through
+every combination of right and wrong answers. Daily
+Double wagers weigh the chance of leading at the end, treating the clues still on
+the board as random swings in the scores.
+
+Results are cached by score tuple, so recomputing after every score change is
+cheap once a position has been seen.
+"""
+
+import bisect
+import itertools
+import math
+from collections import Counter
+from functools import lru_cache
+
+from config import WAGER_ACCURACY, DAILY_DOUBLE_ACCURACY, MIN_DAILY_DOUBLE_WAGER
+
+# Rounds of best replies before giving up on finding wagers no team wants to change
+_MAX_ITERATIONS = 20
+
+
+def final_wager_advice(scores, accuracy=None):
+    """Suggest Final Jeopardy wagers for every team.
+    
+    Args:
+        scores (list): The teams' current scores
+        accuracy (list, optional): Probability that each team answers correctly.
+            Defaults to WAGER_ACCURACY for every team.
+            
+    Returns:
+        list: One dictionary per team of the form
+            {"optimal": int, "safe": int, "win_probability": float}
+            
+    Raises:
+        ValueError: If accuracy does not have one entry per team
+    """
+    if accuracy is None:
+        accuracy = [WAGER_ACCURACY] * len(scores)
+    if len(accuracy) != len(scores):
+        raise ValueError("accuracy must have one entry per team.")
+    return [dict(advice) for advice in _final_wager_advice(tuple(scores), tuple(accuracy))]
+
+
+def daily_double_advice(score, opponent_scores, max_wager, remaining_values=(),
+                        accuracy=DAILY_DOUBLE_ACCURACY):
+    """Suggest a Daily Double wager.
+    
+    Args:
+        score (int): The wagering team's score
+        opponent_scores (list): The other teams' scores
+        max_wager (int): The largest wager allowed
+        remaining_values (list or dict, optional): Values of the clues still to be played
+            after this one, or a dict of form {value: count} such as
+            JeopardyRound.remaining_values returns. Defaults to none.
+        accuracy (float, optional): Probability of answering correctly.
+            Defaults to DAILY_DOUBLE_ACCURACY.
+            
+    Returns:
+        dict: Dictionary of the form {"optimal": int, "safe": int, "win_probability": float}
+    """
+    if not isinstance(remaining_values, dict):
+        remaining_values = Counter(remaining_values)
+    value_counts = tuple(sorted((value, count) for value, count in remaining_values.items() if count > 0))
+    return dict(_daily_double_advice(
+        score, max(opponent_scores, default=0), max_wager, value_counts, accuracy
+    ))
+
+
+def safe_final_wager(scores, team):
+    """Get the safe Final Jeopardy wager for a team.
+    
+    The leader bets just enough to win if right even when second place doubles its
+    score. Every other team bets as much as it can while still finishing ahead of
+    every team below it if wrong.
+    
+    Args:
+        scores (list): The teams' current scores
+        team (int): Position of the team in scores
+        
+    Returns:
+        int: The wager
+    """
+    score = scores[team]
+    if score <= 0:
+        return 0
+    others = [s for i, s in enumerate(scores) if i != team]
+    higher = [s for s in others if s > score]
+    lower = [s for s in others if s <= score]
+    
+    if not higher:
+        second = max(others, default=0)
+        return min(score, max(0, 2 * second - score + 1))
+    return max(0, min(score, score - 2 * max(max(lower, default=0), 0) - 1))
+
+
+@lru_cache(maxsize=4096)
+def _final_wager_advice(scores, accuracy):
+    """Work out Final Jeopardy advice for a score tuple (cached).
+    
+    Args:
+        scores (tuple): The teams' current scores
+        accuracy (tuple): Probability that each team answers correctly
+        
+    Returns:
+        tuple: One tuple of (key, value) pairs per team, so cached results cannot be
+            modified by callers
+    """
+    num_teams = len(scores)
+    
+    # Each team's best reply to everyone else betting safe, improved one team at a
+    # time until no team wants to change. Often no such point exists (a leader who
+    # covers invites the trailer to bet small, and so on), in which case the replies
+    # to safe play are kept.
+    safe = [safe_final_wager(scores, team) for team in range(num_teams)]
+    replies = [_best_final_wager(scores, safe, team, accuracy) for team in range(num_teams)]
+    wagers = list(replies)
+    opponents = wagers  # The wagers each team's reply was chosen against
+    for _ in range(_MAX_ITERATIONS):
+        changed = False
+        for team in range(num_teams):
+            best = _best_final_wager(scores, wagers, team, accuracy)
+            if best != wagers[team]:
+                wagers[team] = best
+                changed = True
+        if not changed:
+            break
+    else:
+        wagers = replies
+        opponents = safe
+        
+    return tuple(
+        (
+            ("optimal", wagers[team]),
+            ("safe", safe[team]),
+            ("win_probability", _final_win_probability(
+                scores[team], wagers[team], accuracy[team],
+                _rival_distribution(scores, opponents, team, accuracy)
+            ))
+        )
+        for team in range(num_teams)
+    )
+
+
+def _best_final_wager(scores, wagers, team, accuracy):
+    """Find a team's best Final Jeopardy wager against the others' wagers.
+    
+    Among wagers with the same win probability the safe wager is preferred, then
+    the smallest.
+    
+    Args:
+        scores (tuple): The teams' current scores
+        wagers (list): Every team's current wager
+        team (int): Position of the team
+        accuracy (tuple): Probability that each team answers correctly
+        
+    Returns:
+        int: The wager
+    """
+    score = scores[team]
+    if score <= 0:
+        return 0
+        
+    # The win probability only changes where the team's final score meets another's
+    candidates = {0, score}
+    for other, other_score in enumerate(scores):
+        if other == team:
+            continue
+        for final in (other_score + wagers[other], other_score - wagers[other]):
+            for wager in (final - score, final - score + 1, score - final, score - final - 1):
+                if 0 <= wager <= score:
+                    candidates.add(wager)
+                    
+    rivals = _rival_distribution(scores, wagers, team, accuracy)
+    safe = safe_final_wager(scores, team)
+    return max(
+        candidates,
+        key=lambda wager: (
+            round(_final_win_probability(score, wager, accuracy[team], rivals), 12), wager == safe, -wager
+        )
+    )
+
+
+def _rival_distribution(scores, wagers, team, accuracy):
+    """Get the distribution of the best score among a team's rivals.
+    
+    The rivals are added one at a time, keeping the probability of every best score
+    and number of rivals tied on it, so the work grows with the number of teams
+    squared rather than with every combination of right and wrong answers. The
+    distribution does not depend on the team's own wager, so it is worked out once
+    for all of its candidate wagers.
+    
+    Args:
+        scores (tuple): The teams' current scores
+        wagers (list): Every team's wager
+        team (int): Position of the team
+        accuracy (tuple): Probability that each team answers correctly
+        
+    Returns:
+        tuple: The sorted best rival scores, the probability that the best rival score
+            is below each of them, a dict of form {best rival score: probability
+            shared out among the teams tied on it}, and the probability of there
+            being no rivals
+    """
+    states = {(None, 0): 1.0}  # Dict of form {(best rival score, rivals on it): probability}
+    for other, other_score in enumerate(scores):
+        if other == team:
+            continue
+        p = accuracy[other]
+        finals = ((other_score + wagers[other], p), (other_score - wagers[other], 1 - p))
+        if wagers[other] == 0:
+            finals = ((other_score, 1.0),)
+            
+        merged = {}
+        for (best, tied), weight in states.items():
+            for final, chance in finals:
+                if chance == 0:
+                    continue
+                if best is None or final > best:
+                    key = (final, 1)
+                elif final == best:
+                    key = (best, tied + 1)
+                else:
+                    key = (best, tied)
+                merged[key] = merged.get(key, 0.0) + weight * chance
+        states = merged
+        
+    alone = states.pop((None, 0), 0.0)
+    by_best = {}
+    shares = {}
+    for (best, tied), weight in states.items():
+        by_best[best] = by_best.get(best, 0.0) + weight
+        shares[best] = shares.get(best, 0.0) + weight / (tied + 1)
+        
+    bests = sorted(by_best)
+    below = list(itertools.accumulate((by_best[best] for best in bests), initial=0.0))
+    return bests, below, shares, alone
+
+
+def _final_win_probability(score, wager, accuracy, rivals):
+    """Get a team's chance of winning Final Jeopardy, splitting ties evenly.
+    
+    Args:
+        score (int): The team's score
+        wager (int): The team's wager
+        accuracy (float): Probability that the team answers correctly
+        rivals (tuple): The team's rival distribution from _rival_distribution
+        
+    Returns:
+        float: The win probability
+    """
+    bests, below, shares, alone = rivals
+    
+    def finish_probability(final):
+        # Ahead of every rival, or tied with the best of them
+        return alone + below[bisect.bisect_left(bests, final)] + shares.get(final, 0.0)
+        
+    return (accuracy * finish_probability(score + wager) +
+            (1 - accuracy) * finish_probability(score - wager))
+
+
+@lru_cache(maxsize=4096)
+def _daily_double_advice(score, leader_score, max_wager, value_counts, accuracy):
+    """Work out Daily Double advice for a position (cached).
+    
+    Args:
+        score (int): The wagering team's score
+        leader_score (int): The best of the other teams' scores
+        max_wager (int): The largest wager allowed
+        value_counts (tuple): Sorted (value, count) pairs of the clues still to be played
+        accuracy (float): Probability of answering correctly
+        
+    Returns:
+        tuple: (key, value) pairs of the advice
+    """
+    low = min(MIN_DAILY_DOUBLE_WAGER, max_wager)
+    lead = score - leader_score
+    
+    # Each remaining clue can move the lead by about its value either way
+    spread = math.sqrt(sum(value * value * count for value, count in value_counts))
+    
+    def win_probability(wager):
+        return (accuracy * _normal_cdf(lead + wager, spread) +
+                (1 - accuracy) * _normal_cdf(lead - wager, spread))
+                
+    # Wagers on a coarse grid, plus those that just take or just keep the lead
+    step = max(1, max_wager // 200)
+    candidates = set(range(low, max_wager + 1, step)) | {low, max_wager}
+    for wager in (-lead, -lead + 1, lead - 1, lead):
+        if low <= wager <= max_wager:
+            candidates.add(wager)
+    optimal = max(sorted(candidates), key=win_probability)
+    
+    # Safe: keep the lead if wrong, or catch the leader if right with the least risk
+    if lead > 0:
+        safe = min(max(lead - 1, low), max_wager)
+    else:
+        safe = min(max(-lead + 1, low), max_wager)
+        
+    return (("optimal", optimal), ("safe", safe), ("win_probability", win_probability(optimal)))
+
+
+def _normal_cdf(x, spread):
+    """Get the chance that a normal swing of the given spread keeps x above zero.
+    
+    Args:
+        x (float): The lead before the swing
+        spread (float): Standard deviation of the swing
+        
+    Returns:
+        float: The probability, with exact ties counted as half
+    """
+    if spread == 0:
+        return 1.0 if x > 0 else 0.5 if x == 0 else 0.0
+    return 0.5 * (1 + math.erf(x / (spread * math.sqrt(2))))
\ No newline at end of file